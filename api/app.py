@@ -4,12 +4,29 @@ from __future__ import annotations
 
 import sqlite3
 
-from flask import Flask, g
+from flask import Flask, g, has_request_context, request
 
+from api.json_provider import create_json_provider
 from config.settings import Settings, get_settings
-from goh.db.connection import get_connection
+from config.tuning import apply_tuning
+from goh.auth.hasher import PasswordHasher, configure_hasher
+from goh.auth.tokens import TokenVerifier, configure_token_verifier
+from goh.cache.backends import create_cache
+from goh.cache.service_cache import configure_cache
+from goh.cache.timeline import TimelineBuffer, configure_timeline_buffer
+from goh.db.audit_sink import AuditSink
+from goh.db.connection import get_readonly_connection
 from goh.db.migrations.runner import run_migrations
+from goh.db.pool import ConnectionPool
+from goh.db.writer import Writer
+from goh.jobs.background import BackgroundQueue, configure_queue
+from goh.jobs.durable import configure_jobs
 from goh.observability.logging import setup_logging
+from goh.realtime.relay import ChangeRelay
+from goh.repositories import audit_repo, user_repo
+from goh.services import auth_service
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 
 def create_app(settings: Settings | None = None) -> Flask:
@@ -18,28 +35,120 @@ def create_app(settings: Settings | None = None) -> Flask:
         settings = get_settings()
 
     setup_logging(is_production=settings.is_production)
+    apply_tuning(settings)
 
     app = Flask(__name__)
     app.config["SETTINGS"] = settings
+    app.json = create_json_provider(app, settings.json_backend)
+
+    # Database lifecycle — per worker process: a pool of read-only connections for
+    # safe (GET/HEAD/OPTIONS) requests; the rest get a read-write connection whose
+    # transactions are serialized through the writer lock.
+    db_path = settings.db_path_resolved
+    writer = Writer(
+        db_path,
+        timeout=settings.db_writer_timeout_seconds,
+        max_idle=settings.db_writer_max_idle,
+    )
+    pool = ConnectionPool(
+        db_path,
+        size=settings.db_pool_size,
+        timeout=settings.db_pool_timeout_seconds,
+        connect=lambda: get_readonly_connection(db_path, check_same_thread=False),
+    )
+    app.extensions["db_writer"] = writer
+    app.extensions["db_pool"] = pool
 
-    # Database lifecycle
     def get_db() -> sqlite3.Connection:
         if "db" not in g:
-            g.db = get_connection(settings.db_path_resolved)
-        return g.db
+            if has_request_context() and request.method in READ_ONLY_METHODS:
+                g.db, g.db_release = pool.acquire(), pool.release
+            else:
+                g.db, g.db_release = writer.checkout(), writer.checkin
+        db: sqlite3.Connection = g.db
+        return db
 
     @app.teardown_appcontext
     def close_db(exception: BaseException | None = None) -> None:
         db = g.pop("db", None)
         if db is not None:
-            db.close()
+            g.pop("db_release")(db)
 
     app.get_db = get_db  # type: ignore[attr-defined]
 
-    # Ensure migrations on startup
+    # Audit entries are batched off the request path unless durable mode is on
+    audit_sink = AuditSink(
+        writer.connection,
+        batch_size=settings.audit_batch_size,
+        flush_interval=settings.audit_flush_interval_seconds,
+        durable=settings.audit_durable,
+    )
+    audit_repo.configure_sink(audit_sink)
+    audit_sink.start()
+    app.extensions["audit_sink"] = audit_sink
+
+    # Deferred follow-up work (e.g. multi-recipient notifications) runs off the request
+    background = BackgroundQueue(writer.connection)
+    configure_queue(background)
+    background.start()
+    app.extensions["background_queue"] = background
+
+    # Durable jobs go to `goh worker run` when deployed, else through the queue above
+    configure_jobs(run_locally=not settings.jobs_external_worker)
+
+    # Verified access tokens are cached so polling clients skip jwt.decode
+    verifier = TokenVerifier(settings.jwt_secret, max_entries=settings.jwt_verify_cache_size)
+    configure_token_verifier(verifier)
+    app.extensions["token_verifier"] = verifier
+
+    # The first public-timeline pages are served from memory
+    timeline = None
+    if settings.timeline_buffer_size:
+        timeline = TimelineBuffer(
+            settings.timeline_buffer_size,
+            refresh_seconds=settings.timeline_buffer_refresh_seconds,
+            reload_seconds=settings.timeline_buffer_reload_seconds,
+            verify=settings.timeline_buffer_verify,
+        )
+    configure_timeline_buffer(timeline)
+    app.extensions["timeline_buffer"] = timeline
+
+    # Read-through cache for hot single-resource reads
+    cache = create_cache(
+        settings.cache_backend, path=settings.cache_path, max_entries=settings.cache_max_entries
+    )
+    configure_cache(cache, ttl=settings.cache_ttl_seconds)
+    app.extensions["cache"] = cache
+
+    # Ensure migrations on startup, then build this worker's @-mention index
     with app.app_context():
         db = get_db()
-        run_migrations(db)
+        # Migrations manage their own commits, so take the write gate around them
+        with writer.hold():
+            run_migrations(db)
+        user_repo.load_completion_index(db)
+        # One calibration shared by all workers, so they agree on the bcrypt cost
+        rounds = settings.bcrypt_rounds
+        if settings.bcrypt_target_ms > 0:
+            rounds = auth_service.calibrated_rounds(
+                db, settings.bcrypt_target_ms, minimum=rounds
+            )
+
+    # bcrypt runs in a bounded process pool; logins past the queue cap get a 503
+    hasher = PasswordHasher(
+        rounds=rounds, workers=settings.bcrypt_workers, max_pending=settings.bcrypt_max_pending
+    )
+    configure_hasher(hasher)
+    app.extensions["password_hasher"] = hasher
+
+    # Notification events from other worker processes reach local streams via the relay
+    relay = ChangeRelay(
+        lambda: get_readonly_connection(db_path, check_same_thread=False),
+        writer.connection,
+        poll_interval=settings.notification_relay_poll_seconds,
+    )
+    relay.start()
+    app.extensions["notification_relay"] = relay
 
     # Register middleware
     from api.middleware.correlation_id import setup_correlation_id
@@ -60,6 +169,7 @@ def create_app(settings: Settings | None = None) -> Flask:
     from api.blueprints.health_bp import health_bp
     from api.blueprints.notifications_bp import notifications_bp
     from api.blueprints.posts_bp import posts_bp
+    from api.blueprints.search_bp import search_bp
     from api.blueprints.session_logs_bp import session_logs_bp
     from api.blueprints.users_bp import users_bp
 
@@ -74,5 +184,6 @@ def create_app(settings: Settings | None = None) -> Flask:
     app.register_blueprint(campaigns_bp)
     app.register_blueprint(session_logs_bp)
     app.register_blueprint(dice_bp)
+    app.register_blueprint(search_bp)
 
     return app
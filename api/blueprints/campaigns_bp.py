@@ -5,6 +5,7 @@ from __future__ import annotations
 from flask import Blueprint, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from api.middleware.http_cache import cache_policy
 from goh.services import campaign_service
 
 campaigns_bp = Blueprint("campaigns", __name__, url_prefix="/api/v1/campaigns")
@@ -27,11 +28,16 @@ def create_campaign():  # type: ignore[no-untyped-def]
 
 
 @campaigns_bp.route("")
+@cache_policy("campaigns", "users", s_maxage=30)
 def list_campaigns():  # type: ignore[no-untyped-def]
+    if "cursor" in request.args:
+        limit = request.args.get("limit", 50, type=int)
+        return jsonify(campaign_service.list_campaigns_page(_db(), limit, request.args["cursor"]))
     return jsonify(campaign_service.list_campaigns(_db()))
 
 
 @campaigns_bp.route("/<int:campaign_id>")
+@cache_policy("campaigns", "users", s_maxage=30)
 def get_campaign(campaign_id: int):  # type: ignore[no-untyped-def]
     return jsonify(campaign_service.get_campaign(_db(), campaign_id))
 
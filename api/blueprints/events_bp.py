@@ -5,6 +5,7 @@ from __future__ import annotations
 from flask import Blueprint, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from api.middleware.http_cache import cache_policy
 from goh.services import event_service
 
 events_bp = Blueprint("events", __name__, url_prefix="/api/v1/events")
@@ -32,16 +33,22 @@ def create_event():  # type: ignore[no-untyped-def]
 
 
 @events_bp.route("")
+@cache_policy("events", "users", s_maxage=30)
 def list_events():  # type: ignore[no-untyped-def]
+    if "cursor" in request.args:
+        limit = request.args.get("limit", 50, type=int)
+        return jsonify(event_service.list_events_page(_db(), limit, request.args["cursor"]))
     return jsonify(event_service.list_events(_db()))
 
 
 @events_bp.route("/upcoming")
+@cache_policy("events", "users", s_maxage=30)
 def upcoming():  # type: ignore[no-untyped-def]
     return jsonify(event_service.list_upcoming_events(_db()))
 
 
 @events_bp.route("/<int:event_id>")
+@cache_policy("events", "users", s_maxage=30)
 def get_event(event_id: int):  # type: ignore[no-untyped-def]
     return jsonify(event_service.get_event(_db(), event_id))
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, current_app, g, jsonify
+from flask import Blueprint, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from api.middleware.http_cache import cache_policy
 from goh.services import follow_service
 
 follows_bp = Blueprint("follows", __name__, url_prefix="/api/v1/follows")
@@ -27,10 +28,22 @@ def unfollow(user_id: int):  # type: ignore[no-untyped-def]
 
 
 @follows_bp.route("/<int:user_id>/followers")
+@cache_policy("follows", "users")
 def followers(user_id: int):  # type: ignore[no-untyped-def]
+    if "cursor" in request.args:
+        limit = request.args.get("limit", 50, type=int)
+        return jsonify(
+            follow_service.get_followers_page(_db(), user_id, limit, request.args["cursor"])
+        )
     return jsonify(follow_service.get_followers(_db(), user_id))
 
 
 @follows_bp.route("/<int:user_id>/following")
+@cache_policy("follows", "users")
 def following(user_id: int):  # type: ignore[no-untyped-def]
+    if "cursor" in request.args:
+        limit = request.args.get("limit", 50, type=int)
+        return jsonify(
+            follow_service.get_following_page(_db(), user_id, limit, request.args["cursor"])
+        )
     return jsonify(follow_service.get_following(_db(), user_id))
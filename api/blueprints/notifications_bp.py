@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, current_app, g, jsonify
+import json
+from collections.abc import Iterator
+
+from flask import Blueprint, Response, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from goh.realtime.bus import bus
 from goh.services import notification_service
 
 notifications_bp = Blueprint("notifications", __name__, url_prefix="/api/v1/notifications")
@@ -17,13 +21,67 @@ def _db():  # type: ignore[no-untyped-def]
 @notifications_bp.route("")
 @require_auth
 def list_notifications():  # type: ignore[no-untyped-def]
+    if "cursor" in request.args:
+        limit = request.args.get("limit", 50, type=int)
+        return jsonify(
+            notification_service.list_notifications_page(
+                _db(), g.user_id, limit, request.args["cursor"]
+            )
+        )
     return jsonify(notification_service.list_notifications(_db(), g.user_id))
 
 
 @notifications_bp.route("/unread-count")
 @require_auth
 def unread_count():  # type: ignore[no-untyped-def]
-    return jsonify({"unread": notification_service.count_unread(_db(), g.user_id)})
+    unread = notification_service.count_unread(_db(), g.user_id)
+    # The count is the whole body, so it doubles as the ETag; unchanged polls get a bare 304
+    etag = f"unread-{unread}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({"unread": unread})
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+@notifications_bp.route("/stream")
+@require_auth
+def stream():  # type: ignore[no-untyped-def]
+    """Server-sent events: ``unread`` counts and new ``notification``s for the caller.
+
+    The database connection is released before streaming starts; the stream
+    ends after ``notification_stream_max_seconds`` and the client reconnects.
+    """
+    settings = current_app.config["SETTINGS"]
+    user_id = g.user_id
+    # Subscribe before reading the count so nothing published in between is lost
+    subscription = bus.subscribe(user_id)
+    try:
+        unread = notification_service.count_unread(_db(), user_id)
+    except BaseException:
+        bus.unsubscribe(user_id, subscription)
+        raise
+
+    def events() -> Iterator[str]:
+        yield _sse("unread", {"unread": unread})
+        for message in bus.listen(
+            user_id, subscription,
+            max_seconds=settings.notification_stream_max_seconds,
+            heartbeat=settings.notification_stream_heartbeat_seconds,
+        ):
+            yield ": keep-alive\n\n" if message is None else _sse(message["event"], message["data"])
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
 @notifications_bp.route("/<int:notification_id>/read", methods=["PUT"])
@@ -5,6 +5,7 @@ from __future__ import annotations
 from flask import Blueprint, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from api.middleware.http_cache import cache_policy
 from goh.services import post_service
 
 posts_bp = Blueprint("posts", __name__, url_prefix="/api/v1/posts")
@@ -26,6 +27,7 @@ def create_post():  # type: ignore[no-untyped-def]
 
 
 @posts_bp.route("/<int:post_id>")
+@cache_policy("posts", "users")
 def get_post(post_id: int):  # type: ignore[no-untyped-def]
     return jsonify(post_service.get_post(_db(), post_id))
 
@@ -41,19 +43,29 @@ def delete_post(post_id: int):  # type: ignore[no-untyped-def]
 @require_auth
 def feed():  # type: ignore[no-untyped-def]
     limit = request.args.get("limit", 50, type=int)
+    if "cursor" in request.args:
+        return jsonify(post_service.get_feed_page(_db(), g.user_id, limit, request.args["cursor"]))
     offset = request.args.get("offset", 0, type=int)
     return jsonify(post_service.get_feed(_db(), g.user_id, limit, offset))
 
 
 @posts_bp.route("/timeline")
+@cache_policy("posts", "users", s_maxage=5)
 def timeline():  # type: ignore[no-untyped-def]
     limit = request.args.get("limit", 50, type=int)
+    if "cursor" in request.args:
+        return jsonify(post_service.get_timeline_page(_db(), limit, request.args["cursor"]))
     offset = request.args.get("offset", 0, type=int)
     return jsonify(post_service.get_timeline(_db(), limit, offset))
 
 
 @posts_bp.route("/by/<int:author_id>")
+@cache_policy("posts", "users")
 def by_author(author_id: int):  # type: ignore[no-untyped-def]
     limit = request.args.get("limit", 50, type=int)
+    if "cursor" in request.args:
+        return jsonify(
+            post_service.list_posts_page(_db(), author_id, limit, request.args["cursor"])
+        )
     offset = request.args.get("offset", 0, type=int)
     return jsonify(post_service.list_posts(_db(), author_id, limit, offset))
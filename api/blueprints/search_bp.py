@@ -0,0 +1,21 @@
+"""Search blueprint."""
+
+from __future__ import annotations
+
+from flask import Blueprint, current_app, jsonify, request
+
+from goh.services import search_service
+
+search_bp = Blueprint("search", __name__, url_prefix="/api/v1/search")
+
+
+def _db():  # type: ignore[no-untyped-def]
+    return current_app.get_db()  # type: ignore[attr-defined]
+
+
+@search_bp.route("")
+def search():  # type: ignore[no-untyped-def]
+    q = request.args.get("q", "")
+    kinds = [k for k in request.args.get("type", "").split(",") if k]
+    limit = request.args.get("limit", 20, type=int)
+    return jsonify(search_service.search(_db(), q, kinds=kinds or None, limit=limit))
@@ -5,6 +5,7 @@ from __future__ import annotations
 from flask import Blueprint, current_app, g, jsonify, request
 
 from api.middleware.auth import require_auth
+from api.middleware.http_cache import cache_policy
 from goh.services import user_service
 
 users_bp = Blueprint("users", __name__, url_prefix="/api/v1/users")
@@ -15,8 +16,11 @@ def _db():  # type: ignore[no-untyped-def]
 
 
 @users_bp.route("")
+@cache_policy("users")
 def list_users():  # type: ignore[no-untyped-def]
     limit = request.args.get("limit", 50, type=int)
+    if "cursor" in request.args:
+        return jsonify(user_service.list_users_page(_db(), limit, request.args["cursor"]))
     offset = request.args.get("offset", 0, type=int)
     return jsonify(user_service.list_users(_db(), limit, offset))
 
@@ -27,7 +31,15 @@ def search():  # type: ignore[no-untyped-def]
     return jsonify(user_service.search_users(_db(), q))
 
 
+@users_bp.route("/complete")
+def complete():  # type: ignore[no-untyped-def]
+    prefix = request.args.get("prefix", "")
+    limit = request.args.get("limit", 10, type=int)
+    return jsonify(user_service.complete_users(_db(), prefix, limit))
+
+
 @users_bp.route("/<int:user_id>")
+@cache_policy("users", "follows", "posts")
 def get_user(user_id: int):  # type: ignore[no-untyped-def]
     return jsonify(user_service.get_profile(_db(), user_id))
 
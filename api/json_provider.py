@@ -0,0 +1,67 @@
+"""JSON provider for API responses — orjson when installed, Flask's stdlib provider otherwise.
+
+``jsonify`` and ``request.get_json`` go through ``app.json``. Flask's default
+provider encodes with the stdlib ``json`` module and sorts keys; on a 50-post
+page that encoding costs several times more than building the dicts.
+``OrjsonProvider`` writes the response body as bytes in one call, keeping
+entity key order. Types orjson does not handle natively are passed to the
+default provider's ``default`` hook, so the two providers encode the same
+values the same way.
+
+orjson is optional (the ``prod`` extra, which the deploy script installs).
+``GOH_JSON_BACKEND`` picks ``orjson``, ``stdlib`` or ``auto`` (orjson when
+importable).
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+JSON_BACKENDS = ("auto", "orjson", "stdlib")
+
+
+class OrjsonProvider(JSONProvider):
+    mimetype = "application/json"
+
+    def __init__(self, app: Flask) -> None:
+        super().__init__(app)
+        # Dates go through the default hook, which formats them as Flask does
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if app.debug:
+            self._options |= orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._options).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=DefaultJSONProvider.default,
+            option=self._options | orjson.OPT_APPEND_NEWLINE,
+        )
+        # Flask types app.response_class as werkzeug's sans-IO base class
+        response_class = cast("type[Response]", self._app.response_class)
+        return response_class(response=body, mimetype=self.mimetype)
+
+
+def create_json_provider(app: Flask, backend: str = "auto") -> JSONProvider:
+    """Build the app's JSON provider from its settings name: ``auto``, ``orjson`` or ``stdlib``."""
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if backend == "orjson" and orjson is None:
+        raise RuntimeError("GOH_JSON_BACKEND=orjson but orjson is not installed")
+    if backend == "stdlib" or orjson is None:
+        return DefaultJSONProvider(app)
+    return OrjsonProvider(app)
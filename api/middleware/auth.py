@@ -7,8 +7,17 @@ from typing import Any
 
 from flask import current_app, g, request
 
+from goh.auth.tokens import TokenVerifier, configure_token_verifier, get_token_verifier
 from goh.domain.exceptions import AuthenticationError
-from goh.services.auth_service import verify_access_token
+
+
+def _verifier() -> TokenVerifier:
+    verifier = get_token_verifier()
+    if verifier is None:
+        # Apps built by create_app install one up front; this covers anything else
+        verifier = TokenVerifier(current_app.config["SETTINGS"].jwt_secret)
+        configure_token_verifier(verifier)
+    return verifier
 
 
 def require_auth(f):  # type: ignore[no-untyped-def]
@@ -19,9 +28,7 @@ def require_auth(f):  # type: ignore[no-untyped-def]
         if not auth_header.startswith("Bearer "):
             raise AuthenticationError("Missing or invalid Authorization header")
 
-        token = auth_header[7:]
-        settings = current_app.config["SETTINGS"]
-        payload = verify_access_token(token, jwt_secret=settings.jwt_secret)
+        payload = _verifier().verify(auth_header[7:])
         g.user_id = payload["sub"]
         g.username = payload["username"]
         g.user_role = payload["role"]
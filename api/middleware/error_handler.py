@@ -21,7 +21,8 @@ def setup_error_handler(app: Flask) -> None:
             status=error.status_code,
             message=error.message,
         )
-        return jsonify(response), error.status_code
+        headers = {"Retry-After": "1"} if error.status_code == 503 else {}
+        return jsonify(response), error.status_code, headers
 
     @app.errorhandler(404)
     def not_found(error):  # type: ignore[no-untyped-def]
@@ -0,0 +1,71 @@
+"""HTTP cache middleware — ETags, conditional GETs and Cache-Control for read routes.
+
+Routes opt in with ``@cache_policy``, naming the resources their response is
+built from. The ETag is derived from those resources' version counters
+(migration 013, bumped by triggers on every relevant write) and the request
+URL, so it is known before the view runs: a matching ``If-None-Match`` gets a
+304 without the query or serialization behind the response.
+
+Versions are per table, not per row, so any write to a resource changes the
+ETag of every route that depends on it. That trades some needless
+revalidation for a validator that costs one indexed read.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from typing import Any
+
+from flask import current_app, make_response, request
+
+from goh.observability.metrics import metrics
+from goh.repositories import counter_repo
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _etag(resources: tuple[str, ...]) -> str:
+    db = current_app.get_db()  # type: ignore[attr-defined]
+    versions = counter_repo.get_all(db, "version", 0)
+    state = ",".join(f"{name}={versions.get(name, 0)}" for name in resources)
+    digest = hashlib.blake2b(f"{request.full_path}|{state}".encode(), digest_size=12)
+    return digest.hexdigest()
+
+
+def cache_policy(  # type: ignore[no-untyped-def]
+    *resources: str, max_age: int = 0, s_maxage: int = 0, public: bool = True
+):
+    """Decorator declaring what a GET route's response depends on and how long it may be cached.
+
+    ``max_age`` is for browsers and defaults to revalidating on every use, so a
+    user sees their own writes at once; ``s_maxage`` lets a shared cache (the
+    nginx ``proxy_cache``) serve the response for that long without asking.
+    ``public=False`` keeps the response out of shared caches.
+    """
+    directives = ["public" if public else "private", f"max-age={max_age}"]
+    if public and s_maxage:
+        directives.append(f"s-maxage={s_maxage}")
+    cache_control = ", ".join(directives)
+
+    def decorator(f):  # type: ignore[no-untyped-def]
+        @functools.wraps(f)
+        def decorated(*args: Any, **kwargs: Any) -> Any:
+            if request.method not in CACHEABLE_METHODS:
+                return f(*args, **kwargs)
+
+            etag = _etag(resources)
+            if request.if_none_match.contains_weak(etag):
+                metrics.increment("http_cache.not_modified")
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = cache_control
+            return response
+
+        return decorated
+
+    return decorator
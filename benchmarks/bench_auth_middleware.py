@@ -0,0 +1,77 @@
+"""Auth middleware overhead per protected request.
+
+Compares the previous ``require_auth`` (settings from ``current_app.config`` and a
+full ``jwt.decode`` every request) with the verified-token cache, for the same
+token repeated as a polling client sends it. Each call runs inside a request
+context, so the numbers include the header lookup and ``g`` writes.
+
+    python -m benchmarks.bench_auth_middleware [iterations]
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import jwt
+from flask import Flask, current_app, g, request
+
+from api.middleware.auth import require_auth
+from benchmarks.common import measure, report
+from config.settings import Settings
+from goh.auth.tokens import TokenVerifier, configure_token_verifier
+from goh.services.auth_service import verify_access_token
+
+SECRET = "bench-jwt-secret-minimum-32-chars!"
+
+
+def _legacy_require_auth(f):  # type: ignore[no-untyped-def]
+    @functools.wraps(f)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        auth_header = request.headers.get("Authorization", "")
+        token = auth_header[7:]
+        settings = current_app.config["SETTINGS"]
+        payload = verify_access_token(token, jwt_secret=settings.jwt_secret)
+        g.user_id = payload["sub"]
+        g.username = payload["username"]
+        g.user_role = payload["role"]
+        return f(*args, **kwargs)
+
+    return decorated
+
+
+def _view() -> int:
+    return g.user_id
+
+
+def main(iterations: int = 50_000) -> None:
+    now = datetime.now(timezone.utc)
+    token = jwt.encode(
+        {"sub": "1", "username": "bench", "role": "player", "iat": now,
+         "exp": now + timedelta(hours=1), "type": "access"},
+        SECRET,
+        algorithm="HS256",
+    )
+    app = Flask(__name__)
+    app.config["SETTINGS"] = Settings(GOH_JWT_SECRET=SECRET)
+    configure_token_verifier(TokenVerifier(SECRET))
+
+    legacy = _legacy_require_auth(_view)
+    cached = require_auth(_view)
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        assert legacy() == cached() == 1
+        report(
+            f"require_auth, same token ({iterations:,} requests)",
+            {
+                "jwt.decode per request (previous)": measure(legacy, iterations),
+                "verified-token cache": measure(cached, iterations),
+            },
+            unit="req/s",
+        )
+    configure_token_verifier(None)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,56 @@
+"""Write throughput: INSERT + re-SELECT vs INSERT ... RETURNING.
+
+    python -m benchmarks.bench_insert_returning [iterations]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+
+from benchmarks.common import measure, report, temp_db
+from goh.db.transaction import transaction
+from goh.domain.entities.post import Post
+from goh.repositories import post_repo, user_repo
+
+_POST_JOIN = """
+    SELECT p.*, u.username as author_username,
+           u.display_name as author_display_name, u.avatar as author_avatar
+    FROM posts p JOIN users u ON p.author_id = u.id
+"""
+
+
+def _create_reselect(db: sqlite3.Connection, author_id: int) -> Post:
+    """The previous create path: INSERT, then SELECT the joined row back."""
+    cursor = db.execute(
+        "INSERT INTO posts (author_id, content, post_type, image_url) VALUES (?, ?, ?, ?)",
+        (author_id, "benchmark post", "text", None),
+    )
+    row = db.execute(f"{_POST_JOIN} WHERE p.id = ?", (cursor.lastrowid,)).fetchone()
+    return Post.from_row(row)
+
+
+def main(iterations: int = 20_000) -> None:
+    results: dict[str, float] = {}
+    with temp_db() as db:
+        author = user_repo.create(
+            db, username="bench", email="bench@test.com",
+            password_hash=None, display_name="Bench",
+        )
+        db.commit()
+
+        def reselect() -> None:
+            with transaction(db):
+                _create_reselect(db, author.id)
+
+        def returning() -> None:
+            with transaction(db):
+                post_repo.create(db, author_id=author.id, content="benchmark post")
+
+        results["insert + reselect"] = measure(reselect, iterations)
+        results["insert ... returning"] = measure(returning, iterations)
+    report(f"post create ({iterations:,} single-row transactions)", results)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
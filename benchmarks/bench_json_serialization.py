@@ -0,0 +1,96 @@
+"""JSON serialization of a 50-item page: entities to a response body.
+
+Times what ``jsonify`` does after the query, for a page of each entity kind:
+the previous path (a ``to_dict`` call per item, Flask's stdlib provider), the
+precompiled ``to_dicts`` with the same provider, and ``to_dicts`` with the
+orjson provider (skipped when orjson is not installed).
+
+    python -m benchmarks.bench_json_serialization [iterations]
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+from api.json_provider import create_json_provider
+from benchmarks.common import measure, report
+from goh.domain.entities.campaign import Campaign
+from goh.domain.entities.character import Character
+from goh.domain.entities.event import Event
+from goh.domain.entities.post import Post
+from goh.domain.entities.user import User
+
+PAGE = 50
+NOW = "2026-01-01 12:00:00"
+
+
+def _pages() -> dict[str, tuple[list, Callable, Callable]]:
+    """Entity kind -> (page, previous per-item serializer, precompiled list serializer)."""
+    posts = [
+        Post(i, i % 7 + 1, "benchmark post " * 8, "text", None, NOW, NOW,
+             f"user{i}", f"User {i}", f"/avatars/{i}.png")
+        for i in range(PAGE)
+    ]
+    users = [
+        User(i, f"user{i}", f"user{i}@bench.local", f"User {i}", "player",
+             None, "Adventurer " * 6, True, NOW, NOW)
+        for i in range(PAGE)
+    ]
+    events = [
+        Event(i, 1, f"One-shot {i}", "A night of dice " * 5, "one_shot", "The Inn",
+              NOW, None, 3, 6, "upcoming", None, NOW, NOW, "dm")
+        for i in range(PAGE)
+    ]
+    campaigns = [
+        Campaign(i, 1, f"Campaign {i}", "A long road " * 6, "active", 6, NOW, NOW, "dm")
+        for i in range(PAGE)
+    ]
+    characters = [
+        Character(i, 1, f"Hero {i}", "Elf", "Wizard", 5, 8, 14, 12, 17, 13, 10, 27, 12,
+                  "Born under a red moon. " * 4, None, None, NOW, NOW)
+        for i in range(PAGE)
+    ]
+    return {
+        "posts": (posts, Post.to_dict, Post.to_dicts),
+        "users": (users, User.to_public_dict, User.to_public_dicts),
+        "events": (events, Event.to_dict, Event.to_dicts),
+        "campaigns": (campaigns, Campaign.to_dict, Campaign.to_dicts),
+        "characters": (characters, Character.to_dict, Character.to_dicts),
+    }
+
+
+def _compare(
+    page: list, one: Callable, many: Callable, stdlib: JSONProvider, fast: JSONProvider | None,
+    iterations: int,
+) -> dict[str, float]:
+    results = {
+        "to_dict per item + stdlib (previous)": measure(
+            lambda: stdlib.response([one(item) for item in page]), iterations
+        ),
+        "to_dicts + stdlib": measure(lambda: stdlib.response(many(page)), iterations),
+    }
+    if fast is not None:
+        results["to_dicts + orjson"] = measure(lambda: fast.response(many(page)), iterations)
+    return results
+
+
+def main(iterations: int = 5_000) -> None:
+    app = Flask(__name__)
+    stdlib = DefaultJSONProvider(app)
+    fast: JSONProvider | None = create_json_provider(app, "auto")
+    if isinstance(fast, DefaultJSONProvider):
+        print("orjson is not installed; install the prod extra to compare it")
+        fast = None
+
+    for kind, (page, one, many) in _pages().items():
+        results = _compare(page, one, many, stdlib, fast, iterations)
+        report(f"{kind}, page of {PAGE}", results, unit="pages/s")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    main(*args)
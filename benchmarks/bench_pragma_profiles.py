@@ -0,0 +1,93 @@
+"""PRAGMA profiles on a synthetic goh workload.
+
+Seeds users and a follow graph, then for each profile in
+``goh.db.connection.PROFILES`` measures, on a fresh file-backed database:
+
+- writes: one post per transaction, fanned out to followers' inboxes, plus a
+  notification (each op is a commit, so ``synchronous`` dominates);
+- reads: home feed, public timeline, follower list and unread count for
+  random users (page cache and ``mmap_size`` matter here).
+
+    python -m benchmarks.bench_pragma_profiles [users] [operations]
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import measure, report
+from goh.db.connection import PROFILES, configure_profile, get_connection, get_profile
+from goh.db.migrations.runner import run_migrations
+from goh.db.transaction import transaction
+from goh.repositories import feed_repo, follow_repo, notification_repo, post_repo
+
+
+def _seed(db: sqlite3.Connection, users: int, follows_per_user: int, rng: random.Random) -> None:
+    db.executemany(
+        "INSERT INTO users (username, email, display_name) VALUES (?, ?, ?)",
+        ((f"user{i}", f"user{i}@bench.local", f"User {i}") for i in range(users)),
+    )
+    pairs = {
+        (follower, rng.randrange(1, users + 1))
+        for follower in range(1, users + 1)
+        for _ in range(follows_per_user)
+    }
+    db.executemany(
+        "INSERT OR IGNORE INTO follows (follower_id, following_id) VALUES (?, ?)",
+        ((a, b) for a, b in pairs if a != b),
+    )
+    db.commit()
+
+
+def _workload(db: sqlite3.Connection, users: int, rng: random.Random) -> dict:
+    def write() -> None:
+        author = rng.randrange(1, users + 1)
+        with transaction(db):
+            post = post_repo.create(db, author_id=author, content="benchmark post " * 8)
+            feed_repo.fan_out(
+                db, post_id=post.id, author_id=author, created_at=post.created_at
+            )
+            notification_repo.create(
+                db, user_id=rng.randrange(1, users + 1), type="mention", title="Mentioned"
+            )
+
+    def read() -> None:
+        user = rng.randrange(1, users + 1)
+        post_repo.feed_json(db, user, 50)
+        post_repo.timeline_json(db, 50)
+        follow_repo.get_followers(db, user, 50)
+        notification_repo.count_unread(db, user)
+
+    return {"writes": write, "reads": read}
+
+
+def main(users: int = 2_000, operations: int = 2_000) -> None:
+    previous = get_profile()
+    writes: dict[str, float] = {}
+    reads: dict[str, float] = {}
+    try:
+        for name, profile in PROFILES.items():
+            configure_profile(profile)
+            with tempfile.TemporaryDirectory() as tmp:
+                db = get_connection(Path(tmp) / "bench.db")
+                run_migrations(db)
+                rng = random.Random(42)
+                _seed(db, users, 20, rng)
+                ops = _workload(db, users, rng)
+                writes[name] = measure(ops["writes"], operations)
+                reads[name] = measure(ops["reads"], operations)
+                db.close()
+    finally:
+        configure_profile(previous)
+
+    report(f"writes: post + fan-out + notification per commit ({users:,} users)", writes)
+    report("reads: feed + timeline + followers + unread count", reads)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,127 @@
+"""Row pipeline: sqlite3 rows to JSON-ready dicts for a 10k-post timeline.
+
+Compares the previous path (uncached dict rows, keyword-built entities, to_dict)
+with slotted positional entities and the raw tuple-to-JSON path.
+
+    python -m benchmarks.bench_row_pipeline [posts]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from benchmarks.common import measure, report, temp_db
+from goh.repositories import post_repo, user_repo
+
+
+def _legacy_dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+
+
+@dataclass
+class _LegacyPost:
+    id: int
+    author_id: int
+    content: str
+    post_type: str = "text"
+    image_url: str | None = None
+    created_at: str = ""
+    updated_at: str = ""
+    author_username: str | None = None
+    author_display_name: str | None = None
+    author_avatar: str | None = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> _LegacyPost:
+        return cls(
+            id=row["id"],
+            author_id=row["author_id"],
+            content=row["content"],
+            post_type=row.get("post_type", "text"),
+            image_url=row.get("image_url"),
+            created_at=row.get("created_at", ""),
+            updated_at=row.get("updated_at", ""),
+            author_username=row.get("author_username"),
+            author_display_name=row.get("author_display_name"),
+            author_avatar=row.get("author_avatar"),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "author_id": self.author_id,
+            "content": self.content,
+            "post_type": self.post_type,
+            "image_url": self.image_url,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "author": {
+                "username": self.author_username,
+                "display_name": self.author_display_name,
+                "avatar": self.author_avatar,
+            },
+        }
+
+
+def _peak_kib(fn) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main(posts: int = 10_000, iterations: int = 20) -> None:
+    with temp_db() as db:
+        author = user_repo.create(
+            db, username="bench", email="bench@test.com",
+            password_hash=None, display_name="Bench",
+        )
+        db.executemany(
+            "INSERT INTO posts (author_id, content) VALUES (?, ?)",
+            ((author.id, f"benchmark post {i}") for i in range(posts)),
+        )
+        db.commit()
+
+        def legacy() -> list[dict]:
+            cursor = db.cursor()
+            cursor.row_factory = _legacy_dict_factory
+            rows = cursor.execute(
+                """SELECT p.*, u.username as author_username,
+                   u.display_name as author_display_name, u.avatar as author_avatar
+                   FROM posts p JOIN users u ON p.author_id = u.id
+                   ORDER BY p.created_at DESC, p.id DESC LIMIT ?""",
+                (posts,),
+            ).fetchall()
+            return [_LegacyPost.from_row(r).to_dict() for r in rows]
+
+        def entities() -> list[dict]:
+            return [p.to_dict() for p in post_repo.timeline(db, posts)]
+
+        def raw_json() -> list[dict]:
+            return post_repo.timeline_json(db, posts)
+
+        assert legacy() == entities() == raw_json()
+        paths = {
+            "dict rows + entity (previous)": legacy,
+            "cached columns + slots entity": entities,
+            "tuple rows -> json": raw_json,
+        }
+        report(
+            f"timeline of {posts:,} posts ({iterations} runs)",
+            {name: measure(fn, iterations) for name, fn in paths.items()},
+            unit="timelines/s",
+        )
+        report(
+            "peak allocation per timeline",
+            {name: _peak_kib(fn) for name, fn in paths.items()},
+            unit="KiB",
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,78 @@
+"""User search: the previous ``LIKE '%q%'`` scan against the FTS5 index.
+
+Seeds users with generated names, then looks up the first few letters of a
+seeded player's first and last name, as the search box sends them while typing. LIKE with a leading wildcard reads every row of
+``users`` until it has a page of matches (all of them when a multi-word query
+matches nothing contiguous); the FTS5 query reads only the matching terms and
+ranks with bm25.
+
+    python -m benchmarks.bench_search [users] [queries]
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import sys
+
+from benchmarks.common import measure, report, temp_db
+from goh.repositories import user_repo
+
+_SYLLABLES = ("ar", "bel", "cor", "dra", "el", "fin", "gal", "hal", "ith", "kor", "lin", "mor",
+              "nor", "or", "ral", "sil", "thar", "ul", "van", "wyn")
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _seed(db: sqlite3.Connection, users: int, rng: random.Random) -> list[str]:
+    """Insert the users and return their display names."""
+    rows = []
+    for i in range(users):
+        first, last = _name(rng), _name(rng)
+        rows.append((f"{first}{i}", f"{first}{i}@bench.local", f"{first.title()} {last.title()}"))
+    db.executemany(
+        "INSERT INTO users (username, email, display_name) VALUES (?, ?, ?)", rows
+    )
+    db.commit()
+    return [row[2] for row in rows]
+
+
+def _like_search(db: sqlite3.Connection, query: str, limit: int = 20) -> list[dict]:
+    pattern = f"%{query}%"
+    return db.execute(
+        """SELECT * FROM users
+           WHERE username LIKE ? OR display_name LIKE ?
+           ORDER BY username LIMIT ?""",
+        (pattern, pattern, limit),
+    ).fetchall()
+
+
+def main(users: int = 100_000, queries: int = 200) -> None:
+    rng = random.Random(42)
+    with temp_db() as db:
+        names = _seed(db, users, rng)
+        # Someone looking for a particular player, a few letters into one or both names
+        firsts = [rng.choice(names).split()[0][: rng.randint(4, 6)] for _ in range(64)]
+        fulls = [
+            " ".join(word[: rng.randint(3, 6)] for word in rng.choice(names).split())
+            for _ in range(64)
+        ]
+        for label, prefixes in (("one word", firsts), ("first and last name", fulls)):
+            report(
+                f"user search, {label}, 20 results ({users:,} users)",
+                {
+                    "LIKE '%q%' scan (previous)": measure(
+                        lambda p=prefixes: _like_search(db, rng.choice(p)), queries
+                    ),
+                    "FTS5 prefix + bm25": measure(
+                        lambda p=prefixes: user_repo.search(db, rng.choice(p)), queries
+                    ),
+                },
+                unit="queries/s",
+            )
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
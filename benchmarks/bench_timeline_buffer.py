@@ -0,0 +1,49 @@
+"""Public timeline first page: the SQL join + sort against the ring buffer.
+
+Seeds users and posts, then serves the first timeline page (50 posts) as a
+logged-out visitor's landing page does, straight from SQLite and from a
+``TimelineBuffer`` (refreshed once a second, as in production), both through
+``post_service.get_timeline``.
+
+    python -m benchmarks.bench_timeline_buffer [posts] [iterations]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+from benchmarks.common import measure, report, temp_db
+from goh.cache.timeline import TimelineBuffer, configure_timeline_buffer
+from goh.services import post_service
+
+
+def main(posts: int = 100_000, iterations: int = 2_000) -> None:
+    rng = random.Random(42)
+    with temp_db() as db:
+        users = max(posts // 50, 1)
+        db.executemany(
+            "INSERT INTO users (username, email, display_name) VALUES (?, ?, ?)",
+            ((f"user{i}", f"user{i}@bench.local", f"User {i}") for i in range(users)),
+        )
+        db.executemany(
+            "INSERT INTO posts (author_id, content) VALUES (?, ?)",
+            ((rng.randrange(1, users + 1), "benchmark post " * 8) for _ in range(posts)),
+        )
+        db.commit()
+
+        sql = measure(lambda: post_service.get_timeline(db, 50), iterations)
+        configure_timeline_buffer(TimelineBuffer(200))
+        try:
+            buffered = measure(lambda: post_service.get_timeline(db, 50), iterations)
+        finally:
+            configure_timeline_buffer(None)
+        report(
+            f"timeline, first page of 50 ({posts:,} posts)",
+            {"join + sort per request (previous)": sql, "ring buffer": buffered},
+            unit="req/s",
+        )
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
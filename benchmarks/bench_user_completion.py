@@ -0,0 +1,86 @@
+"""@-mention autocomplete: SQL lookups against the in-memory completion index.
+
+Seeds users with generated names and a skewed follower graph, then completes
+1-4 letter prefixes as the composer sends them while typing, ranked by
+follower count. Compares the previous ``LIKE '%q%'`` search, the FTS5 search
+and ``user_repo.complete``; also reports how long a worker takes to build the
+index at start.
+
+    python -m benchmarks.bench_user_completion [users] [queries]
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import sys
+import time
+
+from benchmarks.common import measure, report, temp_db
+from goh.repositories import user_repo
+
+_SYLLABLES = ("ar", "bel", "cor", "dra", "el", "fin", "gal", "hal", "ith", "kor", "lin", "mor",
+              "nor", "or", "ral", "sil", "thar", "ul", "van", "wyn")
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _seed(db: sqlite3.Connection, users: int, rng: random.Random) -> None:
+    rows = []
+    for i in range(users):
+        first, last = _name(rng), _name(rng)
+        rows.append((f"{first}{i}", f"{first}{i}@bench.local", f"{first.title()} {last.title()}"))
+    db.executemany("INSERT INTO users (username, email, display_name) VALUES (?, ?, ?)", rows)
+    # A few popular accounts and a long tail, as follower counts usually look
+    db.executemany(
+        """INSERT INTO counters (entity, entity_id, name, value)
+           VALUES ('user', ?, 'followers', ?)""",
+        ((i, int(rng.paretovariate(1.2))) for i in range(1, users + 1)),
+    )
+    db.commit()
+
+
+def _like_complete(db: sqlite3.Connection, prefix: str, limit: int = 10) -> list[dict]:
+    pattern = f"%{prefix}%"
+    return db.execute(
+        """SELECT u.*, COALESCE(c.value, 0) AS followers FROM users u
+           LEFT JOIN counters c
+             ON c.entity = 'user' AND c.entity_id = u.id AND c.name = 'followers'
+           WHERE u.username LIKE ? OR u.display_name LIKE ?
+           ORDER BY followers DESC LIMIT ?""",
+        (pattern, pattern, limit),
+    ).fetchall()
+
+
+def main(users: int = 100_000, queries: int = 200) -> None:
+    rng = random.Random(42)
+    with temp_db() as db:
+        _seed(db, users, rng)
+        start = time.perf_counter()
+        user_repo.load_completion_index(db)
+        print(f"index build: {users:,} users in {(time.perf_counter() - start) * 1000:,.0f} ms")
+
+        prefixes = [_name(rng)[: rng.randint(1, 4)] for _ in range(64)]
+        report(
+            f"@-mention completion, 10 results by followers ({users:,} users)",
+            {
+                "LIKE '%q%' + sort (previous)": measure(
+                    lambda: _like_complete(db, rng.choice(prefixes)), queries
+                ),
+                "FTS5 search (relevance order)": measure(
+                    lambda: user_repo.search(db, rng.choice(prefixes), 10), queries
+                ),
+                "completion index": measure(
+                    lambda: user_repo.complete(db, rng.choice(prefixes), 10), queries * 100
+                ),
+            },
+            unit="queries/s",
+        )
+        user_repo.clear_completion_index()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
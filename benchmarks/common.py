@@ -0,0 +1,41 @@
+"""Shared helpers for the micro-benchmarks."""
+
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from goh.db.connection import get_connection
+from goh.db.migrations.runner import run_migrations
+
+
+@contextmanager
+def temp_db() -> Iterator[sqlite3.Connection]:
+    """A migrated, file-backed (WAL) database in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = get_connection(Path(tmp) / "bench.db")
+        run_migrations(db)
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+def measure(fn: Callable[[], object], iterations: int) -> float:
+    """Run ``fn`` ``iterations`` times and return operations per second."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed else float("inf")
+
+
+def report(title: str, results: dict[str, float], unit: str = "ops/s") -> None:
+    print(title)
+    baseline = next(iter(results.values()))
+    for name, value in results.items():
+        print(f"  {name:<32} {value:>12,.0f} {unit}  ({value / baseline:.2f}x)")
@@ -136,3 +136,16 @@ def refresh(ctx: click.Context, token: str) -> None:
         click.echo(json.dumps(result, indent=2))
     finally:
         db.close()
+
+
+@auth_group.command("prune-sessions")
+@click.option("--batch-size", type=int, default=auth_service.DEFAULT_PRUNE_BATCH_SIZE)
+@click.pass_context
+def prune_sessions(ctx: click.Context, batch_size: int) -> None:
+    """Delete revoked or expired sessions and spent magic links."""
+    db, _ = _get_db(ctx)
+    try:
+        result = auth_service.prune_sessions(db, batch_size=batch_size)
+        click.echo(json.dumps(result))
+    finally:
+        db.close()
@@ -5,8 +5,11 @@ from __future__ import annotations
 import click
 import structlog
 
+from goh.auth.hasher import get_hasher
 from goh.db.connection import get_connection
 from goh.db.migrations.runner import run_migrations
+from goh.db.transaction import transaction
+from goh.repositories import counter_repo
 
 logger = structlog.get_logger(__name__)
 
@@ -62,6 +65,24 @@ def stats(ctx: click.Context) -> None:
         db.close()
 
 
+@db_group.command("recount")
+@click.pass_context
+def recount(ctx: click.Context) -> None:
+    """Recompute denormalized counters and repair any drift."""
+    db_path = ctx.obj["db_path"]
+    db = get_connection(db_path)
+    try:
+        with transaction(db):
+            corrected = counter_repo.recount(db)
+        for counter, count in corrected.items():
+            click.echo(f"  {counter}: {count} corrected")
+        total = sum(corrected.values())
+        logger.info("db.recount", corrected=total)
+        click.echo(f"Recount complete ({total} corrected).")
+    finally:
+        db.close()
+
+
 @db_group.command("seed")
 @click.pass_context
 def seed(ctx: click.Context) -> None:
@@ -75,10 +96,7 @@ def seed(ctx: click.Context) -> None:
             click.echo("Database already has data. Skipping seed.")
             return
 
-        # Import bcrypt here for password hashing
-        import bcrypt
-
-        password_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt()).decode()
+        password_hash = get_hasher().hash("password123")
 
         users = [
             ("dungeonmaster", "dm@goh.local", password_hash, "Dungeon Master", "dm", 1),
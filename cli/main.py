@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import click
 
+from config.settings import get_settings
+from config.tuning import apply_tuning
+from goh.cache.backends import SqliteCache
+from goh.cache.service_cache import configure_cache
 from goh.observability.correlation import new_correlation_id
 from goh.observability.logging import setup_logging
 
@@ -21,6 +25,13 @@ def cli(ctx: click.Context, db: str) -> None:
     cid = new_correlation_id()
     ctx.obj["correlation_id"] = cid
 
+    settings = get_settings()
+    apply_tuning(settings)
+
+    # Writes made from the CLI must still invalidate the workers' shared cache
+    if settings.cache_backend == "sqlite":
+        configure_cache(SqliteCache(settings.cache_path), ttl=settings.cache_ttl_seconds)
+
 
 # Import and register sub-commands
 from cli.auth_commands import auth_group  # noqa: E402
@@ -33,8 +44,10 @@ from cli.follow_commands import follow_group  # noqa: E402
 from cli.health_commands import health_group  # noqa: E402
 from cli.notification_commands import notification_group  # noqa: E402
 from cli.post_commands import post_group  # noqa: E402
+from cli.search_commands import search_group  # noqa: E402
 from cli.session_log_commands import session_log_group  # noqa: E402
 from cli.user_commands import user_group  # noqa: E402
+from cli.worker_commands import worker_group  # noqa: E402
 
 cli.add_command(auth_group, "auth")
 cli.add_command(campaign_group, "campaign")
@@ -46,8 +59,10 @@ cli.add_command(follow_group, "follow")
 cli.add_command(health_group, "health")
 cli.add_command(notification_group, "notification")
 cli.add_command(post_group, "post")
+cli.add_command(search_group, "search")
 cli.add_command(session_log_group, "session-log")
 cli.add_command(user_group, "user")
+cli.add_command(worker_group, "worker")
 
 
 if __name__ == "__main__":
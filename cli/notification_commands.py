@@ -6,6 +6,7 @@ import json
 
 import click
 
+from config.settings import get_settings
 from goh.db.connection import get_connection
 from goh.services import notification_service
 
@@ -53,3 +54,19 @@ def mark_read(ctx: click.Context, notification_id: int, user_id: int) -> None:
         click.echo("Marked as read.")
     finally:
         db.close()
+
+
+@notification_group.command("prune")
+@click.option("--days", type=int, default=None, help="Read TTL in days (default: settings)")
+@click.option("--batch-size", type=int, default=notification_service.DEFAULT_PRUNE_BATCH_SIZE)
+@click.pass_context
+def prune(ctx: click.Context, days: int | None, batch_size: int) -> None:
+    """Delete read notifications older than the retention TTL."""
+    if days is None:
+        days = get_settings().notification_read_ttl_days
+    db = get_connection(ctx.obj["db_path"])
+    try:
+        result = notification_service.prune(db, read_ttl_days=days, batch_size=batch_size)
+        click.echo(json.dumps(result))
+    finally:
+        db.close()
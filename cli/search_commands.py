@@ -0,0 +1,47 @@
+"""CLI commands for full-text search."""
+
+from __future__ import annotations
+
+import json
+
+import click
+
+from goh.db.connection import get_connection
+from goh.services import search_service
+
+
+@click.group("search")
+def search_group() -> None:
+    """Full-text search commands."""
+
+
+@search_group.command("query")
+@click.argument("query")
+@click.option(
+    "--type", "kinds", multiple=True,
+    type=click.Choice(search_service.SEARCH_KINDS), help="Restrict to a kind (repeatable)",
+)
+@click.option("--limit", default=20, help="Max results per kind")
+@click.pass_context
+def query(ctx: click.Context, query: str, kinds: tuple[str, ...], limit: int) -> None:
+    """Search users, posts, events and campaigns."""
+    db = get_connection(ctx.obj["db_path"])
+    try:
+        result = search_service.search(db, query, kinds=list(kinds) or None, limit=limit)
+        click.echo(json.dumps(result, indent=2))
+    finally:
+        db.close()
+
+
+@search_group.command("reindex")
+@click.pass_context
+def reindex(ctx: click.Context) -> None:
+    """Rebuild the full-text indexes from the source tables."""
+    db = get_connection(ctx.obj["db_path"])
+    try:
+        counts = search_service.reindex(db)
+        for table, count in counts.items():
+            click.echo(f"  {table}: {count} rows")
+        click.echo(f"Rebuilt {len(counts)} full-text index(es).")
+    finally:
+        db.close()
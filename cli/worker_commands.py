@@ -0,0 +1,62 @@
+"""CLI commands for the background job worker."""
+
+from __future__ import annotations
+
+import json
+import signal
+from typing import Any
+
+import click
+
+from config.settings import get_settings, install_reload_handler
+from config.tuning import apply_tuning
+from goh.db.connection import get_connection
+from goh.jobs.worker import Worker
+from goh.repositories import job_repo
+
+
+@click.group("worker")
+def worker_group() -> None:
+    """Background job worker commands."""
+
+
+@worker_group.command("run")
+@click.option("--concurrency", type=int, default=None, help="Worker threads (default: settings)")
+@click.option("--once", is_flag=True, help="Run every due job, then exit")
+@click.pass_context
+def run(ctx: click.Context, concurrency: int | None, once: bool) -> None:
+    """Run queued jobs until stopped with SIGTERM or Ctrl-C."""
+    settings = get_settings()
+    db_path = ctx.obj["db_path"]
+    worker = Worker(
+        lambda: get_connection(db_path, check_same_thread=False),
+        concurrency=concurrency or settings.jobs_worker_concurrency,
+        poll_interval=settings.jobs_poll_seconds,
+        lease_seconds=settings.jobs_lease_seconds,
+    )
+    if once:
+        click.echo(f"Ran {worker.run_until_idle()} job(s).")
+        return
+
+    def _shutdown(signum: int, frame: Any) -> None:
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    install_reload_handler(apply_tuning)
+    worker.start()
+    click.echo("Worker running — Ctrl-C to stop.")
+    worker.wait()
+
+
+@worker_group.command("status")
+@click.pass_context
+def status(ctx: click.Context) -> None:
+    """Show queued, running and failed job counts, and recent failures."""
+    db = get_connection(ctx.obj["db_path"])
+    try:
+        counts = job_repo.count_by_status(db)
+        failed = [j.to_dict() for j in job_repo.list_failed(db, limit=10)]
+        click.echo(json.dumps({"counts": counts, "failed": failed}, indent=2))
+    finally:
+        db.close()
@@ -1,12 +1,25 @@
-"""Application settings — single source of truth via Pydantic BaseSettings."""
+"""Application settings — single source of truth via Pydantic BaseSettings.
+
+``get_settings()`` builds the settings once per process; ``reload_settings()``
+(wired to SIGHUP by long-running commands) re-reads ``.env`` and the
+environment. Performance knobs are validated here, so a bad value fails at
+startup rather than deep inside a request.
+"""
 
 from __future__ import annotations
 
+import signal
+import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, Literal
 
+import structlog
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+logger = structlog.get_logger(__name__)
+
 
 class Settings(BaseSettings):
     """GOH application settings loaded from environment variables."""
@@ -20,11 +33,112 @@ class Settings(BaseSettings):
 
     # Database
     db_path: str = Field(default="./goh.db", alias="GOH_DB_PATH")
+    db_pool_size: int = Field(default=4, ge=1, alias="GOH_DB_POOL_SIZE")
+    db_pool_timeout_seconds: float = Field(default=5.0, gt=0, alias="GOH_DB_POOL_TIMEOUT_SECONDS")
+    db_writer_timeout_seconds: float = Field(default=10.0, gt=0, alias="GOH_DB_WRITER_TIMEOUT_SECONDS")
+    db_writer_max_idle: int = Field(default=4, ge=0, alias="GOH_DB_WRITER_MAX_IDLE")
+
+    # SQLite connection tuning: a PRAGMA profile from goh.db.connection.PROFILES
+    # (default | balanced | throughput), with optional per-PRAGMA overrides.
+    # cache_size is per connection; an mmap_size of 0 disables memory-mapped I/O.
+    sqlite_profile: Literal["default", "balanced", "throughput"] = Field(
+        default="balanced", alias="GOH_SQLITE_PROFILE"
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] | None = Field(
+        default=None, alias="GOH_SQLITE_SYNCHRONOUS"
+    )
+    sqlite_cache_size_kib: int | None = Field(
+        default=None, ge=0, alias="GOH_SQLITE_CACHE_SIZE_KIB"
+    )
+    sqlite_mmap_size: int | None = Field(default=None, ge=0, alias="GOH_SQLITE_MMAP_SIZE")
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] | None = Field(
+        default=None, alias="GOH_SQLITE_TEMP_STORE"
+    )
+    sqlite_wal_autocheckpoint: int | None = Field(
+        default=None, ge=0, alias="GOH_SQLITE_WAL_AUTOCHECKPOINT"
+    )
+    sqlite_optimize: bool | None = Field(default=None, alias="GOH_SQLITE_OPTIMIZE")
+
+    # Home feed: authors with this many followers are merged at read time instead of
+    # fanned out; a new follow copies up to the backfill limit of the author's posts
+    feed_fanout_threshold: int = Field(default=5000, ge=1, alias="GOH_FEED_FANOUT_THRESHOLD")
+    feed_backfill_limit: int = Field(default=200, ge=0, alias="GOH_FEED_BACKFILL_LIMIT")
+
+    # Per-process cache of author summaries joined into listings
+    user_summary_cache_ttl_seconds: float = Field(
+        default=60.0, ge=0, alias="GOH_USER_SUMMARY_CACHE_TTL_SECONDS"
+    )
+
+    # Per-process @-mention completion index: how often it picks up users changed
+    # by other workers, and how often it reloads to refresh follower counts
+    user_completion_refresh_seconds: float = Field(
+        default=5.0, ge=0, alias="GOH_USER_COMPLETION_REFRESH_SECONDS"
+    )
+    user_completion_reload_seconds: float = Field(
+        default=600.0, ge=0, alias="GOH_USER_COMPLETION_RELOAD_SECONDS"
+    )
+
+    # Per-process buffer of the newest public-timeline posts (0 disables it). New posts
+    # from other workers are merged every refresh; a reload picks up profile edits.
+    # verify checks each buffered answer against SQL and is meant for tests.
+    timeline_buffer_size: int = Field(default=200, ge=0, le=10_000, alias="GOH_TIMELINE_BUFFER_SIZE")
+    timeline_buffer_refresh_seconds: float = Field(
+        default=1.0, ge=0, alias="GOH_TIMELINE_BUFFER_REFRESH_SECONDS"
+    )
+    timeline_buffer_reload_seconds: float = Field(
+        default=60.0, ge=0, alias="GOH_TIMELINE_BUFFER_RELOAD_SECONDS"
+    )
+    timeline_buffer_verify: bool = Field(default=False, alias="GOH_TIMELINE_BUFFER_VERIFY")
+
+    # Audit log
+    audit_durable: bool = Field(default=False, alias="GOH_AUDIT_DURABLE")
+    audit_batch_size: int = Field(default=200, ge=1, alias="GOH_AUDIT_BATCH_SIZE")
+    audit_flush_interval_seconds: float = Field(
+        default=1.0, gt=0, alias="GOH_AUDIT_FLUSH_INTERVAL_SECONDS"
+    )
+
+    # JSON encoding of API responses (auto uses orjson when it is installed)
+    json_backend: Literal["auto", "orjson", "stdlib"] = Field(default="auto", alias="GOH_JSON_BACKEND")
+
+    # Read cache (backend: none | memory | sqlite; sqlite is shared by all workers)
+    cache_backend: Literal["none", "memory", "sqlite"] = Field(default="none", alias="GOH_CACHE_BACKEND")
+    cache_ttl_seconds: float = Field(default=30.0, ge=0, alias="GOH_CACHE_TTL_SECONDS")
+    cache_max_entries: int = Field(default=10_000, ge=1, alias="GOH_CACHE_MAX_ENTRIES")
+    cache_path: str = Field(default="./goh-cache.db", alias="GOH_CACHE_PATH")
+
+    # Notification stream (SSE)
+    notification_stream_max_seconds: float = Field(
+        default=300.0, gt=0, alias="GOH_NOTIFICATION_STREAM_MAX_SECONDS"
+    )
+    notification_stream_heartbeat_seconds: float = Field(
+        default=15.0, gt=0, alias="GOH_NOTIFICATION_STREAM_HEARTBEAT_SECONDS"
+    )
+    notification_relay_poll_seconds: float = Field(
+        default=0.5, gt=0, alias="GOH_NOTIFICATION_RELAY_POLL_SECONDS"
+    )
+
+    # Notification retention (read notifications older than this are pruned)
+    notification_read_ttl_days: int = Field(default=30, ge=1, alias="GOH_NOTIFICATION_READ_TTL_DAYS")
+
+    # Job queue (set external worker when `goh worker run` is deployed; otherwise each
+    # process runs its own jobs right after they commit)
+    jobs_external_worker: bool = Field(default=False, alias="GOH_JOBS_EXTERNAL_WORKER")
+    jobs_worker_concurrency: int = Field(default=2, ge=1, alias="GOH_JOBS_WORKER_CONCURRENCY")
+    jobs_poll_seconds: float = Field(default=1.0, gt=0, alias="GOH_JOBS_POLL_SECONDS")
+    jobs_lease_seconds: float = Field(default=300.0, gt=0, alias="GOH_JOBS_LEASE_SECONDS")
 
     # JWT
     jwt_secret: str = Field(default="change-me-jwt", alias="GOH_JWT_SECRET")
     jwt_access_expires_minutes: int = Field(default=30, alias="GOH_JWT_ACCESS_EXPIRES_MINUTES")
     jwt_refresh_expires_days: int = Field(default=30, alias="GOH_JWT_REFRESH_EXPIRES_DAYS")
+    jwt_verify_cache_size: int = Field(default=10_000, ge=1, alias="GOH_JWT_VERIFY_CACHE_SIZE")
+
+    # Password hashing (bcrypt runs in a process pool; 0 workers hashes on the request thread).
+    # A target time > 0 raises the cost at startup until one hash takes at least that long.
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, alias="GOH_BCRYPT_ROUNDS")
+    bcrypt_target_ms: float = Field(default=0.0, ge=0, alias="GOH_BCRYPT_TARGET_MS")
+    bcrypt_workers: int = Field(default=2, ge=0, alias="GOH_BCRYPT_WORKERS")
+    bcrypt_max_pending: int = Field(default=32, ge=1, alias="GOH_BCRYPT_MAX_PENDING")
 
     # Magic Link
     magic_link_expires_minutes: int = Field(default=15, alias="GOH_MAGIC_LINK_EXPIRES_MINUTES")
@@ -58,6 +172,43 @@ class Settings(BaseSettings):
         return Path(self.db_path).resolve()
 
 
+_settings: Settings | None = None
+_lock = threading.Lock()
+
+
 def get_settings() -> Settings:
-    """Get application settings (cached singleton pattern via module-level)."""
-    return Settings()
+    """Get the process-wide settings, building them on first use."""
+    if _settings is None:
+        with _lock:
+            if _settings is None:
+                reload_settings()
+    assert _settings is not None
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read ``.env`` and the environment; on a validation error the old settings stay."""
+    global _settings
+    settings = Settings()
+    _settings = settings
+    return settings
+
+
+def install_reload_handler(on_reload: Callable[[Settings], None] | None = None) -> None:
+    """Reload settings on SIGHUP, then call ``on_reload`` with the new settings.
+
+    Signal handlers can only be installed from the main thread, so call this
+    from long-running commands rather than from library code.
+    """
+
+    def _reload(signum: int, frame: Any) -> None:
+        try:
+            settings = reload_settings()
+        except ValueError:
+            logger.exception("settings.reload_failed")
+            return
+        logger.info("settings.reloaded", env=settings.env)
+        if on_reload is not None:
+            on_reload(settings)
+
+    signal.signal(signal.SIGHUP, _reload)
@@ -0,0 +1,41 @@
+"""Push the performance settings into the goh modules that read them.
+
+Shared by the app factory, the CLI and SIGHUP reloads so every entry point
+runs with the same tuning.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from config.settings import Settings
+from goh.db.connection import PROFILES, configure_profile
+from goh.repositories import feed_repo, user_repo
+
+
+def apply_tuning(settings: Settings) -> None:
+    """Apply settings to future connections and to feed, summary-cache and completion behaviour."""
+    overrides: dict[str, Any] = {
+        "synchronous": settings.sqlite_synchronous,
+        "cache_size_kib": settings.sqlite_cache_size_kib,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+        "wal_autocheckpoint": settings.sqlite_wal_autocheckpoint,
+        "optimize": settings.sqlite_optimize,
+    }
+    configure_profile(
+        dataclasses.replace(
+            PROFILES[settings.sqlite_profile],
+            **{name: value for name, value in overrides.items() if value is not None},
+        )
+    )
+    feed_repo.configure_feed(
+        fanout_threshold=settings.feed_fanout_threshold,
+        backfill_limit=settings.feed_backfill_limit,
+    )
+    user_repo.configure_summary_cache(ttl_seconds=settings.user_summary_cache_ttl_seconds)
+    user_repo.configure_completion(
+        refresh_seconds=settings.user_completion_refresh_seconds,
+        reload_seconds=settings.user_completion_reload_seconds,
+    )
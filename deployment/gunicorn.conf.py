@@ -0,0 +1,18 @@
+"""Gunicorn server hooks for the GOH API.
+
+Command-line options in the systemd unit take precedence over settings here;
+this file only carries the worker lifecycle hooks.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Drain deferred work, stop the relay and hasher pool, and flush audit entries."""
+    extensions = getattr(getattr(worker, "wsgi", None), "extensions", {})
+    for name in ("background_queue", "notification_relay", "password_hasher", "audit_sink"):
+        component = extensions.get(name)
+        if component is not None:
+            component.close()
@@ -62,6 +62,7 @@ GOH_JWT_SECRET=CHANGE_ME_generate_with_openssl_rand_hex_32
 GOH_JWT_REFRESH_SECRET=CHANGE_ME_generate_with_openssl_rand_hex_32
 GOH_SERVER_HOST=127.0.0.1
 GOH_SERVER_PORT=5050
+GOH_JOBS_EXTERNAL_WORKER=true
 EOF
     chown "${APP_USER}:${APP_USER}" "${APP_DIR}/.env"
     chmod 600 "${APP_DIR}/.env"
@@ -84,9 +85,16 @@ nginx -t
 
 echo "==> Installing systemd service"
 cp "${APP_DIR}/deployment/systemd/goh-api.service" \
-   /etc/systemd/system/goh-api.service
+   "${APP_DIR}/deployment/systemd/goh-worker.service" \
+   /etc/systemd/system/
+cp "${APP_DIR}/deployment/systemd/goh-notification-prune.service" \
+   "${APP_DIR}/deployment/systemd/goh-notification-prune.timer" \
+   "${APP_DIR}/deployment/systemd/goh-session-prune.service" \
+   "${APP_DIR}/deployment/systemd/goh-session-prune.timer" \
+   /etc/systemd/system/
 systemctl daemon-reload
-systemctl enable goh-api
+systemctl enable goh-api goh-worker
+systemctl enable --now goh-notification-prune.timer goh-session-prune.timer
 
 echo "==> Obtaining SSL certificate (certbot)"
 echo "Starting nginx for ACME challenge..."
@@ -95,7 +103,7 @@ certbot --nginx -d "${DOMAIN}" --non-interactive --agree-tos \
     --email admin@nlibera.com --redirect
 
 echo "==> Starting services"
-systemctl start goh-api
+systemctl start goh-api goh-worker
 systemctl reload nginx
 
 echo ""
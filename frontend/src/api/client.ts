@@ -6,8 +6,11 @@ import type {
   DiceRoll,
   Event,
   Notification,
+  NotificationStreamEvent,
+  Page,
   Post,
   User,
+  UserCompletion,
 } from '../types';
 
 const API_BASE = import.meta.env.VITE_API_URL || '/api/v1';
@@ -157,6 +160,17 @@ export async function getPosts(
   return data;
 }
 
+export async function getPostsPage(
+  authorId: number,
+  limit = 50,
+  cursor = '',
+): Promise<Page<Post>> {
+  const { data } = await api.get(`/posts/by/${authorId}`, {
+    params: { limit, cursor },
+  });
+  return data;
+}
+
 export async function createPost(
   content: string,
   postType = 'text',
@@ -184,6 +198,26 @@ export async function getFeed(limit = 50, offset = 0): Promise<Post[]> {
   return data;
 }
 
+export async function getTimelinePage(
+  limit = 50,
+  cursor = '',
+): Promise<Page<Post>> {
+  const { data } = await api.get('/posts/timeline', {
+    params: { limit, cursor },
+  });
+  return data;
+}
+
+export async function getFeedPage(
+  limit = 50,
+  cursor = '',
+): Promise<Page<Post>> {
+  const { data } = await api.get('/posts/feed', {
+    params: { limit, cursor },
+  });
+  return data;
+}
+
 // ─── Events ──────────────────────────────────────────────────────────────────
 
 export async function getEvents(): Promise<Event[]> {
@@ -298,6 +332,47 @@ export async function getUnreadCount(): Promise<number> {
   return data.unread;
 }
 
+/**
+ * Open the server-sent notification stream and call `onEvent` for each event.
+ * Resolves when the server ends the stream (callers reconnect); rejects on
+ * HTTP errors. Uses fetch rather than EventSource so the bearer token can be sent.
+ */
+export async function streamNotifications(
+  onEvent: (event: NotificationStreamEvent) => void,
+  signal: AbortSignal,
+): Promise<void> {
+  const token = localStorage.getItem('access_token');
+  const response = await fetch(`${API_BASE}/notifications/stream`, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Notification stream failed: ${response.status}`);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let end: number;
+    while ((end = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      let event = '';
+      const data: string[] = [];
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data.push(line.slice(6));
+      }
+      if (event && data.length) {
+        onEvent({ event, data: JSON.parse(data.join('\n')) } as NotificationStreamEvent);
+      }
+    }
+  }
+}
+
 export async function markNotificationRead(
   notificationId: number,
 ): Promise<void> {
@@ -320,6 +395,11 @@ export async function searchUsers(query: string): Promise<User[]> {
   return data;
 }
 
+export async function completeUsers(prefix: string): Promise<UserCompletion[]> {
+  const { data } = await api.get('/users/complete', { params: { prefix } });
+  return data;
+}
+
 export async function followUser(userId: number): Promise<void> {
   await api.post(`/follows/${userId}`);
 }
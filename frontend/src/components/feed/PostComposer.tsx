@@ -1,5 +1,6 @@
-import { useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import * as apiClient from '../../api/client';
+import type { UserCompletion } from '../../types';
 import { PixelButton } from '../common/PixelButton';
 import { PixelCard } from '../common/PixelCard';
 
@@ -7,11 +8,53 @@ interface PostComposerProps {
   onPostCreated: () => void;
 }
 
+// The `@partial` being typed just before the caret, if any
+const MENTION_PATTERN = /(?:^|\s)@(\w{1,30})$/;
+
 export function PostComposer({ onPostCreated }: PostComposerProps) {
   const [content, setContent] = useState('');
   const [postType, setPostType] = useState('text');
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [mention, setMention] = useState<string | null>(null);
+  const [suggestions, setSuggestions] = useState<UserCompletion[]>([]);
+  const textareaRef = useRef<HTMLTextAreaElement>(null);
+
+  useEffect(() => {
+    if (!mention) {
+      setSuggestions([]);
+      return;
+    }
+    let cancelled = false;
+    apiClient
+      .completeUsers(mention)
+      .then((users) => {
+        if (!cancelled) setSuggestions(users);
+      })
+      .catch(() => {
+        if (!cancelled) setSuggestions([]);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [mention]);
+
+  const handleChange = (e: React.ChangeEvent<HTMLTextAreaElement>) => {
+    const value = e.target.value;
+    setContent(value);
+    const beforeCaret = value.slice(0, e.target.selectionStart);
+    setMention(MENTION_PATTERN.exec(beforeCaret)?.[1] ?? null);
+  };
+
+  const insertMention = (username: string) => {
+    const textarea = textareaRef.current;
+    if (!textarea || !mention) return;
+    const caret = textarea.selectionStart;
+    const start = caret - mention.length;
+    setContent(`${content.slice(0, start)}${username} ${content.slice(caret)}`);
+    setMention(null);
+    textarea.focus();
+  };
 
   const handleSubmit = async () => {
     if (!content.trim()) return;
@@ -23,6 +66,7 @@ export function PostComposer({ onPostCreated }: PostComposerProps) {
       await apiClient.createPost(content.trim(), postType);
       setContent('');
       setPostType('text');
+      setMention(null);
       onPostCreated();
     } catch (err) {
       const message =
@@ -37,12 +81,36 @@ export function PostComposer({ onPostCreated }: PostComposerProps) {
     <PixelCard static>
       <h3 style={{ marginBottom: 12 }}>Share Your Tale</h3>
 
-      <textarea
-        value={content}
-        onChange={(e) => setContent(e.target.value)}
-        placeholder="What adventures await, hero?"
-        className="post-composer__textarea pixel-border"
-      />
+      <div className="post-composer__editor">
+        <textarea
+          ref={textareaRef}
+          value={content}
+          onChange={handleChange}
+          onBlur={() => setMention(null)}
+          placeholder="What adventures await, hero?"
+          className="post-composer__textarea pixel-border"
+        />
+
+        {suggestions.length > 0 && (
+          <ul className="post-composer__mentions pixel-border">
+            {suggestions.map((user) => (
+              <li key={user.id}>
+                <button
+                  type="button"
+                  // Keep focus in the textarea so the caret position survives
+                  onMouseDown={(e) => {
+                    e.preventDefault();
+                    insertMention(user.username);
+                  }}
+                >
+                  <span className="text-gold">@{user.username}</span>{' '}
+                  <span className="text-dim">{user.display_name}</span>
+                </button>
+              </li>
+            ))}
+          </ul>
+        )}
+      </div>
 
       <div className="post-composer__footer">
         <div className="post-composer__type">
@@ -17,9 +17,29 @@ export function NotificationBell() {
   }, []);
 
   useEffect(() => {
-    fetchUnread();
-    const interval = setInterval(fetchUnread, 30000);
-    return () => clearInterval(interval);
+    const controller = new AbortController();
+    let retryDelay = 1000;
+
+    async function listen() {
+      while (!controller.signal.aborted) {
+        try {
+          // The server ends each stream after a few minutes; loop to reconnect
+          await apiClient.streamNotifications((event) => {
+            setUnreadCount(event.data.unread);
+            retryDelay = 1000;
+          }, controller.signal);
+        } catch {
+          if (controller.signal.aborted) return;
+          // One regular request refreshes an expired token; then back off
+          await fetchUnread();
+          await new Promise((resolve) => setTimeout(resolve, retryDelay));
+          retryDelay = Math.min(retryDelay * 2, 30000);
+        }
+      }
+    }
+
+    listen();
+    return () => controller.abort();
   }, [fetchUnread]);
 
   return (
@@ -1,6 +1,6 @@
 import { useCallback, useEffect, useState } from 'react';
 import * as apiClient from '../api/client';
-import type { Post } from '../types';
+import type { Page, Post } from '../types';
 
 interface UseFeedOptions {
   mode: 'timeline' | 'feed' | 'user';
@@ -25,31 +25,32 @@ export function useFeed({
   const [posts, setPosts] = useState<Post[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
-  const [offset, setOffset] = useState(0);
+  const [cursor, setCursor] = useState<string | null>(null);
   const [hasMore, setHasMore] = useState(true);
 
   const fetchPosts = useCallback(
-    async (currentOffset: number, append: boolean) => {
+    async (currentCursor: string | null, append: boolean) => {
       setIsLoading(true);
       setError(null);
       try {
-        let result: Post[];
+        // An empty cursor requests the first page in keyset mode
+        const token = currentCursor ?? '';
+        let page: Page<Post>;
         if (mode === 'feed') {
-          result = await apiClient.getFeed(limit, currentOffset);
+          page = await apiClient.getFeedPage(limit, token);
         } else if (mode === 'user' && userId) {
-          result = await apiClient.getPosts(userId, limit, currentOffset);
+          page = await apiClient.getPostsPage(userId, limit, token);
         } else {
-          result = await apiClient.getTimeline(limit, currentOffset);
+          page = await apiClient.getTimelinePage(limit, token);
         }
 
-        if (result.length < limit) {
-          setHasMore(false);
-        }
+        setCursor(page.next_cursor);
+        setHasMore(page.next_cursor !== null);
 
         if (append) {
-          setPosts((prev) => [...prev, ...result]);
+          setPosts((prev) => [...prev, ...page.items]);
         } else {
-          setPosts(result);
+          setPosts(page.items);
         }
       } catch (err) {
         const message =
@@ -63,23 +64,21 @@ export function useFeed({
   );
 
   useEffect(() => {
-    setOffset(0);
+    setCursor(null);
     setHasMore(true);
-    fetchPosts(0, false);
+    fetchPosts(null, false);
   }, [fetchPosts]);
 
   const loadMore = useCallback(() => {
-    if (!isLoading && hasMore) {
-      const newOffset = offset + limit;
-      setOffset(newOffset);
-      fetchPosts(newOffset, true);
+    if (!isLoading && hasMore && cursor) {
+      fetchPosts(cursor, true);
     }
-  }, [isLoading, hasMore, offset, limit, fetchPosts]);
+  }, [isLoading, hasMore, cursor, fetchPosts]);
 
   const refresh = useCallback(() => {
-    setOffset(0);
+    setCursor(null);
     setHasMore(true);
-    fetchPosts(0, false);
+    fetchPosts(null, false);
   }, [fetchPosts]);
 
   return { posts, isLoading, error, hasMore, loadMore, refresh };
@@ -10,6 +10,15 @@ export interface User {
   created_at: string;
   followers_count?: number;
   following_count?: number;
+  posts_count?: number;
+}
+
+export interface UserCompletion {
+  id: number;
+  username: string;
+  display_name: string;
+  avatar: string | null;
+  followers_count: number;
 }
 
 export interface Post {
@@ -122,6 +131,15 @@ export interface Notification {
   created_at: string;
 }
 
+export type NotificationStreamEvent =
+  | { event: 'unread'; data: { unread: number } }
+  | { event: 'notification'; data: { unread: number; notification: Notification } };
+
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 export interface AuthResponse {
   user: User;
   access_token: string;
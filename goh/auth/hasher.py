@@ -0,0 +1,146 @@
+"""Password hashing off the request thread, with a bounded queue and adaptive cost.
+
+bcrypt is deliberately slow (~250ms at cost 12), so hashing on the request
+thread stalls every other request a sync worker could be serving. The hasher
+runs bcrypt in a small process pool instead and caps how many hashes may wait
+for it: past ``max_pending`` a login is refused with ``ServiceUnavailableError``
+(503) rather than queueing behind a burst.
+
+``workers=0`` hashes on the calling thread — the default outside the app (CLI,
+tests). Hashes made at a lower cost than ``rounds`` are reported by
+``needs_rehash`` so logins can upgrade them transparently; never downgrade, so
+workers briefly on different costs cannot rewrite each other's hashes. The
+app calibrates the cost once per target and shares it through the database
+(``auth_service.calibrated_rounds``).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import bcrypt
+import structlog
+
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_ROUNDS = 12
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+DEFAULT_MAX_PENDING = 32
+
+
+def _hashpw(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def _checkpw(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+
+def hash_rounds(password_hash: str) -> int | None:
+    """The cost factor of a ``$2b$12$...`` hash, or ``None`` if it is not bcrypt."""
+    parts = password_hash.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def calibrate_rounds(target_ms: float, *, minimum: int = MIN_ROUNDS) -> int:
+    """The cheapest cost, not below ``minimum``, whose hash takes at least ``target_ms``.
+
+    Each extra round doubles the time, so one timed hash at ``minimum`` is enough.
+    """
+    start = time.monotonic()
+    _hashpw("calibration", minimum)
+    elapsed_ms = (time.monotonic() - start) * 1000
+    rounds = minimum
+    while elapsed_ms < target_ms and rounds < MAX_ROUNDS:
+        rounds += 1
+        elapsed_ms *= 2
+    logger.info("hasher.calibrated", rounds=rounds, target_ms=target_ms)
+    return rounds
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        *,
+        rounds: int = DEFAULT_ROUNDS,
+        workers: int = 0,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self.rounds = rounds
+        self._workers = workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+    def hash(self, password: str) -> str:
+        return str(self._run("hash", _hashpw, password, self.rounds))
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return bool(self._run("verify", _checkpw, password, password_hash))
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        rounds = hash_rounds(password_hash)
+        return rounds is None or rounds < self.rounds
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run(self, operation: str, func, *args):  # type: ignore[no-untyped-def]
+        start = time.monotonic()
+        if not self._workers:
+            result = func(*args)
+        else:
+            with self._lock:
+                if self._pending >= self._max_pending:
+                    metrics.increment("auth.hasher.shed")
+                    raise ServiceUnavailableError("Too many sign-in attempts, try again shortly")
+                self._pending += 1
+                metrics.set_gauge("auth.hasher.pending", self._pending)
+                executor = self._get_executor()
+            try:
+                result = executor.submit(func, *args).result()
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    metrics.set_gauge("auth.hasher.pending", self._pending)
+        metrics.observe(f"auth.hasher.{operation}", (time.monotonic() - start) * 1000)
+        return result
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so each gunicorn worker gets its own pool after fork; spawned
+        # rather than forked because the worker already runs threads
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+
+_hasher = PasswordHasher()
+
+
+def configure_hasher(hasher: PasswordHasher | None) -> None:
+    """Install the process-wide hasher (``None`` restores inline hashing at the default cost)."""
+    global _hasher
+    _hasher = hasher if hasher is not None else PasswordHasher()
+
+
+def get_hasher() -> PasswordHasher:
+    return _hasher
@@ -0,0 +1,72 @@
+"""Verified access-token cache for the auth middleware.
+
+Every protected request carries a JWT, and polling clients (feed, notification
+bell) send the same one thousands of times. ``TokenVerifier`` remembers the
+payload of each token it has verified, keyed by a digest of the token, in a
+bounded LRU; a cached token is only re-checked against its ``exp``. Access
+tokens cannot be revoked before they expire, so a cached payload is exactly
+what a fresh ``jwt.decode`` would return. Failed verifications are not cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from goh.domain.exceptions import TokenExpiredError
+from goh.observability.metrics import metrics
+from goh.services.auth_service import verify_access_token
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class TokenVerifier:
+    """Bounded LRU of verified payloads; returned payloads are shared, do not mutate them."""
+
+    def __init__(self, jwt_secret: str, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._secret = jwt_secret
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> dict:
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                if payload["exp"] <= time.time():
+                    del self._entries[key]
+                    raise TokenExpiredError()
+                self._entries.move_to_end(key)
+                metrics.increment("auth.token_cache.hit")
+                return payload
+
+        metrics.increment("auth.token_cache.miss")
+        payload = verify_access_token(token, jwt_secret=self._secret)
+        with self._lock:
+            self._entries[key] = payload
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_verifier: TokenVerifier | None = None
+
+
+def configure_token_verifier(verifier: TokenVerifier | None) -> None:
+    """Install the process-wide verifier used by ``require_auth``."""
+    global _verifier
+    _verifier = verifier
+
+
+def get_token_verifier() -> TokenVerifier | None:
+    return _verifier
@@ -0,0 +1,180 @@
+"""Cache backends — values are JSON strings keyed by ``namespace:id``.
+
+``NullCache`` stores nothing (the default). ``MemoryCache`` is a per-process
+LRU with a TTL. ``SqliteCache`` keeps entries in a small SQLite file that every
+worker process on the host opens, so an invalidation in one worker is seen by
+all of them.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
+
+
+class Cache(Protocol):
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str, ttl: float) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class NullCache:
+    """Cache that never holds anything; every lookup is a miss."""
+
+    def get(self, key: str) -> str | None:
+        return None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCache:
+    """Per-process LRU with per-entry expiry.
+
+    Invalidations only reach the process that made them; other workers see a
+    stale entry until its TTL runs out.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self.clear()
+
+
+class SqliteCache:
+    """Host-wide cache in a dedicated SQLite file, shared by all worker processes.
+
+    Kept apart from the application database so cache writes never queue
+    behind the application writer. Expired rows are swept every
+    ``purge_every`` sets and whenever the table grows past ``max_entries``.
+    """
+
+    def __init__(
+        self, path: str | Path, *, max_entries: int = 100_000, purge_every: int = 1000
+    ) -> None:
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.purge_every = purge_every
+        self._sets = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=1.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache (
+                   key TEXT PRIMARY KEY,
+                   value TEXT NOT NULL,
+                   expires_at REAL NOT NULL
+               ) WITHOUT ROWID"""
+        )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self._sets += 1
+            if self._sets % self.purge_every == 0:
+                self._purge()
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _purge(self) -> None:
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count > self.max_entries:
+            # Drop the entries closest to expiry
+            self._conn.execute(
+                """DELETE FROM cache WHERE key IN (
+                       SELECT key FROM cache ORDER BY expires_at LIMIT ?
+                   )""",
+                (count - self.max_entries,),
+            )
+
+
+def create_cache(
+    backend: str, *, path: str | Path = "", max_entries: int = 10_000
+) -> Cache:
+    """Build a cache from its settings name: ``none``, ``memory`` or ``sqlite``."""
+    if backend == "none":
+        return NullCache()
+    if backend == "memory":
+        return MemoryCache(max_entries)
+    if backend == "sqlite":
+        return SqliteCache(path, max_entries=max_entries)
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,141 @@
+"""In-memory prefix index for @-mention autocomplete.
+
+``CompletionIndex`` keeps one sorted array of ``(key, user_id)`` pairs, where
+the keys are the casefolded username, display name and each later word of the
+display name, so "Gandalf the Grey" is found by ``gan``, ``the`` and ``grey``.
+A prefix lookup is two bisects; the matches are ranked by follower count.
+
+Short prefixes match thousands of keys, so ranking every match would be a
+scan. Once a prefix matches more than ``scan_limit`` keys, its top entries
+are computed once and memoised until a user under that prefix changes.
+
+The index holds no SQL: ``user_repo`` loads it and keeps it fresh.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+
+MAX_COMPLETIONS = 20
+DEFAULT_SCAN_LIMIT = 256
+
+# Sorts after any character a key can contain
+_HIGH = chr(0x10FFFF)
+
+# (user_id, username, display_name, avatar, followers)
+Row = tuple[int, str, str, str | None, int]
+
+
+def completion_keys(username: str, display_name: str) -> list[str]:
+    words = display_name.casefold().split()
+    keys = {username.casefold(), display_name.casefold().strip(), *words[1:]}
+    keys.discard("")
+    return sorted(keys)
+
+
+class CompletionIndex:
+    def __init__(self, *, scan_limit: int = DEFAULT_SCAN_LIMIT) -> None:
+        self._scan_limit = scan_limit
+        self._keys: list[tuple[str, int]] = []
+        self._users: dict[int, Row] = {}
+        self._top: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        # Set by the loader, used to fetch only what changed since
+        self.max_id = 0
+        self.watermark = ""
+        self.loaded_at = 0.0
+        self.refreshed_at = 0.0
+
+    def load(self, rows: Iterable[Row]) -> None:
+        """Replace the whole index."""
+        users = {row[0]: row for row in rows}
+        keys = sorted(
+            (key, user_id) for user_id, row in users.items()
+            for key in completion_keys(row[1], row[2])
+        )
+        with self._lock:
+            self._users, self._keys, self._top = users, keys, {}
+
+    def upsert(self, row: Row) -> None:
+        """Add or replace one user."""
+        user_id = row[0]
+        with self._lock:
+            old = self._users.get(user_id)
+            if old is not None:
+                self._remove_keys(user_id, completion_keys(old[1], old[2]))
+            self._users[user_id] = row
+            for key in completion_keys(row[1], row[2]):
+                insort(self._keys, (key, user_id))
+                self._forget(key)
+
+    def update(
+        self, user_id: int, *, display_name: str | None = None, avatar: str | None = None
+    ) -> None:
+        """Apply a profile edit to an indexed user; unknown users are left to the next load."""
+        row = self._users.get(user_id)
+        if row is None:
+            return
+        self.upsert((
+            user_id,
+            row[1],
+            row[2] if display_name is None else display_name,
+            row[3] if avatar is None else avatar,
+            row[4],
+        ))
+
+    def complete(self, prefix: str, limit: int = MAX_COMPLETIONS) -> list[dict]:
+        """Users with a key starting with ``prefix``, most followed first."""
+        prefix = prefix.casefold().strip()
+        limit = max(1, min(limit, MAX_COMPLETIONS))
+        if not prefix:
+            return []
+        with self._lock:
+            ids = self._top.get(prefix)
+            if ids is None:
+                lo = bisect_left(self._keys, (prefix,))
+                hi = bisect_left(self._keys, (prefix + _HIGH,), lo)
+                ids = self._rank({user_id for _, user_id in self._keys[lo:hi]})
+                if hi - lo > self._scan_limit:
+                    self._top[prefix] = ids
+            rows = [self._users[user_id] for user_id in ids[:limit]]
+        return [
+            {
+                "id": user_id,
+                "username": username,
+                "display_name": display_name,
+                "avatar": avatar,
+                "followers_count": followers,
+            }
+            for user_id, username, display_name, avatar, followers in rows
+        ]
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users, self._keys, self._top = {}, [], {}
+        self.max_id, self.watermark = 0, ""
+        self.loaded_at = self.refreshed_at = 0.0
+
+    def _rank(self, ids: set[int]) -> list[int]:
+        users = self._users
+        return heapq.nsmallest(
+            MAX_COMPLETIONS, ids, key=lambda i: (-users[i][4], users[i][1].casefold())
+        )
+
+    def _remove_keys(self, user_id: int, keys: list[str]) -> None:
+        for key in keys:
+            i = bisect_left(self._keys, (key, user_id))
+            if i < len(self._keys) and self._keys[i] == (key, user_id):
+                del self._keys[i]
+            self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        """Drop memoised rankings for every prefix of ``key``."""
+        if self._top:
+            for end in range(1, len(key) + 1):
+                self._top.pop(key[:end], None)
@@ -0,0 +1,116 @@
+"""Read-through caching of service results with write-through invalidation.
+
+Read services are decorated with ``@cached("post:{post_id}")`` and the writes
+that change them with ``@invalidates("post:{post_id}")``. Key templates are
+filled from the decorated function's arguments. Invalidation runs once the
+write's transaction commits.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import sqlite3
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import structlog
+
+from goh.cache.backends import Cache, NullCache
+from goh.db.transaction import on_commit
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_TTL_SECONDS = 30.0
+
+_cache: Cache = NullCache()
+_ttl = DEFAULT_TTL_SECONDS
+
+
+def configure_cache(cache: Cache | None, *, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+    """Install the process-wide cache (``None`` turns caching off)."""
+    global _cache, _ttl
+    _cache = cache if cache is not None else NullCache()
+    _ttl = ttl
+
+
+def get_cache() -> Cache:
+    return _cache
+
+
+def invalidate(db: sqlite3.Connection, *keys: str) -> None:
+    """Drop ``keys`` once the current transaction on ``db`` commits."""
+    if keys:
+        on_commit(db, lambda: _delete(keys))
+
+
+def cached(key_template: str) -> Callable[[F], F]:
+    """Cache the (JSON-serialisable) return value under ``key_template``."""
+    namespace = key_template.split(":", 1)[0]
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = key_template.format_map(_arguments(signature, args, kwargs))
+            try:
+                hit = _cache.get(key)
+            except Exception:
+                logger.exception("cache.get_failed", key=key)
+                hit = None
+            if hit is not None:
+                metrics.increment("cache.hit")
+                metrics.increment(f"cache.{namespace}.hit")
+                return json.loads(hit)
+
+            metrics.increment("cache.miss")
+            metrics.increment(f"cache.{namespace}.miss")
+            result = func(*args, **kwargs)
+            try:
+                _cache.set(key, json.dumps(result), _ttl)
+            except Exception:
+                logger.exception("cache.set_failed", key=key)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates(*key_templates: str) -> Callable[[F], F]:
+    """Invalidate ``key_templates`` after the decorated write succeeds."""
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
+            arguments = _arguments(signature, args, kwargs)
+            invalidate(arguments["db"], *(t.format_map(arguments) for t in key_templates))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _arguments(
+    signature: inspect.Signature, args: tuple, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def _delete(keys: tuple[str, ...]) -> None:
+    metrics.increment("cache.invalidate", len(keys))
+    try:
+        _cache.delete(*keys)
+    except Exception:
+        logger.exception("cache.delete_failed", keys=list(keys))
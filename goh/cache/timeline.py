@@ -0,0 +1,145 @@
+"""Per-process ring buffer of the newest public-timeline posts.
+
+The global timeline is the landing page for logged-out visitors, and its first
+pages are the same for everyone. ``TimelineBuffer`` holds the newest
+``capacity`` posts, already in their JSON shape and in timeline order
+(``created_at``, ``id`` descending), so those pages are a list slice.
+
+A request the buffer cannot answer in full — an offset or cursor past its
+oldest post — returns ``None`` and the caller falls back to SQL. ``complete``
+is set when the buffer holds every post, so short timelines never fall back.
+
+The buffer holds no SQL: ``post_service`` loads it, merges new posts from
+other workers (``id > last_seen_id``) and applies local creates and deletes
+on commit, and profile edits through ``update_author``. Returned dicts are
+shared; do not mutate them.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable
+
+DEFAULT_CAPACITY = 200
+
+# (created_at, id): the timeline's sort key
+Key = tuple[str, int]
+
+
+def _key(post: dict) -> Key:
+    return post["created_at"], post["id"]
+
+
+class TimelineBuffer:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        *,
+        refresh_seconds: float = 1.0,
+        reload_seconds: float = 60.0,
+        verify: bool = False,
+    ) -> None:
+        self.capacity = capacity
+        self.refresh_seconds = refresh_seconds
+        self.reload_seconds = reload_seconds
+        # Check every buffered answer against SQL (tests)
+        self.verify = verify
+        self.complete = False
+        # Oldest first, so new posts append
+        self._keys: list[Key] = []
+        self._posts: list[dict] = []
+        self._ids: dict[int, Key] = {}
+        self._lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+        # Set by the loader, used to fetch only what changed since
+        self.last_seen_id = 0
+        self.deletions = 0
+        self.loaded_at = 0.0
+        self.refreshed_at = 0.0
+
+    def load(self, posts: Iterable[dict]) -> None:
+        """Replace the contents with ``posts`` (newest first, at most ``capacity``)."""
+        posts = list(posts)[: self.capacity]
+        with self._lock:
+            self._posts = posts[::-1]
+            self._keys = [_key(p) for p in self._posts]
+            self._ids = {p["id"]: _key(p) for p in self._posts}
+            self.complete = len(posts) < self.capacity
+
+    def merge(self, posts: Iterable[dict]) -> None:
+        """Add ``posts`` (or replace them, by id), dropping the oldest past ``capacity``."""
+        with self._lock:
+            for post in posts:
+                key = _key(post)
+                if not self.complete and self._keys and key < self._keys[0]:
+                    # Older than the oldest buffered post: the buffer does not cover it
+                    continue
+                if post["id"] in self._ids:
+                    self._remove(post["id"])
+                i = bisect_left(self._keys, key)
+                self._keys.insert(i, key)
+                self._posts.insert(i, post)
+                self._ids[post["id"]] = key
+            excess = len(self._posts) - self.capacity
+            if excess > 0:
+                for post in self._posts[:excess]:
+                    del self._ids[post["id"]]
+                del self._keys[:excess], self._posts[:excess]
+                self.complete = False
+
+    def add(self, post: dict) -> None:
+        self.merge([post])
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            self._remove(post_id)
+
+    def update_author(self, author_id: int, author: dict) -> None:
+        """Swap in a copy of each of ``author_id``'s posts carrying the edited ``author``."""
+        with self._lock:
+            self._posts = [
+                {**post, "author": dict(author)} if post["author_id"] == author_id else post
+                for post in self._posts
+            ]
+
+    def window(self, limit: int, offset: int = 0) -> list[dict] | None:
+        """Posts ``offset`` to ``offset + limit`` newest first, or ``None`` if not buffered."""
+        with self._lock:
+            end = len(self._posts) - offset
+            start = end - limit
+            if start < 0 and not self.complete:
+                return None
+            return self._posts[max(start, 0) : max(end, 0)][::-1]
+
+    def after(self, cursor: Key | None, count: int) -> list[dict] | None:
+        """Up to ``count`` posts strictly older than ``cursor``, or ``None`` if not buffered."""
+        with self._lock:
+            end = len(self._keys) if cursor is None else bisect_left(self._keys, cursor)
+            start = end - count
+            if start < 0 and not self.complete:
+                return None
+            return self._posts[max(start, 0) : end][::-1]
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def _remove(self, post_id: int) -> None:
+        key = self._ids.pop(post_id, None)
+        if key is None:
+            return
+        i = bisect_left(self._keys, key)
+        del self._keys[i], self._posts[i]
+
+
+_buffer: TimelineBuffer | None = None
+
+
+def configure_timeline_buffer(buffer: TimelineBuffer | None) -> None:
+    """Install the process-wide buffer (``None`` serves the timeline from SQL only)."""
+    global _buffer
+    _buffer = buffer
+
+
+def get_timeline_buffer() -> TimelineBuffer | None:
+    return _buffer
@@ -0,0 +1,136 @@
+"""Buffered audit log writer.
+
+Audit entries are queued in memory and written by a background thread with a
+single ``executemany`` per batch, keeping audit inserts off the request path.
+A batch is flushed when it reaches ``batch_size`` entries or every
+``flush_interval`` seconds, whichever comes first, and once more on shutdown.
+"""
+
+from __future__ import annotations
+
+import atexit
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import structlog
+
+from goh.db.transaction import transaction
+from goh.observability.metrics import metrics
+from goh.repositories import audit_repo
+from goh.repositories.audit_repo import AuditEntry
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+# Beyond this many pending entries, submitters flush inline (backpressure)
+DEFAULT_MAX_PENDING = 10_000
+
+
+class AuditSink:
+    """Buffers audit entries and flushes them in batches from a daemon thread.
+
+    ``connection`` returns a context manager yielding a writable connection —
+    in the app this is the process's serialized writer. In ``durable`` mode no
+    thread is started and ``audit_repo.log_action`` writes through in the
+    caller's transaction instead.
+    """
+
+    def __init__(
+        self,
+        connection: Callable[[], AbstractContextManager[sqlite3.Connection]],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        durable: bool = False,
+    ) -> None:
+        self._connection = connection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.durable = durable
+        self._pending: list[AuditEntry] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.durable or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, entry: AuditEntry) -> None:
+        with self._lock:
+            self._pending.append(entry)
+            pending = len(self._pending)
+        metrics.set_gauge("audit.pending", pending)
+        if pending >= self.max_pending:
+            self.flush()
+        elif pending >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write all pending entries in one transaction. Returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            start = time.monotonic()
+            try:
+                with self._connection() as db, transaction(db):
+                    audit_repo.insert_many(db, batch)
+            except Exception as e:
+                # Keep the batch for the next attempt, but never grow without bound
+                with self._lock:
+                    self._pending[:0] = batch
+                    overflow = len(self._pending) - 2 * self.max_pending
+                    if overflow > 0:
+                        del self._pending[:overflow]
+                metrics.increment("audit.flush_failed")
+                if overflow > 0:
+                    metrics.increment("audit.dropped", overflow)
+                logger.error("audit.flush_failed", entries=len(batch), error=str(e))
+                return 0
+
+            metrics.observe("audit.flush", (time.monotonic() - start) * 1000)
+            metrics.increment("audit.written", len(batch))
+            metrics.set_gauge("audit.pending", self.pending)
+            return len(batch)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Stop the background thread and flush whatever is left."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("audit.final_flush_failed")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break  # close() does the final flush
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("audit.flush_crashed")
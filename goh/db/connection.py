@@ -3,26 +3,171 @@
 from __future__ import annotations
 
 import sqlite3
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# (cursor.description, column names) of the last result set seen. sqlite3 builds
+# description once per statement, so an identity check is enough to reuse the names
+# for every row of a result set.
+_columns_cache: tuple[object, tuple[str, ...]] = (None, ())
+
 
 def dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
     """Row factory that returns dicts instead of tuples."""
-    columns = [col[0] for col in cursor.description]
+    global _columns_cache
+    description = cursor.description
+    cached_description, columns = _columns_cache
+    if description is not cached_description:
+        columns = tuple(col[0] for col in description)
+        _columns_cache = (description, columns)
     return dict(zip(columns, row, strict=True))
 
 
-def get_connection(db_path: str | Path) -> sqlite3.Connection:
+@dataclass(frozen=True, slots=True)
+class PragmaProfile:
+    """Performance PRAGMAs applied to every new connection.
+
+    ``cache_size_kib`` is per connection; an ``mmap_size`` of 0 disables
+    memory-mapped reads. ``synchronous=NORMAL`` is durable against application
+    crashes under WAL and only risks the last commits on power loss.
+    """
+
+    name: str
+    synchronous: str = "FULL"
+    cache_size_kib: int = 2000
+    mmap_size: int = 0
+    temp_store: str = "DEFAULT"
+    wal_autocheckpoint: int = 1000
+    optimize: bool = False
+
+    def statements(self) -> tuple[str, ...]:
+        return (
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size=-{int(self.cache_size_kib)}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA wal_autocheckpoint={int(self.wal_autocheckpoint)}",
+        )
+
+
+PROFILES: dict[str, PragmaProfile] = {
+    # SQLite's compiled-in defaults
+    "default": PragmaProfile("default"),
+    "balanced": PragmaProfile(
+        "balanced",
+        synchronous="NORMAL",
+        cache_size_kib=16_384,
+        mmap_size=128 * 1024 * 1024,
+        temp_store="MEMORY",
+        optimize=True,
+    ),
+    "throughput": PragmaProfile(
+        "throughput",
+        synchronous="NORMAL",
+        cache_size_kib=65_536,
+        mmap_size=1024 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint=4000,
+        optimize=True,
+    ),
+}
+
+# Long-lived writable connections re-run PRAGMA optimize at most this often
+OPTIMIZE_INTERVAL_SECONDS = 3600.0
+
+_profile = PROFILES["default"]
+
+
+def configure_profile(profile: PragmaProfile) -> None:
+    """Use ``profile`` for connections opened from now on."""
+    global _profile
+    _profile = profile
+
+
+def get_profile() -> PragmaProfile:
+    return _profile
+
+
+class Connection(sqlite3.Connection):
+    """Writable connection that runs ``PRAGMA optimize`` before it closes, if its profile asks.
+
+    SQLite recommends optimizing on close for short-lived connections (the
+    CLI, workers) and every few hours for long-lived ones (``maybe_optimize``).
+    """
+
+    optimize_on_close = False
+    optimized_at = 0.0
+
+    def close(self) -> None:
+        if self.optimize_on_close:
+            optimize(self)
+        super().close()
+
+
+def optimize(conn: sqlite3.Connection) -> None:
+    """Let SQLite refresh the statistics the query planner needs (cheap when nothing changed)."""
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        logger.warning("db.optimize_failed")
+        return
+    if isinstance(conn, Connection):
+        conn.optimized_at = time.monotonic()
+
+
+def maybe_optimize(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` on a long-lived connection once per interval."""
+    if (
+        isinstance(conn, Connection)
+        and conn.optimize_on_close
+        and time.monotonic() - conn.optimized_at >= OPTIMIZE_INTERVAL_SECONDS
+    ):
+        optimize(conn)
+
+
+def _apply_profile(conn: sqlite3.Connection) -> None:
+    for pragma in _profile.statements():
+        conn.execute(pragma)
+
+
+def get_connection(db_path: str | Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
     """Create a configured SQLite connection.
 
-    Enables WAL mode, foreign keys, and dict row factory.
+    Enables WAL mode, foreign keys, dict row factory and the configured
+    ``PragmaProfile``. Pooled connections pass ``check_same_thread=False``
+    since they may be handed to different threads.
     """
     db_path = str(db_path)
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread, factory=Connection)
     conn.row_factory = dict_factory  # type: ignore[assignment]
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA busy_timeout=5000")
+    _apply_profile(conn)
+    conn.optimize_on_close = _profile.optimize
+    conn.optimized_at = time.monotonic()
+    return conn
+
+
+def get_readonly_connection(db_path: str | Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Create a read-only SQLite connection for query-only work.
+
+    Opened with ``mode=ro`` and ``PRAGMA query_only`` so it can never take the
+    write lock. The journal mode is left alone — WAL is a property of the file
+    and is already set by the writer.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+    conn.row_factory = dict_factory  # type: ignore[assignment]
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA busy_timeout=5000")
+    _apply_profile(conn)
     return conn
 
 
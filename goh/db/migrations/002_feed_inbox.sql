@@ -0,0 +1,29 @@
+-- 002_feed_inbox.sql
+-- Materialized home feed: one row per (reader, post), filled at write time
+
+-- Feed inbox (fan-out-on-write)
+CREATE TABLE IF NOT EXISTS feed_items (
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    author_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (user_id, post_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_feed_items_user_created ON feed_items(user_id, created_at DESC, post_id DESC);
+CREATE INDEX IF NOT EXISTS idx_feed_items_user_author ON feed_items(user_id, author_id);
+CREATE INDEX IF NOT EXISTS idx_feed_items_post_id ON feed_items(post_id);
+
+-- Authors whose posts are merged into feeds at read time instead of fanned out
+CREATE TABLE IF NOT EXISTS feed_merged_authors (
+    author_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- Backfill inboxes from existing follows and own posts
+INSERT OR IGNORE INTO feed_items (user_id, post_id, author_id, created_at)
+SELECT f.follower_id, p.id, p.author_id, p.created_at
+FROM posts p JOIN follows f ON f.following_id = p.author_id;
+
+INSERT OR IGNORE INTO feed_items (user_id, post_id, author_id, created_at)
+SELECT p.author_id, p.id, p.author_id, p.created_at
+FROM posts p;
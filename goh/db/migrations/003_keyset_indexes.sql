@@ -0,0 +1,28 @@
+-- 003_keyset_indexes.sql
+-- Composite indexes for keyset pagination: every page is a bounded seek on (key, id)
+
+-- Posts
+CREATE INDEX IF NOT EXISTS idx_posts_author_created ON posts(author_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_created_id ON posts(created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_posts_author_id;
+DROP INDEX IF EXISTS idx_posts_created_at;
+
+-- Events
+CREATE INDEX IF NOT EXISTS idx_events_start_id ON events(start_time DESC, id DESC);
+DROP INDEX IF EXISTS idx_events_start_time;
+
+-- Campaigns
+CREATE INDEX IF NOT EXISTS idx_campaigns_created_id ON campaigns(created_at DESC, id DESC);
+
+-- Users
+CREATE INDEX IF NOT EXISTS idx_users_created_id ON users(created_at DESC, id DESC);
+
+-- Follows (both directions)
+CREATE INDEX IF NOT EXISTS idx_follows_following_created ON follows(following_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_follows_follower_created ON follows(follower_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_follows_following_id;
+DROP INDEX IF EXISTS idx_follows_follower_id;
+
+-- Notifications
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications(user_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_notifications_user_id;
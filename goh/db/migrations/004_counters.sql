@@ -0,0 +1,104 @@
+-- 004_counters.sql
+-- Denormalized counters kept in step by triggers; `goh db recount` repairs drift
+
+CREATE TABLE IF NOT EXISTS counters (
+    entity TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity, entity_id, name)
+) WITHOUT ROWID;
+
+-- Follows: user followers / following
+CREATE TRIGGER IF NOT EXISTS trg_follows_count_insert AFTER INSERT ON follows
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('user', NEW.following_id, 'followers', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('user', NEW.follower_id, 'following', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_follows_count_delete AFTER DELETE ON follows
+BEGIN
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'user' AND entity_id = OLD.following_id AND name = 'followers';
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'user' AND entity_id = OLD.follower_id AND name = 'following';
+END;
+
+-- Posts: user posts
+CREATE TRIGGER IF NOT EXISTS trg_posts_count_insert AFTER INSERT ON posts
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('user', NEW.author_id, 'posts', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_count_delete AFTER DELETE ON posts
+BEGIN
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'user' AND entity_id = OLD.author_id AND name = 'posts';
+END;
+
+-- RSVPs: event going (status can change through the RSVP upsert)
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_count_insert AFTER INSERT ON rsvps
+WHEN NEW.status = 'going'
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('event', NEW.event_id, 'going', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_count_update AFTER UPDATE OF status ON rsvps
+WHEN (OLD.status = 'going') <> (NEW.status = 'going')
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value)
+        VALUES ('event', NEW.event_id, 'going', CASE WHEN NEW.status = 'going' THEN 1 ELSE -1 END)
+        ON CONFLICT DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_count_delete AFTER DELETE ON rsvps
+WHEN OLD.status = 'going'
+BEGIN
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'event' AND entity_id = OLD.event_id AND name = 'going';
+END;
+
+-- Campaign members
+CREATE TRIGGER IF NOT EXISTS trg_campaign_members_count_insert AFTER INSERT ON campaign_members
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('campaign', NEW.campaign_id, 'members', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaign_members_count_delete AFTER DELETE ON campaign_members
+BEGIN
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'campaign' AND entity_id = OLD.campaign_id AND name = 'members';
+END;
+
+-- Drop the counters of deleted subjects
+CREATE TRIGGER IF NOT EXISTS trg_users_counters_delete AFTER DELETE ON users
+BEGIN
+    DELETE FROM counters WHERE entity = 'user' AND entity_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_counters_delete AFTER DELETE ON events
+BEGIN
+    DELETE FROM counters WHERE entity = 'event' AND entity_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_counters_delete AFTER DELETE ON campaigns
+BEGIN
+    DELETE FROM counters WHERE entity = 'campaign' AND entity_id = OLD.id;
+END;
+
+-- Backfill from existing rows
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'user', following_id, 'followers', COUNT(*) FROM follows GROUP BY following_id;
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'user', follower_id, 'following', COUNT(*) FROM follows GROUP BY follower_id;
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'user', author_id, 'posts', COUNT(*) FROM posts GROUP BY author_id;
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'event', event_id, 'going', COUNT(*) FROM rsvps WHERE status = 'going' GROUP BY event_id;
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'campaign', campaign_id, 'members', COUNT(*) FROM campaign_members GROUP BY campaign_id;
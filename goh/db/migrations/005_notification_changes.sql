@@ -0,0 +1,11 @@
+-- 005_notification_changes.sql
+-- Short-lived log of notification events, tailed by every worker to fan out streams
+
+CREATE TABLE IF NOT EXISTS notification_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    origin INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notification_changes_created ON notification_changes(created_at);
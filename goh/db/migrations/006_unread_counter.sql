@@ -0,0 +1,14 @@
+-- 006_unread_counter.sql
+-- Per-user unread notification counter. notification_repo maintains it on create and
+-- mark-read; the trigger covers deletes of unread rows (cascades, pruning).
+
+CREATE TRIGGER IF NOT EXISTS trg_notifications_unread_delete AFTER DELETE ON notifications
+WHEN OLD.is_read = 0
+BEGIN
+    UPDATE counters SET value = value - 1
+        WHERE entity = 'user' AND entity_id = OLD.user_id AND name = 'unread_notifications';
+END;
+
+INSERT OR REPLACE INTO counters (entity, entity_id, name, value)
+    SELECT 'user', user_id, 'unread_notifications', COUNT(*)
+    FROM notifications WHERE is_read = 0 GROUP BY user_id;
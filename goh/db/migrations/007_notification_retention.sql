@@ -0,0 +1,16 @@
+-- 007_notification_retention.sql
+-- Coalesced notifications ("X, Y and 3 others followed you") and read-notification retention.
+-- Listing already seeks on idx_notifications_user_created (user_id, created_at DESC, id DESC).
+
+ALTER TABLE notifications ADD COLUMN group_key TEXT;
+ALTER TABLE notifications ADD COLUMN actor_count INTEGER NOT NULL DEFAULT 1;
+-- JSON list of the most recent actor names shown in the title
+ALTER TABLE notifications ADD COLUMN actors TEXT;
+
+-- The unread notification a new one in the same group is folded into
+CREATE INDEX IF NOT EXISTS idx_notifications_group
+    ON notifications(user_id, group_key) WHERE group_key IS NOT NULL AND is_read = 0;
+
+-- Retention sweep: read notifications by age
+CREATE INDEX IF NOT EXISTS idx_notifications_read_created
+    ON notifications(created_at) WHERE is_read = 1;
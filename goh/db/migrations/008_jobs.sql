@@ -0,0 +1,30 @@
+-- 008_jobs.sql
+-- Durable job queue for follow-up work, drained by `goh worker run`.
+-- Finished jobs are deleted; failed ones stay for inspection.
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL DEFAULT '{}',
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'failed')),
+    idempotency_key TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_after REAL NOT NULL,
+    locked_until REAL,
+    last_error TEXT,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- An idempotency key dedupes against pending work only
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_idempotency
+    ON jobs(idempotency_key) WHERE idempotency_key IS NOT NULL AND status != 'failed';
+
+-- Next due job: highest priority first, then oldest
+CREATE INDEX IF NOT EXISTS idx_jobs_ready
+    ON jobs(priority DESC, run_after, id) WHERE status = 'queued';
+
+-- Jobs whose worker died mid-run
+CREATE INDEX IF NOT EXISTS idx_jobs_lease
+    ON jobs(locked_until) WHERE status = 'running';
@@ -0,0 +1,13 @@
+-- 009_session_expiry.sql
+-- Expiry indexes for refresh-token lookup and for `goh auth prune-sessions`.
+
+CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
+CREATE INDEX IF NOT EXISTS idx_magic_links_expires_at ON magic_links(expires_at);
+
+-- Spent rows the prune deletes regardless of expiry
+CREATE INDEX IF NOT EXISTS idx_sessions_revoked ON sessions(id) WHERE revoked = 1;
+CREATE INDEX IF NOT EXISTS idx_magic_links_used ON magic_links(id) WHERE used = 1;
+
+-- The UNIQUE constraints already index the tokens; these were duplicates
+DROP INDEX IF EXISTS idx_sessions_refresh_token;
+DROP INDEX IF EXISTS idx_magic_links_token;
@@ -0,0 +1,98 @@
+-- 010_search.sql
+-- FTS5 full-text indexes for /api/v1/search. External-content tables: the text
+-- lives only in the source tables, the triggers keep the indexes in step, and
+-- `goh search reindex` rebuilds them from scratch. prefix='2 3' indexes short
+-- prefixes so "gan"* is a term lookup rather than a scan of the term list.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+    username, display_name,
+    content='users', content_rowid='id', tokenize='unicode61', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+    INSERT INTO users_fts(rowid, username, display_name)
+    VALUES (new.id, new.username, new.display_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+    INSERT INTO users_fts(users_fts, rowid, username, display_name)
+    VALUES ('delete', old.id, old.username, old.display_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS users_fts_update
+AFTER UPDATE OF username, display_name ON users BEGIN
+    INSERT INTO users_fts(users_fts, rowid, username, display_name)
+    VALUES ('delete', old.id, old.username, old.display_name);
+    INSERT INTO users_fts(rowid, username, display_name)
+    VALUES (new.id, new.username, new.display_name);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    content,
+    content='posts', content_rowid='id', tokenize='unicode61', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts(rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF content ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO posts_fts(rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    title, description, location,
+    content='events', content_rowid='id', tokenize='unicode61', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts(rowid, title, description, location)
+    VALUES (new.id, new.title, new.description, new.location);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, title, description, location)
+    VALUES ('delete', old.id, old.title, old.description, old.location);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_fts_update
+AFTER UPDATE OF title, description, location ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, title, description, location)
+    VALUES ('delete', old.id, old.title, old.description, old.location);
+    INSERT INTO events_fts(rowid, title, description, location)
+    VALUES (new.id, new.title, new.description, new.location);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS campaigns_fts USING fts5(
+    name, description,
+    content='campaigns', content_rowid='id', tokenize='unicode61', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS campaigns_fts_insert AFTER INSERT ON campaigns BEGIN
+    INSERT INTO campaigns_fts(rowid, name, description)
+    VALUES (new.id, new.name, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS campaigns_fts_delete AFTER DELETE ON campaigns BEGIN
+    INSERT INTO campaigns_fts(campaigns_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS campaigns_fts_update
+AFTER UPDATE OF name, description ON campaigns BEGIN
+    INSERT INTO campaigns_fts(campaigns_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+    INSERT INTO campaigns_fts(rowid, name, description)
+    VALUES (new.id, new.name, new.description);
+END;
+
+-- Index the rows that existed before this migration
+INSERT INTO users_fts(users_fts) VALUES ('rebuild');
+INSERT INTO posts_fts(posts_fts) VALUES ('rebuild');
+INSERT INTO events_fts(events_fts) VALUES ('rebuild');
+INSERT INTO campaigns_fts(campaigns_fts) VALUES ('rebuild');
@@ -0,0 +1,5 @@
+-- 011_users_updated_at.sql
+-- Lets each worker's @-mention completion index fetch only the users changed
+-- since its last refresh.
+
+CREATE INDEX IF NOT EXISTS idx_users_updated_at ON users(updated_at);
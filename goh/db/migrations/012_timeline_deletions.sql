@@ -0,0 +1,9 @@
+-- 012_timeline_deletions.sql
+-- Counts post deletions so each worker's timeline buffer can tell, with one
+-- primary-key lookup, whether a post it holds was deleted by another worker.
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_deleted_count AFTER DELETE ON posts
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('timeline', 0, 'deleted', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
@@ -0,0 +1,132 @@
+-- 013_resource_versions.sql
+-- A version counter per public resource, bumped by every write that changes
+-- what its read endpoints return. api.middleware.http_cache builds ETags from
+-- them, so a conditional GET costs one primary-key range read instead of the
+-- query and serialization behind the response.
+
+-- posts
+CREATE TRIGGER IF NOT EXISTS trg_posts_version_insert AFTER INSERT ON posts
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'posts', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_version_update AFTER UPDATE ON posts
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'posts', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_version_delete AFTER DELETE ON posts
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'posts', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- users: only the columns the public user shape carries
+CREATE TRIGGER IF NOT EXISTS trg_users_version_insert AFTER INSERT ON users
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'users', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_version_update AFTER UPDATE OF username, display_name, avatar, bio, role ON users
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'users', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_version_delete AFTER DELETE ON users
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'users', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- follows: follower lists and profile follower counts
+CREATE TRIGGER IF NOT EXISTS trg_follows_version_insert AFTER INSERT ON follows
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'follows', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_follows_version_delete AFTER DELETE ON follows
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'follows', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- events
+CREATE TRIGGER IF NOT EXISTS trg_events_version_insert AFTER INSERT ON events
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_version_update AFTER UPDATE ON events
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_version_delete AFTER DELETE ON events
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- rsvps are part of the event detail
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_version_insert AFTER INSERT ON rsvps
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_version_update AFTER UPDATE ON rsvps
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rsvps_version_delete AFTER DELETE ON rsvps
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'events', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- campaigns
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_version_insert AFTER INSERT ON campaigns
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_version_update AFTER UPDATE ON campaigns
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_version_delete AFTER DELETE ON campaigns
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+-- members are part of the campaign detail
+CREATE TRIGGER IF NOT EXISTS trg_campaign_members_version_insert AFTER INSERT ON campaign_members
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaign_members_version_update AFTER UPDATE ON campaign_members
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaign_members_version_delete AFTER DELETE ON campaign_members
+BEGIN
+    INSERT INTO counters (entity, entity_id, name, value) VALUES ('version', 0, 'campaigns', 1)
+        ON CONFLICT DO UPDATE SET value = value + 1;
+END;
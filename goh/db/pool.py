@@ -0,0 +1,192 @@
+"""Per-process SQLite connection pool.
+
+Connections are opened lazily up to ``size`` and kept for the life of the
+process, so PRAGMA setup happens once per connection and SQLite's page cache
+and statement cache survive between requests.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+import structlog
+
+from goh.db.connection import get_connection
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_TIMEOUT_SECONDS = 5.0
+
+
+class ConnectionPool:
+    """Thread-safe, bounded pool of configured SQLite connections.
+
+    Idle connections are reused most-recently-returned first, which keeps the
+    warmest page cache in use. Each checkout runs a cheap health check and
+    replaces connections that fail it.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        connect: Callable[[], sqlite3.Connection] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.db_path = str(db_path)
+        self.size = size
+        self.timeout = timeout
+        self._connect = connect or (
+            lambda: get_connection(self.db_path, check_same_thread=False)
+        )
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+        metrics.set_gauge("db.pool.size", size)
+
+    # --- checkout / return ---
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a healthy connection, waiting up to ``timeout`` seconds."""
+        if self._closed:
+            raise ServiceUnavailableError("Database connection pool is closed")
+
+        start = time.monotonic()
+        conn = self._checkout()
+        metrics.observe("db.pool.wait", (time.monotonic() - start) * 1000)
+
+        if not self._is_healthy(conn):
+            logger.warning("db.pool.unhealthy_connection", db_path=self.db_path)
+            metrics.increment("db.pool.replaced")
+            self._discard(conn)
+            conn = self._open()
+
+        with self._lock:
+            self._in_use += 1
+            self._publish_utilisation()
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, rolling back any open transaction."""
+        with self._lock:
+            self._in_use -= 1
+            self._publish_utilisation()
+
+        if self._closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            logger.warning("db.pool.unhealthy_connection", db_path=self.db_path)
+            metrics.increment("db.pool.replaced")
+            self._discard(conn)
+            # Threads waiting on the idle queue cannot see the freed slot, so fill it
+            try:
+                conn = self._open()
+            except sqlite3.Error:
+                logger.exception("db.pool.replace_failed", db_path=self.db_path)
+                return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager form of acquire/release."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections; in-use ones are closed as they come back."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    # --- stats ---
+
+    @property
+    def in_use(self) -> int:
+        with self._lock:
+            return self._in_use
+
+    @property
+    def created(self) -> int:
+        with self._lock:
+            return self._created
+
+    # --- internals ---
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._created < self.size
+            if can_open:
+                self._created += 1
+        if can_open:
+            try:
+                return self._connect()
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            metrics.increment("db.pool.timeout")
+            logger.error("db.pool.exhausted", size=self.size, timeout=self.timeout)
+            raise ServiceUnavailableError("Database connection pool exhausted") from None
+
+    def _open(self) -> sqlite3.Connection:
+        with self._lock:
+            self._created += 1
+        try:
+            return self._connect()
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._created -= 1
+        with suppress(sqlite3.Error):
+            conn.close()
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _publish_utilisation(self) -> None:
+        # Caller holds self._lock
+        metrics.set_gauge("db.pool.in_use", self._in_use)
+        metrics.set_gauge("db.pool.utilisation", round(self._in_use / self.size, 3))
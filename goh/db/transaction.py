@@ -0,0 +1,87 @@
+"""Unit of work — one transaction, and one commit, per service operation."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Per-connection state, keyed by id() — sqlite3.Connection is not weak-referenceable
+_depth: dict[int, int] = {}
+_after_commit: dict[int, list[Callable[[], None]]] = {}
+# Connections whose transactions must be held under a lock (the app writer's)
+_gates: dict[int, Callable[[], AbstractContextManager[object]]] = {}
+
+
+def set_write_gate(
+    db: sqlite3.Connection, gate: Callable[[], AbstractContextManager[object]] | None
+) -> None:
+    """Hold ``gate()`` around every outermost transaction on ``db`` (``None`` removes it)."""
+    if gate is None:
+        _gates.pop(id(db), None)
+    else:
+        _gates[id(db)] = gate
+
+
+@contextmanager
+def transaction(db: sqlite3.Connection, *, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed block in a single transaction.
+
+    The outermost block begins the transaction (``BEGIN IMMEDIATE`` by default,
+    so the write lock is taken up front rather than on the first write), commits
+    on success and rolls back on any exception. Nested blocks join the outer
+    transaction and never commit on their own. If ``db`` has a write gate, the
+    outermost block holds it from ``BEGIN`` to commit or rollback; after-commit
+    callbacks run once it is released.
+
+    Repositories do not commit; services wrap their mutations in this.
+    """
+    key = id(db)
+    depth = _depth.get(key, 0)
+    _depth[key] = depth + 1
+    if depth:
+        try:
+            yield db
+        finally:
+            _depth[key] = depth
+        return
+
+    gate = _gates.get(key)
+    callbacks: list[Callable[[], None]] = []
+    _after_commit[key] = callbacks
+    try:
+        with gate() if gate is not None else nullcontext():
+            if not db.in_transaction:
+                db.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield db
+            except BaseException:
+                db.rollback()
+                raise
+            db.commit()
+    finally:
+        del _depth[key]
+        del _after_commit[key]
+
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception("transaction.after_commit_failed")
+
+
+def on_commit(db: sqlite3.Connection, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the current transaction on ``db`` commits.
+
+    Callbacks are dropped if the transaction rolls back. Outside a transaction
+    the callback runs immediately.
+    """
+    callbacks = _after_commit.get(id(db))
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
@@ -0,0 +1,186 @@
+"""Serialized writer — the one connection per process that is allowed to write.
+
+SQLite admits a single writer at a time. Funnelling every mutation in the
+process through one connection guarded by a lock turns lock contention into a
+short, measured queue in Python instead of ``busy_timeout`` stalls and
+``database is locked`` errors inside SQLite.
+
+Requests do not hold the lock for their whole duration: each checks out its
+own read-write connection, and only that connection's transactions take the
+lock (see ``transaction``'s write gate). Reads, password hashing and
+after-commit hooks in a write request run without blocking other writers.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+import structlog
+
+from goh.db.connection import get_connection, maybe_optimize
+from goh.db.transaction import set_write_gate
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_WRITER_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_IDLE = 4
+
+
+class Writer:
+    """Single write connection behind a lock.
+
+    ``acquire`` blocks until the connection is free (up to ``timeout``) and
+    records the wait in ``db.writer.lock_wait``; ``release`` rolls back anything
+    left uncommitted and hands the lock to the next waiter. The lock is
+    reentrant: a thread that already holds the writer (e.g. an after-commit
+    hook running inside a transaction) gets the same connection back.
+
+    ``checkout``/``checkin`` hand out request connections whose transactions
+    take the same lock, so they serialize with each other and with ``acquire``.
+    Up to ``max_idle`` of them are kept for reuse; the rest of a burst is closed.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        timeout: float = DEFAULT_WRITER_TIMEOUT_SECONDS,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        connect: Callable[[], sqlite3.Connection] | None = None,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._connect = connect or (
+            lambda: get_connection(self.db_path, check_same_thread=False)
+        )
+        self._lock = threading.RLock()
+        self._holds = 0
+        self._conn_holds = 0
+        self._conn: sqlite3.Connection | None = None
+        self._idle: list[sqlite3.Connection] = []
+        self._idle_lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take the write lock and return the writer connection."""
+        self._take()
+        try:
+            if self._conn is None:
+                self._conn = self._connect()
+        except BaseException:
+            self._give()
+            raise
+        self._conn_holds += 1
+        return self._conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Roll back any open transaction and release the write lock.
+
+        Only the outermost release of a reentrant hold resets the connection.
+        """
+        self._conn_holds -= 1
+        if self._conn_holds:
+            self._give()
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            maybe_optimize(conn)
+        except sqlite3.Error:
+            logger.warning("db.writer.reset_connection")
+            self._reset()
+        finally:
+            self._give()
+
+    @property
+    def busy(self) -> bool:
+        """Whether any thread holds the write lock."""
+        return self._holds > 0
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Hold the write lock without using the writer connection."""
+        self._take()
+        try:
+            yield
+        finally:
+            self._give()
+
+    def checkout(self) -> sqlite3.Connection:
+        """A read-write connection for one request; its transactions hold the write lock."""
+        with self._idle_lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect()
+            set_write_gate(conn, self.hold)
+        return conn
+
+    def checkin(self, conn: sqlite3.Connection) -> None:
+        """Roll back anything left open and keep ``conn`` for the next request, if there is room."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            maybe_optimize(conn)
+        except sqlite3.Error:
+            logger.warning("db.writer.discard_connection")
+            self._close(conn)
+            return
+        with self._idle_lock:
+            keep = len(self._idle) < self.max_idle
+            if keep:
+                self._idle.append(conn)
+        if not keep:
+            self._close(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            self._reset()
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close(conn)
+
+    def _take(self) -> None:
+        start = time.monotonic()
+        acquired = self._lock.acquire(timeout=self.timeout)
+        wait_ms = (time.monotonic() - start) * 1000
+        metrics.observe("db.writer.lock_wait", wait_ms)
+        if not acquired:
+            metrics.increment("db.writer.timeout")
+            logger.error("db.writer.lock_timeout", timeout=self.timeout)
+            raise ServiceUnavailableError("Database writer is busy")
+        self._holds += 1
+        metrics.set_gauge("db.writer.busy", 1)
+
+    def _give(self) -> None:
+        self._holds -= 1
+        if not self._holds:
+            metrics.set_gauge("db.writer.busy", 0)
+        self._lock.release()
+
+    @staticmethod
+    def _close(conn: sqlite3.Connection) -> None:
+        set_write_gate(conn, None)
+        with suppress(sqlite3.Error):
+            conn.close()
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            with suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
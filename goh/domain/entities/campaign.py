@@ -4,8 +4,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from goh.domain.serializers import compile_serializer
 
-@dataclass(frozen=True)
+_JSON = compile_serializer("Campaign", {
+    "id": "id",
+    "dm_id": "dm_id",
+    "dm_username": "dm_username",
+    "name": "name",
+    "description": "description",
+    "status": "status",
+    "max_players": "max_players",
+    "created_at": "created_at",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class Campaign:
     id: int
     dm_id: int
@@ -20,31 +33,22 @@ class Campaign:
     @staticmethod
     def from_row(row: dict) -> Campaign:
         return Campaign(
-            id=row["id"],
-            dm_id=row["dm_id"],
-            name=row["name"],
-            description=row.get("description", ""),
-            status=row.get("status", "active"),
-            max_players=row.get("max_players", 6),
-            created_at=row.get("created_at", ""),
-            updated_at=row.get("updated_at", ""),
-            dm_username=row.get("dm_username", ""),
+            row["id"],
+            row["dm_id"],
+            row["name"],
+            row.get("description", ""),
+            row.get("status", "active"),
+            row.get("max_players", 6),
+            row.get("created_at", ""),
+            row.get("updated_at", ""),
+            row.get("dm_username", ""),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "dm_id": self.dm_id,
-            "dm_username": self.dm_username,
-            "name": self.name,
-            "description": self.description,
-            "status": self.status,
-            "max_players": self.max_players,
-            "created_at": self.created_at,
-        }
+    to_dict = _JSON.one
+    to_dicts = staticmethod(_JSON.many)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionLog:
     id: int
     campaign_id: int
@@ -59,15 +63,15 @@ class SessionLog:
     @staticmethod
     def from_row(row: dict) -> SessionLog:
         return SessionLog(
-            id=row["id"],
-            campaign_id=row["campaign_id"],
-            author_id=row["author_id"],
-            session_number=row.get("session_number", 0),
-            title=row["title"],
-            summary=row.get("summary", ""),
-            session_date=row.get("session_date", ""),
-            created_at=row.get("created_at", ""),
-            author_username=row.get("author_username", ""),
+            row["id"],
+            row["campaign_id"],
+            row["author_id"],
+            row.get("session_number", 0),
+            row["title"],
+            row.get("summary", ""),
+            row.get("session_date", ""),
+            row.get("created_at", ""),
+            row.get("author_username", ""),
         )
 
     def to_dict(self) -> dict:
@@ -4,8 +4,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from goh.domain.serializers import compile_serializer
 
-@dataclass(frozen=True)
+_JSON = compile_serializer("Character", {
+    "id": "id",
+    "owner_id": "owner_id",
+    "name": "name",
+    "race": "race",
+    "class": "char_class",
+    "level": "level",
+    "ability_scores": {
+        "strength": "strength",
+        "dexterity": "dexterity",
+        "constitution": "constitution",
+        "intelligence": "intelligence",
+        "wisdom": "wisdom",
+        "charisma": "charisma",
+    },
+    "hit_points": "hit_points",
+    "armor_class": "armor_class",
+    "backstory": "backstory",
+    "portrait": "portrait",
+    "campaign_id": "campaign_id",
+    "created_at": "created_at",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class Character:
     id: int
     owner_id: int
@@ -30,47 +55,26 @@ class Character:
     @staticmethod
     def from_row(row: dict) -> Character:
         return Character(
-            id=row["id"],
-            owner_id=row["owner_id"],
-            name=row["name"],
-            race=row.get("race", "Human"),
-            char_class=row.get("class", "Fighter"),
-            level=row.get("level", 1),
-            strength=row.get("strength", 10),
-            dexterity=row.get("dexterity", 10),
-            constitution=row.get("constitution", 10),
-            intelligence=row.get("intelligence", 10),
-            wisdom=row.get("wisdom", 10),
-            charisma=row.get("charisma", 10),
-            hit_points=row.get("hit_points", 10),
-            armor_class=row.get("armor_class", 10),
-            backstory=row.get("backstory", ""),
-            portrait=row.get("portrait"),
-            campaign_id=row.get("campaign_id"),
-            created_at=row.get("created_at", ""),
-            updated_at=row.get("updated_at", ""),
+            row["id"],
+            row["owner_id"],
+            row["name"],
+            row.get("race", "Human"),
+            row.get("class", "Fighter"),
+            row.get("level", 1),
+            row.get("strength", 10),
+            row.get("dexterity", 10),
+            row.get("constitution", 10),
+            row.get("intelligence", 10),
+            row.get("wisdom", 10),
+            row.get("charisma", 10),
+            row.get("hit_points", 10),
+            row.get("armor_class", 10),
+            row.get("backstory", ""),
+            row.get("portrait"),
+            row.get("campaign_id"),
+            row.get("created_at", ""),
+            row.get("updated_at", ""),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "owner_id": self.owner_id,
-            "name": self.name,
-            "race": self.race,
-            "class": self.char_class,
-            "level": self.level,
-            "ability_scores": {
-                "strength": self.strength,
-                "dexterity": self.dexterity,
-                "constitution": self.constitution,
-                "intelligence": self.intelligence,
-                "wisdom": self.wisdom,
-                "charisma": self.charisma,
-            },
-            "hit_points": self.hit_points,
-            "armor_class": self.armor_class,
-            "backstory": self.backstory,
-            "portrait": self.portrait,
-            "campaign_id": self.campaign_id,
-            "created_at": self.created_at,
-        }
+    to_dict = _JSON.one
+    to_dicts = staticmethod(_JSON.many)
@@ -8,7 +8,7 @@ import re
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiceRoll:
     id: int = 0
     user_id: int = 0
@@ -22,13 +22,13 @@ class DiceRoll:
     def from_row(row: dict) -> DiceRoll:
         results = json.loads(row.get("results", "[]"))
         return DiceRoll(
-            id=row["id"],
-            user_id=row["user_id"],
-            expression=row["expression"],
-            results=results,
-            total=row["total"],
-            campaign_id=row.get("campaign_id"),
-            created_at=row.get("created_at", ""),
+            row["id"],
+            row["user_id"],
+            row["expression"],
+            results,
+            row["total"],
+            row.get("campaign_id"),
+            row.get("created_at", ""),
         )
 
     def to_dict(self) -> dict:
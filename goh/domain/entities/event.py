@@ -4,8 +4,27 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from goh.domain.serializers import compile_serializer
 
-@dataclass(frozen=True)
+_JSON = compile_serializer("Event", {
+    "id": "id",
+    "organizer_id": "organizer_id",
+    "organizer_username": "organizer_username",
+    "title": "title",
+    "description": "description",
+    "event_type": "event_type",
+    "location": "location",
+    "start_time": "start_time",
+    "end_time": "end_time",
+    "min_players": "min_players",
+    "max_players": "max_players",
+    "status": "status",
+    "campaign_id": "campaign_id",
+    "created_at": "created_at",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class Event:
     id: int
     organizer_id: int
@@ -27,43 +46,28 @@ class Event:
     @staticmethod
     def from_row(row: dict) -> Event:
         return Event(
-            id=row["id"],
-            organizer_id=row["organizer_id"],
-            title=row["title"],
-            description=row.get("description", ""),
-            event_type=row.get("event_type", "one_shot"),
-            location=row.get("location"),
-            start_time=row.get("start_time", ""),
-            end_time=row.get("end_time"),
-            min_players=row.get("min_players", 1),
-            max_players=row.get("max_players"),
-            status=row.get("status", "upcoming"),
-            campaign_id=row.get("campaign_id"),
-            created_at=row.get("created_at", ""),
-            updated_at=row.get("updated_at", ""),
-            organizer_username=row.get("organizer_username", ""),
+            row["id"],
+            row["organizer_id"],
+            row["title"],
+            row.get("description", ""),
+            row.get("event_type", "one_shot"),
+            row.get("location"),
+            row.get("start_time", ""),
+            row.get("end_time"),
+            row.get("min_players", 1),
+            row.get("max_players"),
+            row.get("status", "upcoming"),
+            row.get("campaign_id"),
+            row.get("created_at", ""),
+            row.get("updated_at", ""),
+            row.get("organizer_username", ""),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "organizer_id": self.organizer_id,
-            "organizer_username": self.organizer_username,
-            "title": self.title,
-            "description": self.description,
-            "event_type": self.event_type,
-            "location": self.location,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "min_players": self.min_players,
-            "max_players": self.max_players,
-            "status": self.status,
-            "campaign_id": self.campaign_id,
-            "created_at": self.created_at,
-        }
+    to_dict = _JSON.one
+    to_dicts = staticmethod(_JSON.many)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSVP:
     id: int
     event_id: int
@@ -77,13 +81,13 @@ class RSVP:
     @staticmethod
     def from_row(row: dict) -> RSVP:
         return RSVP(
-            id=row["id"],
-            event_id=row["event_id"],
-            user_id=row["user_id"],
-            status=row.get("status", "going"),
-            created_at=row.get("created_at", ""),
-            username=row.get("username", ""),
-            display_name=row.get("display_name", ""),
+            row["id"],
+            row["event_id"],
+            row["user_id"],
+            row.get("status", "going"),
+            row.get("created_at", ""),
+            row.get("username", ""),
+            row.get("display_name", ""),
         )
 
     def to_dict(self) -> dict:
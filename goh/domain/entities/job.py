@@ -0,0 +1,52 @@
+"""Job domain entity."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    id: int
+    name: str
+    payload: dict = field(default_factory=dict)
+    priority: int = 0
+    status: str = "queued"
+    idempotency_key: str | None = None
+    attempts: int = 0
+    max_attempts: int = 5
+    run_after: float = 0.0
+    last_error: str | None = None
+    created_at: str = ""
+
+    @staticmethod
+    def from_row(row: dict) -> Job:
+        return Job(
+            row["id"],
+            row["name"],
+            json.loads(row.get("payload") or "{}"),
+            row.get("priority", 0),
+            row.get("status", "queued"),
+            row.get("idempotency_key"),
+            row.get("attempts", 0),
+            row.get("max_attempts", 5),
+            row.get("run_after", 0.0),
+            row.get("last_error"),
+            row.get("created_at", ""),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "payload": self.payload,
+            "priority": self.priority,
+            "status": self.status,
+            "idempotency_key": self.idempotency_key,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_after": self.run_after,
+            "last_error": self.last_error,
+            "created_at": self.created_at,
+        }
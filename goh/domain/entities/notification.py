@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Notification:
     id: int
     user_id: int
@@ -16,19 +16,23 @@ class Notification:
     is_read: bool = False
     source_user_id: int | None = None
     created_at: str = ""
+    group_key: str | None = None
+    actor_count: int = 1
 
     @staticmethod
     def from_row(row: dict) -> Notification:
         return Notification(
-            id=row["id"],
-            user_id=row["user_id"],
-            type=row["type"],
-            title=row["title"],
-            body=row.get("body", ""),
-            link=row.get("link"),
-            is_read=bool(row.get("is_read", 0)),
-            source_user_id=row.get("source_user_id"),
-            created_at=row.get("created_at", ""),
+            row["id"],
+            row["user_id"],
+            row["type"],
+            row["title"],
+            row.get("body", ""),
+            row.get("link"),
+            bool(row.get("is_read", 0)),
+            row.get("source_user_id"),
+            row.get("created_at", ""),
+            row.get("group_key"),
+            row.get("actor_count", 1),
         )
 
     def to_dict(self) -> dict:
@@ -42,4 +46,5 @@ class Notification:
             "is_read": self.is_read,
             "source_user_id": self.source_user_id,
             "created_at": self.created_at,
+            "actor_count": self.actor_count,
         }
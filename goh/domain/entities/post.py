@@ -4,8 +4,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from goh.domain.serializers import compile_serializer
 
-@dataclass(frozen=True)
+_JSON = compile_serializer("Post", {
+    "id": "id",
+    "author_id": "author_id",
+    "content": "content",
+    "post_type": "post_type",
+    "image_url": "image_url",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "author": {
+        "username": "author_username",
+        "display_name": "author_display_name",
+        "avatar": "author_avatar",
+    },
+})
+
+
+@dataclass(frozen=True, slots=True)
 class Post:
     id: int
     author_id: int
@@ -22,30 +39,19 @@ class Post:
     @staticmethod
     def from_row(row: dict) -> Post:
         return Post(
-            id=row["id"],
-            author_id=row["author_id"],
-            content=row["content"],
-            post_type=row.get("post_type", "text"),
-            image_url=row.get("image_url"),
-            created_at=row.get("created_at", ""),
-            updated_at=row.get("updated_at", ""),
-            author_username=row.get("author_username", ""),
-            author_display_name=row.get("author_display_name", ""),
-            author_avatar=row.get("author_avatar"),
+            row["id"],
+            row["author_id"],
+            row["content"],
+            row.get("post_type", "text"),
+            row.get("image_url"),
+            row.get("created_at", ""),
+            row.get("updated_at", ""),
+            row.get("author_username", ""),
+            row.get("author_display_name", ""),
+            row.get("author_avatar"),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "author_id": self.author_id,
-            "content": self.content,
-            "post_type": self.post_type,
-            "image_url": self.image_url,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "author": {
-                "username": self.author_username,
-                "display_name": self.author_display_name,
-                "avatar": self.author_avatar,
-            },
-        }
+    to_dict = _JSON.one
+    to_dicts = staticmethod(_JSON.many)
+    # The to_dict shape from a raw row of the shape's attributes (field order), skipping the entity
+    json_from_tuple = staticmethod(_JSON.from_tuple)
@@ -4,8 +4,27 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from goh.domain.serializers import compile_serializer
 
-@dataclass(frozen=True)
+_PUBLIC_SHAPE = {
+    "id": "id",
+    "username": "username",
+    "display_name": "display_name",
+    "role": "role",
+    "avatar": "avatar",
+    "bio": "bio",
+    "created_at": "created_at",
+}
+_PUBLIC_JSON = compile_serializer("User", _PUBLIC_SHAPE)
+_PRIVATE_JSON = compile_serializer("User.private", {
+    **_PUBLIC_SHAPE,
+    "email": "email",
+    "email_verified": "email_verified",
+    "updated_at": "updated_at",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class User:
     id: int
     username: str
@@ -21,32 +40,18 @@ class User:
     @staticmethod
     def from_row(row: dict) -> User:
         return User(
-            id=row["id"],
-            username=row["username"],
-            email=row["email"],
-            display_name=row["display_name"],
-            role=row["role"],
-            avatar=row.get("avatar"),
-            bio=row.get("bio", ""),
-            email_verified=bool(row.get("email_verified", 0)),
-            created_at=row.get("created_at", ""),
-            updated_at=row.get("updated_at", ""),
+            row["id"],
+            row["username"],
+            row["email"],
+            row["display_name"],
+            row["role"],
+            row.get("avatar"),
+            row.get("bio", ""),
+            bool(row.get("email_verified", 0)),
+            row.get("created_at", ""),
+            row.get("updated_at", ""),
         )
 
-    def to_public_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "username": self.username,
-            "display_name": self.display_name,
-            "role": self.role,
-            "avatar": self.avatar,
-            "bio": self.bio,
-            "created_at": self.created_at,
-        }
-
-    def to_private_dict(self) -> dict:
-        d = self.to_public_dict()
-        d["email"] = self.email
-        d["email_verified"] = self.email_verified
-        d["updated_at"] = self.updated_at
-        return d
+    to_public_dict = _PUBLIC_JSON.one
+    to_public_dicts = staticmethod(_PUBLIC_JSON.many)
+    to_private_dict = _PRIVATE_JSON.one
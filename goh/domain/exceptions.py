@@ -107,3 +107,14 @@ class DuplicateError(ConflictError):
             f"{resource} with {field} '{value}' already exists",
             {"resource": resource, "field": field, "value": value},
         )
+
+
+# --- 503 Service Unavailable ---
+
+
+class ServiceUnavailableError(AppError):
+    status_code = 503
+    error_code = "SERVICE_UNAVAILABLE"
+
+    def __init__(self, message: str = "Service temporarily unavailable") -> None:
+        super().__init__(message)
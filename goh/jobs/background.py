@@ -0,0 +1,118 @@
+"""In-process background queue for follow-up work that can leave the request path.
+
+``defer(db, task)`` hands ``task`` to the configured queue once the current
+transaction on ``db`` commits; a task never runs for work that rolled back.
+The queue runs tasks one at a time on a daemon thread, each with a writable
+connection from ``connection`` (the process's serialized writer in the app).
+Without a configured queue — the CLI, tests — tasks run inline after commit.
+
+Queued tasks live in memory only: they are drained on shutdown but lost if
+the process dies first.
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import structlog
+
+from goh.db.transaction import on_commit
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+Task = Callable[[sqlite3.Connection], object]
+
+DEFAULT_MAX_PENDING = 10_000
+
+
+class BackgroundQueue:
+    def __init__(
+        self,
+        connection: Callable[[], AbstractContextManager[sqlite3.Connection]],
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._connection = connection
+        self._tasks: queue.Queue[Task | None] = queue.Queue(max_pending)
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="background-queue", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, task: Task) -> None:
+        """Queue ``task``; when the queue is full it runs on the caller's thread instead."""
+        try:
+            self._tasks.put_nowait(task)
+        except queue.Full:
+            metrics.increment("background.inline")
+            self._execute(task)
+            return
+        metrics.set_gauge("background.pending", self._tasks.qsize())
+
+    @property
+    def pending(self) -> int:
+        return self._tasks.qsize()
+
+    def join(self) -> None:
+        """Block until every task queued so far has run."""
+        self._tasks.join()
+
+    def close(self) -> None:
+        """Run everything already queued, then stop the thread."""
+        if self._thread is None:
+            return
+        self._tasks.put(None)
+        self._thread.join(timeout=10.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        while (task := self._tasks.get()) is not None:
+            self._execute(task)
+            self._tasks.task_done()
+            metrics.set_gauge("background.pending", self._tasks.qsize())
+        self._tasks.task_done()
+
+    def _execute(self, task: Task) -> None:
+        name = getattr(task, "__qualname__", repr(task))
+        start = time.monotonic()
+        try:
+            with self._connection() as db:
+                task(db)
+        except Exception:
+            metrics.increment("background.failed")
+            logger.exception("background.task_failed", task=name)
+            return
+        metrics.observe("background.task", (time.monotonic() - start) * 1000)
+
+
+_queue: BackgroundQueue | None = None
+
+
+def configure_queue(background: BackgroundQueue | None) -> None:
+    """Install the process-wide queue (``None`` runs deferred tasks inline)."""
+    global _queue
+    _queue = background
+
+
+def defer(db: sqlite3.Connection, task: Task) -> None:
+    """Run ``task`` after the current transaction on ``db`` commits."""
+    background = _queue
+    if background is None:
+
+        def run() -> None:
+            task(db)
+
+        on_commit(db, run)
+    else:
+        on_commit(db, lambda: background.submit(task))
@@ -0,0 +1,164 @@
+"""Durable job queue — follow-up work that survives a restart.
+
+``enqueue(db, name, payload)`` writes a row to the ``jobs`` table inside the
+caller's transaction, so a job exists exactly when the write that asked for it
+committed. Handlers are registered by name with ``@job(name)`` and take
+``(db, payload)``; a handler's writes commit together with the removal of its
+job, so a job that succeeded is never run again.
+
+A failed run is retried with exponential backoff until ``max_attempts``, then
+left in the table as ``failed``. Running jobs hold a lease; a job whose worker
+died is released once the lease expires.
+
+``goh worker run`` drains the table. Processes without an external worker (the
+default, and always in tests) also run each job right after its commit through
+``goh.jobs.background.defer``, which is what keeps development setups working.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from goh.db.transaction import transaction
+from goh.domain.entities.job import Job
+from goh.jobs.background import defer
+from goh.observability.metrics import metrics
+from goh.repositories import job_repo
+
+logger = structlog.get_logger(__name__)
+
+Handler = Callable[[sqlite3.Connection, dict], Any]
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE_SECONDS = 300.0
+BACKOFF_BASE_SECONDS = 5.0
+BACKOFF_MAX_SECONDS = 600.0
+
+_handlers: dict[str, Handler] = {}
+_run_locally = True
+
+
+def job(name: str) -> Callable[[Handler], Handler]:
+    """Register the decorated function as the handler for jobs called ``name``."""
+
+    def decorator(handler: Handler) -> Handler:
+        _handlers[name] = handler
+        return handler
+
+    return decorator
+
+
+def configure_jobs(*, run_locally: bool) -> None:
+    """Choose whether this process runs its own jobs after commit (``False``: leave to workers)."""
+    global _run_locally
+    _run_locally = run_locally
+
+
+def enqueue(
+    db: sqlite3.Connection,
+    name: str,
+    payload: dict | None = None,
+    *,
+    priority: int = 0,
+    idempotency_key: str | None = None,
+    delay: float = 0.0,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int | None:
+    """Queue a job as part of the current transaction on ``db``.
+
+    Higher ``priority`` runs first. Returns the job id, or ``None`` when a job
+    with the same ``idempotency_key`` is still pending.
+    """
+    job_id = job_repo.enqueue(
+        db,
+        name=name,
+        payload=payload or {},
+        priority=priority,
+        idempotency_key=idempotency_key,
+        max_attempts=max_attempts,
+        run_after=time.time() + delay,
+    )
+    if job_id is None:
+        metrics.increment("jobs.deduplicated")
+        return None
+    metrics.increment("jobs.enqueued")
+    if _run_locally and delay <= 0:
+        defer(db, lambda conn: run_job(conn, job_id))
+    return job_id
+
+
+def run_next(db: sqlite3.Connection, *, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+    """Claim and run the next due job; ``False`` if none was due."""
+    now = time.time()
+    with transaction(db):
+        claimed = job_repo.claim(db, now=now, locked_until=now + lease_seconds)
+    if claimed is None:
+        return False
+    _execute(db, claimed)
+    return True
+
+
+def run_job(
+    db: sqlite3.Connection, job_id: int, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+) -> bool:
+    """Run one specific job if it is still due — a worker may have got there first."""
+    now = time.time()
+    with transaction(db):
+        claimed = job_repo.claim(db, now=now, locked_until=now + lease_seconds, job_id=job_id)
+    if claimed is None:
+        return False
+    _execute(db, claimed)
+    return True
+
+
+def release_expired(db: sqlite3.Connection) -> int:
+    """Put jobs with an expired lease back in the queue."""
+    with transaction(db):
+        released = job_repo.requeue_expired(db, now=time.time())
+    if released:
+        metrics.increment("jobs.lease_expired", released)
+        logger.warning("jobs.lease_expired", count=released)
+    return released
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before retry number ``attempts``: exponential, capped, with jitter."""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return float(delay * random.uniform(0.5, 1.0))
+
+
+def _execute(db: sqlite3.Connection, claimed: Job) -> None:
+    start = time.monotonic()
+    try:
+        handler = _handlers.get(claimed.name)
+        if handler is None:
+            raise LookupError(f"No handler registered for job {claimed.name!r}")
+        with transaction(db):
+            handler(db, claimed.payload)
+            job_repo.complete(db, claimed.id)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        with transaction(db):
+            if claimed.attempts >= claimed.max_attempts:
+                job_repo.fail(db, claimed.id, error=error)
+            else:
+                job_repo.retry(
+                    db,
+                    claimed.id,
+                    run_after=time.time() + backoff_seconds(claimed.attempts),
+                    error=error,
+                )
+        outcome = "failed" if claimed.attempts >= claimed.max_attempts else "retried"
+        metrics.increment(f"jobs.{outcome}")
+        logger.exception(
+            f"jobs.{outcome}", job_id=claimed.id, job=claimed.name, attempts=claimed.attempts
+        )
+        return
+    metrics.increment("jobs.completed")
+    metrics.observe(f"jobs.{claimed.name}", (time.monotonic() - start) * 1000)
@@ -0,0 +1,98 @@
+"""Worker pool that drains the durable job queue (``goh worker run``)."""
+
+from __future__ import annotations
+
+import importlib
+import sqlite3
+import threading
+from collections.abc import Callable
+
+import structlog
+
+from goh.jobs.durable import DEFAULT_LEASE_SECONDS, release_expired, run_next
+from goh.observability.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+# Modules that register job handlers; imported before a worker starts
+HANDLER_MODULES = ("goh.services.follow_service", "goh.services.notification_service")
+
+
+def load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+class Worker:
+    """``concurrency`` threads, each with its own connection from ``connect``.
+
+    Idle threads sleep ``poll_interval`` between polls and release jobs whose
+    lease expired, so a crashed worker's jobs are picked up again.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        *,
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self._connect = connect
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._lease_seconds = lease_seconds
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        load_handlers()
+        self._stopping.clear()
+        for index in range(self._concurrency):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info("worker.started", concurrency=self._concurrency)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Let running jobs finish, then stop every thread."""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        logger.info("worker.stopped")
+
+    def wait(self) -> None:
+        """Block until ``stop`` is called (from a signal handler, for instance)."""
+        while not self._stopping.wait(timeout=1.0):
+            pass
+
+    def run_until_idle(self) -> int:
+        """Run every due job on the calling thread and return how many ran."""
+        load_handlers()
+        db = self._connect()
+        try:
+            release_expired(db)
+            processed = 0
+            while run_next(db, lease_seconds=self._lease_seconds):
+                processed += 1
+            return processed
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        db = self._connect()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    if run_next(db, lease_seconds=self._lease_seconds):
+                        continue
+                    release_expired(db)
+                except sqlite3.Error:
+                    metrics.increment("worker.errors")
+                    logger.exception("worker.poll_failed")
+                self._stopping.wait(self._poll_interval)
+        finally:
+            db.close()
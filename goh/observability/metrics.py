@@ -1,16 +1,30 @@
-"""In-process counters for application metrics."""
+"""In-process counters, gauges and timings for application metrics."""
 
 from __future__ import annotations
 
 import threading
 from collections import defaultdict
+from dataclasses import dataclass
+
+
+@dataclass
+class _Timing:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
 
 
 class Metrics:
-    """Thread-safe in-process counter metrics."""
+    """Thread-safe in-process metrics.
+
+    Counters only go up, gauges hold the last value set, and timings keep a
+    count/total/max summary per name.
+    """
 
     def __init__(self) -> None:
         self._counters: dict[str, int] = defaultdict(int)
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, _Timing] = defaultdict(_Timing)
         self._lock = threading.Lock()
 
     def increment(self, name: str, amount: int = 1) -> None:
@@ -23,15 +37,41 @@ class Metrics:
         with self._lock:
             return self._counters[name]
 
-    def snapshot(self) -> dict[str, int]:
-        """Get a snapshot of all counters."""
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to the given value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def get_gauge(self, name: str) -> float:
+        """Get the current value of a gauge (0 if never set)."""
+        with self._lock:
+            return self._gauges.get(name, 0)
+
+    def observe(self, name: str, duration_ms: float) -> None:
+        """Record one timing observation in milliseconds."""
+        with self._lock:
+            timing = self._timings[name]
+            timing.count += 1
+            timing.total_ms += duration_ms
+            timing.max_ms = max(timing.max_ms, duration_ms)
+
+    def snapshot(self) -> dict[str, float]:
+        """Get a flat snapshot of all counters, gauges and timing summaries."""
         with self._lock:
-            return dict(self._counters)
+            result: dict[str, float] = dict(self._counters)
+            result.update(self._gauges)
+            for name, timing in self._timings.items():
+                result[f"{name}.count"] = timing.count
+                result[f"{name}.avg_ms"] = round(timing.total_ms / timing.count, 3)
+                result[f"{name}.max_ms"] = round(timing.max_ms, 3)
+            return result
 
     def reset(self) -> None:
-        """Reset all counters (mainly for testing)."""
+        """Reset all metrics (mainly for testing)."""
         with self._lock:
             self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
 
 
 # Module-level singleton
@@ -0,0 +1,103 @@
+"""In-process pub/sub for per-user notification events.
+
+Each open notification stream subscribes a bounded queue for its user.
+``publish`` never blocks: a subscriber that falls ``max_queue`` messages behind
+loses its oldest message, and the client catches up from the next unread count.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import suppress
+from typing import Any
+
+from goh.observability.metrics import metrics
+
+DEFAULT_MAX_QUEUE = 100
+
+Message = dict[str, Any]
+
+
+class NotificationBus:
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE) -> None:
+        self.max_queue = max_queue
+        self._subscribers: dict[int, set[queue.Queue[Message]]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._connections = 0
+
+    def subscribe(self, user_id: int) -> queue.Queue[Message]:
+        subscription: queue.Queue[Message] = queue.Queue(self.max_queue)
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+            self._connections += 1
+            connections = self._connections
+        metrics.increment("notifications.stream.opened")
+        metrics.set_gauge("notifications.stream.connections", connections)
+        return subscription
+
+    def unsubscribe(self, user_id: int, subscription: queue.Queue[Message]) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is None or subscription not in subscribers:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[user_id]
+            self._connections -= 1
+            connections = self._connections
+        metrics.set_gauge("notifications.stream.connections", connections)
+
+    def publish(self, user_id: int, message: Message) -> int:
+        """Hand ``message`` to every stream of ``user_id``. Returns the number reached."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            while True:
+                try:
+                    subscription.put_nowait(message)
+                    break
+                except queue.Full:
+                    metrics.increment("notifications.stream.dropped")
+                    with suppress(queue.Empty):
+                        subscription.get_nowait()
+        metrics.increment("notifications.published")
+        return len(subscribers)
+
+    def listen(
+        self, user_id: int, subscription: queue.Queue[Message], *,
+        max_seconds: float, heartbeat: float,
+    ) -> Iterator[Message | None]:
+        """Yield messages for ``subscription`` until ``max_seconds`` pass.
+
+        Yields ``None`` after ``heartbeat`` seconds without a message so the
+        caller can keep the connection alive. Unsubscribes when finished or
+        when the consumer stops iterating.
+        """
+        deadline = time.monotonic() + max_seconds
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    message = subscription.get(timeout=min(heartbeat, remaining))
+                except queue.Empty:
+                    yield None
+                    continue
+                metrics.observe(
+                    "notifications.delivery_lag",
+                    max(0.0, time.time() - message["published_at"]) * 1000,
+                )
+                yield message
+        finally:
+            self.unsubscribe(user_id, subscription)
+
+    @property
+    def connections(self) -> int:
+        with self._lock:
+            return self._connections
+
+
+# Module-level singleton
+bus = NotificationBus()
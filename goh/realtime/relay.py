@@ -0,0 +1,125 @@
+"""Cross-worker fan-out of notification events through the database.
+
+Every notification event is also written to ``notification_changes`` in the
+transaction that caused it. Each worker process runs one relay thread that
+tails the table and republishes events that originated in other processes on
+its local bus; events from its own process were already published on commit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import structlog
+
+from goh.db.transaction import transaction
+from goh.observability.metrics import metrics
+from goh.realtime.bus import NotificationBus, bus
+from goh.repositories import notification_repo
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+DEFAULT_RETENTION_SECONDS = 300.0
+PRUNE_INTERVAL_SECONDS = 60.0
+BATCH_LIMIT = 500
+
+
+class ChangeRelay:
+    """Polls ``notification_changes`` from a daemon thread.
+
+    ``connect`` opens the relay's own (read-only) connection; ``writer``
+    returns a context manager yielding a writable connection, used to prune
+    changes older than ``retention`` seconds.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        writer: Callable[[], AbstractContextManager[sqlite3.Connection]],
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        retention: float = DEFAULT_RETENTION_SECONDS,
+        target: NotificationBus = bus,
+    ) -> None:
+        self._connect = connect
+        self._writer = writer
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._bus = target
+        self._conn: sqlite3.Connection | None = None
+        self._last_id = 0
+        self._last_prune = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._conn = self._connect()
+        self._last_id = self._max_id()
+        self._thread = threading.Thread(target=self._run, name="notification-relay", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def poll(self) -> int:
+        """Publish changes newer than the last one seen. Returns the number relayed."""
+        assert self._conn is not None
+        if not self._bus.connections:
+            # Nobody is listening in this process; just move the high-water mark
+            self._last_id = self._max_id()
+            return 0
+
+        rows = self._conn.execute(
+            """SELECT id, user_id, origin, payload FROM notification_changes
+               WHERE id > ? ORDER BY id LIMIT ?""",
+            (self._last_id, BATCH_LIMIT),
+        ).fetchall()
+        if not rows:
+            return 0
+        self._last_id = rows[-1]["id"]
+        pid = os.getpid()
+        relayed = 0
+        for row in rows:
+            if row["origin"] != pid:
+                self._bus.publish(row["user_id"], json.loads(row["payload"]))
+                relayed += 1
+        if relayed:
+            metrics.increment("notifications.relayed", relayed)
+        return relayed
+
+    def prune(self) -> int:
+        with self._writer() as db, transaction(db):
+            return notification_repo.purge_changes(db, older_than_seconds=self.retention)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _max_id(self) -> int:
+        assert self._conn is not None
+        row = self._conn.execute("SELECT COALESCE(MAX(id), 0) AS id FROM notification_changes")
+        return int(row.fetchone()["id"])
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+                if time.monotonic() - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                    self._last_prune = time.monotonic()
+                    self.prune()
+            except Exception:
+                metrics.increment("notifications.relay_failed")
+                logger.exception("notifications.relay_failed")
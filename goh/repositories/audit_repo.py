@@ -4,9 +4,36 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, NamedTuple
 
+from goh.db.transaction import on_commit
 from goh.observability.correlation import get_correlation_id
 
+if TYPE_CHECKING:
+    from goh.db.audit_sink import AuditSink
+
+_INSERT = """INSERT INTO audit_log (user_id, action, resource_type, resource_id, details, correlation_id)
+             VALUES (?, ?, ?, ?, ?, ?)"""
+
+
+class AuditEntry(NamedTuple):
+    user_id: int | None
+    action: str
+    resource_type: str
+    resource_id: int | None
+    details: str | None
+    correlation_id: str
+
+
+# Process-wide sink; None means every entry is written in the caller's transaction
+_sink: AuditSink | None = None
+
+
+def configure_sink(sink: AuditSink | None) -> None:
+    global _sink
+    _sink = sink
+
 
 def log_action(
     db: sqlite3.Connection,
@@ -17,16 +44,26 @@ def log_action(
     resource_id: int | None = None,
     details: dict | None = None,
 ) -> None:
-    db.execute(
-        """INSERT INTO audit_log (user_id, action, resource_type, resource_id, details, correlation_id)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (
-            user_id,
-            action,
-            resource_type,
-            resource_id,
-            json.dumps(details) if details else None,
-            get_correlation_id(),
-        ),
+    """Record an audit entry.
+
+    With a buffered sink configured the entry is handed over once the caller's
+    transaction commits (and dropped if it rolls back); otherwise, or when the
+    sink is durable, it is inserted in the caller's transaction.
+    """
+    entry = AuditEntry(
+        user_id,
+        action,
+        resource_type,
+        resource_id,
+        json.dumps(details) if details else None,
+        get_correlation_id(),
     )
-    db.commit()
+    sink = _sink
+    if sink is None or sink.durable:
+        db.execute(_INSERT, entry)
+    else:
+        on_commit(db, lambda: sink.submit(entry))
+
+
+def insert_many(db: sqlite3.Connection, entries: Iterable[AuditEntry]) -> None:
+    db.executemany(_INSERT, entries)
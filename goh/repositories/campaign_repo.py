@@ -5,6 +5,9 @@ from __future__ import annotations
 import sqlite3
 
 from goh.domain.entities.campaign import Campaign, SessionLog
+from goh.repositories import counter_repo, user_repo
+from goh.repositories.fulltext import match_expression
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
 
 _CAMPAIGN_JOIN = """
     SELECT c.*, u.username as dm_username
@@ -20,14 +23,16 @@ def create(
     description: str = "",
     max_players: int = 6,
 ) -> Campaign:
-    cursor = db.execute(
-        "INSERT INTO campaigns (dm_id, name, description, max_players) VALUES (?, ?, ?, ?)",
+    row = db.execute(
+        """INSERT INTO campaigns (dm_id, name, description, max_players)
+           VALUES (?, ?, ?, ?) RETURNING *""",
         (dm_id, name, description, max_players),
-    )
-    db.commit()
-    camp = find_by_id(db, cursor.lastrowid)
-    assert camp is not None
-    return camp
+    ).fetchone()
+    assert row is not None
+    dm = user_repo.get_summary(db, dm_id)
+    if dm:
+        row["dm_username"] = dm["username"]
+    return Campaign.from_row(row)
 
 
 def find_by_id(db: sqlite3.Connection, campaign_id: int | None) -> Campaign | None:
@@ -36,8 +41,37 @@ def find_by_id(db: sqlite3.Connection, campaign_id: int | None) -> Campaign | No
 
 
 def list_all(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[Campaign]:
+    rows = _all_rows(db, limit, offset=offset)
+    return [Campaign.from_row(r) for r in rows]
+
+
+def list_all_page(
+    db: sqlite3.Connection, limit: int = 50, cursor: Cursor | None = None
+) -> Page[Campaign]:
+    rows = _all_rows(db, limit + 1, cursor=cursor)
+    return build_page(rows, limit, Campaign.from_row)
+
+
+def _all_rows(
+    db: sqlite3.Connection, limit: int, *, offset: int = 0, cursor: Cursor | None = None
+) -> list[dict]:
+    after, params = keyset_condition("c.created_at, c.id", cursor)
+    return db.execute(
+        f"{_CAMPAIGN_JOIN} WHERE {after} ORDER BY c.created_at DESC, c.id DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    ).fetchall()
+
+
+def search(db: sqlite3.Connection, query: str, limit: int = 20) -> list[Campaign]:
+    """Campaigns matching the query in name or description; name hits rank first."""
+    expression = match_expression(query)
+    if expression is None:
+        return []
     rows = db.execute(
-        f"{_CAMPAIGN_JOIN} ORDER BY c.created_at DESC LIMIT ? OFFSET ?", (limit, offset)
+        f"""{_CAMPAIGN_JOIN} JOIN campaigns_fts ON campaigns_fts.rowid = c.id
+            WHERE campaigns_fts MATCH ?
+            ORDER BY bm25(campaigns_fts, 3.0, 1.0), c.id DESC LIMIT ?""",
+        (expression, limit),
     ).fetchall()
     return [Campaign.from_row(r) for r in rows]
 
@@ -54,7 +88,6 @@ def update_status(db: sqlite3.Connection, campaign_id: int, status: str) -> None
         "UPDATE campaigns SET status = ?, updated_at = datetime('now') WHERE id = ?",
         (status, campaign_id),
     )
-    db.commit()
 
 
 # Members
@@ -68,7 +101,6 @@ def add_member(
            VALUES (?, ?, ?, ?)""",
         (campaign_id, user_id, character_id, role),
     )
-    db.commit()
 
 
 def remove_member(db: sqlite3.Connection, campaign_id: int, user_id: int) -> None:
@@ -76,7 +108,6 @@ def remove_member(db: sqlite3.Connection, campaign_id: int, user_id: int) -> Non
         "DELETE FROM campaign_members WHERE campaign_id = ? AND user_id = ?",
         (campaign_id, user_id),
     )
-    db.commit()
 
 
 def get_members(db: sqlite3.Connection, campaign_id: int) -> list[dict]:
@@ -97,11 +128,7 @@ def is_member(db: sqlite3.Connection, campaign_id: int, user_id: int) -> bool:
 
 
 def count_members(db: sqlite3.Connection, campaign_id: int) -> int:
-    row = db.execute(
-        "SELECT COUNT(*) as cnt FROM campaign_members WHERE campaign_id = ?",
-        (campaign_id,),
-    ).fetchone()
-    return row["cnt"] if row else 0
+    return counter_repo.get(db, "campaign", campaign_id, "members")
 
 
 # Session Logs
@@ -116,15 +143,16 @@ def create_session_log(
     summary: str = "",
     session_date: str = "",
 ) -> SessionLog:
-    cursor = db.execute(
+    row = db.execute(
         """INSERT INTO session_logs (campaign_id, author_id, session_number, title, summary, session_date)
-           VALUES (?, ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?, ?) RETURNING *""",
         (campaign_id, author_id, session_number, title, summary, session_date),
-    )
-    db.commit()
-    log = find_session_log_by_id(db, cursor.lastrowid)
-    assert log is not None
-    return log
+    ).fetchone()
+    assert row is not None
+    author = user_repo.get_summary(db, author_id)
+    if author:
+        row["author_username"] = author["username"]
+    return SessionLog.from_row(row)
 
 
 def find_session_log_by_id(db: sqlite3.Connection, log_id: int | None) -> SessionLog | None:
@@ -26,18 +26,16 @@ def create(
     backstory: str = "",
     campaign_id: int | None = None,
 ) -> Character:
-    cursor = db.execute(
+    row = db.execute(
         """INSERT INTO characters
            (owner_id, name, race, class, level, strength, dexterity, constitution,
             intelligence, wisdom, charisma, hit_points, armor_class, backstory, campaign_id)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) RETURNING *""",
         (owner_id, name, race, char_class, level, strength, dexterity, constitution,
          intelligence, wisdom, charisma, hit_points, armor_class, backstory, campaign_id),
-    )
-    db.commit()
-    char = find_by_id(db, cursor.lastrowid)
-    assert char is not None
-    return char
+    ).fetchone()
+    assert row is not None
+    return Character.from_row(row)
 
 
 def find_by_id(db: sqlite3.Connection, char_id: int | None) -> Character | None:
@@ -78,9 +76,7 @@ def update(
     updates.append("updated_at = datetime('now')")
     params.append(char_id)
     db.execute(f"UPDATE characters SET {', '.join(updates)} WHERE id = ?", params)
-    db.commit()
 
 
 def delete(db: sqlite3.Connection, char_id: int) -> None:
     db.execute("DELETE FROM characters WHERE id = ?", (char_id,))
-    db.commit()
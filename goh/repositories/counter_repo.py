@@ -0,0 +1,87 @@
+"""Counter repository — denormalized counts maintained by triggers (migration 004)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+# (entity, name) -> query yielding (entity_id, true count); used to repair drift
+_SOURCES: dict[tuple[str, str], str] = {
+    ("user", "followers"): "SELECT following_id, COUNT(*) FROM follows GROUP BY following_id",
+    ("user", "following"): "SELECT follower_id, COUNT(*) FROM follows GROUP BY follower_id",
+    ("user", "posts"): "SELECT author_id, COUNT(*) FROM posts GROUP BY author_id",
+    ("event", "going"): (
+        "SELECT event_id, COUNT(*) FROM rsvps WHERE status = 'going' GROUP BY event_id"
+    ),
+    ("campaign", "members"): (
+        "SELECT campaign_id, COUNT(*) FROM campaign_members GROUP BY campaign_id"
+    ),
+    ("user", "unread_notifications"): (
+        "SELECT user_id, COUNT(*) FROM notifications WHERE is_read = 0 GROUP BY user_id"
+    ),
+}
+
+
+def get(db: sqlite3.Connection, entity: str, entity_id: int, name: str) -> int:
+    row = db.execute(
+        "SELECT value FROM counters WHERE entity = ? AND entity_id = ? AND name = ?",
+        (entity, entity_id, name),
+    ).fetchone()
+    return row["value"] if row else 0
+
+
+def add(db: sqlite3.Connection, entity: str, entity_id: int, name: str, delta: int) -> int:
+    """Adjust a counter by ``delta`` and return its new value."""
+    row = db.execute(
+        """INSERT INTO counters (entity, entity_id, name, value) VALUES (?, ?, ?, ?)
+           ON CONFLICT DO UPDATE SET value = value + excluded.value
+           RETURNING value""",
+        (entity, entity_id, name, delta),
+    ).fetchone()
+    return int(row["value"])
+
+
+def reset(db: sqlite3.Connection, entity: str, entity_id: int, name: str) -> None:
+    db.execute(
+        "UPDATE counters SET value = 0 WHERE entity = ? AND entity_id = ? AND name = ?",
+        (entity, entity_id, name),
+    )
+
+
+def get_all(db: sqlite3.Connection, entity: str, entity_id: int) -> dict[str, int]:
+    """All counters of one entity, e.g. ``{"followers": 3, "posts": 12}``."""
+    rows = db.execute(
+        "SELECT name, value FROM counters WHERE entity = ? AND entity_id = ?",
+        (entity, entity_id),
+    ).fetchall()
+    return {r["name"]: r["value"] for r in rows}
+
+
+def recount(db: sqlite3.Connection) -> dict[str, int]:
+    """Recompute every counter from its source table.
+
+    Returns the number of corrected entities per ``entity.name`` counter.
+    """
+    corrected: dict[str, int] = {}
+    for (entity, name), source in _SOURCES.items():
+        stored = {
+            r["entity_id"]: r["value"]
+            for r in db.execute(
+                "SELECT entity_id, value FROM counters WHERE entity = ? AND name = ?",
+                (entity, name),
+            ).fetchall()
+        }
+        cursor = db.cursor()
+        cursor.row_factory = None
+        actual = dict(cursor.execute(source).fetchall())
+        drifted = {
+            entity_id
+            for entity_id in stored.keys() | actual.keys()
+            if stored.get(entity_id, 0) != actual.get(entity_id, 0)
+        }
+        db.executemany(
+            """INSERT INTO counters (entity, entity_id, name, value) VALUES (?, ?, ?, ?)
+               ON CONFLICT DO UPDATE SET value = excluded.value""",
+            [(entity, entity_id, name, actual.get(entity_id, 0)) for entity_id in drifted],
+        )
+        corrected[f"{entity}.{name}"] = len(drifted)
+    return corrected
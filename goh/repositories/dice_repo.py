@@ -17,13 +17,11 @@ def save(
     total: int,
     campaign_id: int | None = None,
 ) -> DiceRoll:
-    cursor = db.execute(
-        "INSERT INTO dice_rolls (user_id, expression, results, total, campaign_id) VALUES (?, ?, ?, ?, ?)",
+    row = db.execute(
+        """INSERT INTO dice_rolls (user_id, expression, results, total, campaign_id)
+           VALUES (?, ?, ?, ?, ?) RETURNING *""",
         (user_id, expression, json.dumps(results), total, campaign_id),
-    )
-    db.commit()
-    roll_id = cursor.lastrowid
-    row = db.execute("SELECT * FROM dice_rolls WHERE id = ?", (roll_id,)).fetchone()
+    ).fetchone()
     assert row is not None
     return DiceRoll.from_row(row)
 
@@ -5,6 +5,9 @@ from __future__ import annotations
 import sqlite3
 
 from goh.domain.entities.event import RSVP, Event
+from goh.repositories import counter_repo, user_repo
+from goh.repositories.fulltext import match_expression
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
 
 _EVENT_JOIN = """
     SELECT e.*, u.username as organizer_username
@@ -26,17 +29,18 @@ def create(
     max_players: int | None = None,
     campaign_id: int | None = None,
 ) -> Event:
-    cursor = db.execute(
+    row = db.execute(
         """INSERT INTO events (organizer_id, title, description, event_type, location,
            start_time, end_time, min_players, max_players, campaign_id)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) RETURNING *""",
         (organizer_id, title, description, event_type, location,
          start_time, end_time, min_players, max_players, campaign_id),
-    )
-    db.commit()
-    event = find_by_id(db, cursor.lastrowid)
-    assert event is not None
-    return event
+    ).fetchone()
+    assert row is not None
+    organizer = user_repo.get_summary(db, organizer_id)
+    if organizer:
+        row["organizer_username"] = organizer["username"]
+    return Event.from_row(row)
 
 
 def find_by_id(db: sqlite3.Connection, event_id: int | None) -> Event | None:
@@ -53,9 +57,38 @@ def list_upcoming(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> l
 
 
 def list_all(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[Event]:
+    rows = _all_rows(db, limit, offset=offset)
+    return [Event.from_row(r) for r in rows]
+
+
+def list_all_page(
+    db: sqlite3.Connection, limit: int = 50, cursor: Cursor | None = None
+) -> Page[Event]:
+    """All events, keyset-paginated by (start_time, id)."""
+    rows = _all_rows(db, limit + 1, cursor=cursor)
+    return build_page(rows, limit, Event.from_row, key="start_time")
+
+
+def _all_rows(
+    db: sqlite3.Connection, limit: int, *, offset: int = 0, cursor: Cursor | None = None
+) -> list[dict]:
+    after, params = keyset_condition("e.start_time, e.id", cursor)
+    return db.execute(
+        f"{_EVENT_JOIN} WHERE {after} ORDER BY e.start_time DESC, e.id DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    ).fetchall()
+
+
+def search(db: sqlite3.Connection, query: str, limit: int = 20) -> list[Event]:
+    """Events matching the query in title, description or location; title hits rank first."""
+    expression = match_expression(query)
+    if expression is None:
+        return []
     rows = db.execute(
-        f"{_EVENT_JOIN} ORDER BY e.start_time DESC LIMIT ? OFFSET ?",
-        (limit, offset),
+        f"""{_EVENT_JOIN} JOIN events_fts ON events_fts.rowid = e.id
+            WHERE events_fts MATCH ?
+            ORDER BY bm25(events_fts, 3.0, 1.0, 2.0), e.start_time DESC LIMIT ?""",
+        (expression, limit),
     ).fetchall()
     return [Event.from_row(r) for r in rows]
 
@@ -65,30 +98,26 @@ def update_status(db: sqlite3.Connection, event_id: int, status: str) -> None:
         "UPDATE events SET status = ?, updated_at = datetime('now') WHERE id = ?",
         (status, event_id),
     )
-    db.commit()
 
 
 def delete(db: sqlite3.Connection, event_id: int) -> None:
     db.execute("DELETE FROM events WHERE id = ?", (event_id,))
-    db.commit()
 
 
 # RSVP operations
 
 def rsvp(db: sqlite3.Connection, event_id: int, user_id: int, status: str = "going") -> RSVP:
-    db.execute(
+    row = db.execute(
         """INSERT INTO rsvps (event_id, user_id, status) VALUES (?, ?, ?)
-           ON CONFLICT(event_id, user_id) DO UPDATE SET status = ?, updated_at = datetime('now')""",
+           ON CONFLICT(event_id, user_id) DO UPDATE SET status = ?, updated_at = datetime('now')
+           RETURNING *""",
         (event_id, user_id, status, status),
-    )
-    db.commit()
-    row = db.execute(
-        """SELECT r.*, u.username, u.display_name FROM rsvps r
-           JOIN users u ON r.user_id = u.id
-           WHERE r.event_id = ? AND r.user_id = ?""",
-        (event_id, user_id),
     ).fetchone()
     assert row is not None
+    user = user_repo.get_summary(db, user_id)
+    if user:
+        row["username"] = user["username"]
+        row["display_name"] = user["display_name"]
     return RSVP.from_row(row)
 
 
@@ -103,8 +132,4 @@ def get_rsvps(db: sqlite3.Connection, event_id: int) -> list[RSVP]:
 
 
 def count_going(db: sqlite3.Connection, event_id: int) -> int:
-    row = db.execute(
-        "SELECT COUNT(*) as cnt FROM rsvps WHERE event_id = ? AND status = 'going'",
-        (event_id,),
-    ).fetchone()
-    return row["cnt"] if row else 0
+    return counter_repo.get(db, "event", event_id, "going")
@@ -0,0 +1,108 @@
+"""Home feed inbox repository — raw SQL data access for the materialized feed."""
+
+from __future__ import annotations
+
+import sqlite3
+
+# Authors with at least this many followers are merged into feeds at read time
+FANOUT_FOLLOWER_THRESHOLD = 5000
+
+# How many of an author's recent posts are copied into a new follower's inbox
+BACKFILL_LIMIT = 200
+
+
+def configure_feed(*, fanout_threshold: int, backfill_limit: int) -> None:
+    global FANOUT_FOLLOWER_THRESHOLD, BACKFILL_LIMIT
+    FANOUT_FOLLOWER_THRESHOLD = fanout_threshold
+    BACKFILL_LIMIT = backfill_limit
+
+
+def fan_out(
+    db: sqlite3.Connection,
+    *,
+    post_id: int,
+    author_id: int,
+    created_at: str,
+    include_followers: bool = True,
+) -> int:
+    """Insert a post into the author's own inbox and, optionally, every follower's.
+
+    Returns the number of inbox rows written.
+    """
+    if include_followers:
+        cursor = db.execute(
+            """INSERT OR IGNORE INTO feed_items (user_id, post_id, author_id, created_at)
+               SELECT follower_id, ?, ?, ? FROM follows WHERE following_id = ?
+               UNION ALL SELECT ?, ?, ?, ?""",
+            (post_id, author_id, created_at, author_id,
+             author_id, post_id, author_id, created_at),
+        )
+    else:
+        cursor = db.execute(
+            "INSERT OR IGNORE INTO feed_items (user_id, post_id, author_id, created_at) VALUES (?, ?, ?, ?)",
+            (author_id, post_id, author_id, created_at),
+        )
+    return cursor.rowcount
+
+
+def remove_post(db: sqlite3.Connection, post_id: int) -> None:
+    db.execute("DELETE FROM feed_items WHERE post_id = ?", (post_id,))
+
+
+def backfill(
+    db: sqlite3.Connection, *, user_id: int, author_id: int, limit: int | None = None
+) -> None:
+    """Copy an author's most recent posts into a reader's inbox (on follow)."""
+    if limit is None:
+        limit = BACKFILL_LIMIT
+    db.execute(
+        """INSERT OR IGNORE INTO feed_items (user_id, post_id, author_id, created_at)
+           SELECT ?, id, author_id, created_at FROM posts
+           WHERE author_id = ? ORDER BY created_at DESC, id DESC LIMIT ?""",
+        (user_id, author_id, limit),
+    )
+
+
+def prune(db: sqlite3.Connection, *, user_id: int, author_id: int) -> None:
+    """Remove an author's posts from a reader's inbox (on unfollow)."""
+    db.execute(
+        "DELETE FROM feed_items WHERE user_id = ? AND author_id = ?",
+        (user_id, author_id),
+    )
+
+
+# Hybrid mode — high-follower authors
+
+def is_merged_author(db: sqlite3.Connection, author_id: int) -> bool:
+    row = db.execute(
+        "SELECT 1 FROM feed_merged_authors WHERE author_id = ?", (author_id,)
+    ).fetchone()
+    return row is not None
+
+
+def mark_merged_author(db: sqlite3.Connection, author_id: int) -> None:
+    db.execute(
+        "INSERT OR IGNORE INTO feed_merged_authors (author_id) VALUES (?)", (author_id,)
+    )
+
+
+def merged_followees(db: sqlite3.Connection, user_id: int) -> list[int]:
+    """IDs of merged (read-time) authors that the given user follows."""
+    rows = db.execute(
+        """SELECT f.following_id FROM follows f
+           JOIN feed_merged_authors m ON m.author_id = f.following_id
+           WHERE f.follower_id = ?""",
+        (user_id,),
+    ).fetchall()
+    return [r["following_id"] for r in rows]
+
+
+def has_followers_at_least(db: sqlite3.Connection, author_id: int, threshold: int) -> bool:
+    """Bounded follower count check — stops scanning once the threshold is reached."""
+    row = db.execute(
+        """SELECT COUNT(*) as cnt FROM (
+               SELECT 1 FROM follows WHERE following_id = ? LIMIT ?
+           )""",
+        (author_id, threshold),
+    ).fetchone()
+    return bool(row) and row["cnt"] >= threshold
@@ -5,6 +5,8 @@ from __future__ import annotations
 import sqlite3
 
 from goh.domain.entities.user import User
+from goh.repositories import counter_repo
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
 
 
 def follow(db: sqlite3.Connection, follower_id: int, following_id: int) -> None:
@@ -12,7 +14,6 @@ def follow(db: sqlite3.Connection, follower_id: int, following_id: int) -> None:
         "INSERT OR IGNORE INTO follows (follower_id, following_id) VALUES (?, ?)",
         (follower_id, following_id),
     )
-    db.commit()
 
 
 def unfollow(db: sqlite3.Connection, follower_id: int, following_id: int) -> None:
@@ -20,7 +21,6 @@ def unfollow(db: sqlite3.Connection, follower_id: int, following_id: int) -> Non
         "DELETE FROM follows WHERE follower_id = ? AND following_id = ?",
         (follower_id, following_id),
     )
-    db.commit()
 
 
 def is_following(db: sqlite3.Connection, follower_id: int, following_id: int) -> bool:
@@ -34,38 +34,55 @@ def is_following(db: sqlite3.Connection, follower_id: int, following_id: int) ->
 def get_followers(
     db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
 ) -> list[User]:
-    rows = db.execute(
-        """SELECT u.* FROM users u
-           JOIN follows f ON f.follower_id = u.id
-           WHERE f.following_id = ?
-           ORDER BY f.created_at DESC LIMIT ? OFFSET ?""",
-        (user_id, limit, offset),
-    ).fetchall()
+    rows = _follow_rows(db, "following_id", "follower_id", user_id, limit, offset=offset)
     return [User.from_row(r) for r in rows]
 
 
+def get_followers_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: Cursor | None = None
+) -> Page[User]:
+    rows = _follow_rows(db, "following_id", "follower_id", user_id, limit + 1, cursor=cursor)
+    return build_page(rows, limit, User.from_row, key="followed_at", id_key="follow_id")
+
+
 def get_following(
     db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
 ) -> list[User]:
-    rows = db.execute(
-        """SELECT u.* FROM users u
-           JOIN follows f ON f.following_id = u.id
-           WHERE f.follower_id = ?
-           ORDER BY f.created_at DESC LIMIT ? OFFSET ?""",
-        (user_id, limit, offset),
-    ).fetchall()
+    rows = _follow_rows(db, "follower_id", "following_id", user_id, limit, offset=offset)
     return [User.from_row(r) for r in rows]
 
 
+def get_following_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: Cursor | None = None
+) -> Page[User]:
+    rows = _follow_rows(db, "follower_id", "following_id", user_id, limit + 1, cursor=cursor)
+    return build_page(rows, limit, User.from_row, key="followed_at", id_key="follow_id")
+
+
+def _follow_rows(
+    db: sqlite3.Connection,
+    match_column: str,
+    user_column: str,
+    user_id: int,
+    limit: int,
+    *,
+    offset: int = 0,
+    cursor: Cursor | None = None,
+) -> list[dict]:
+    """Users on the other side of ``user_id``'s follows, ordered by follow time."""
+    after, params = keyset_condition("f.created_at, f.id", cursor)
+    return db.execute(
+        f"""SELECT u.*, f.created_at as followed_at, f.id as follow_id FROM follows f
+            JOIN users u ON u.id = f.{user_column}
+            WHERE f.{match_column} = ? AND {after}
+            ORDER BY f.created_at DESC, f.id DESC LIMIT ? OFFSET ?""",
+        (user_id, *params, limit, offset),
+    ).fetchall()
+
+
 def count_followers(db: sqlite3.Connection, user_id: int) -> int:
-    row = db.execute(
-        "SELECT COUNT(*) as cnt FROM follows WHERE following_id = ?", (user_id,)
-    ).fetchone()
-    return row["cnt"] if row else 0
+    return counter_repo.get(db, "user", user_id, "followers")
 
 
 def count_following(db: sqlite3.Connection, user_id: int) -> int:
-    row = db.execute(
-        "SELECT COUNT(*) as cnt FROM follows WHERE follower_id = ?", (user_id,)
-    ).fetchone()
-    return row["cnt"] if row else 0
+    return counter_repo.get(db, "user", user_id, "following")
@@ -0,0 +1,36 @@
+"""FTS5 helpers shared by the repositories that expose ``search``.
+
+The ``*_fts`` tables (migration 010) are external-content indexes kept in step
+by triggers. User input never reaches ``MATCH`` as syntax: ``match_expression``
+keeps only the words and turns each into a quoted prefix term, so ``gan dal``
+becomes ``"gan"* "dal"*`` (both must match).
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+
+FTS_TABLES = ("users_fts", "posts_fts", "events_fts", "campaigns_fts")
+
+# Letters and digits only, matching how the unicode61 tokenizer splits text
+_TOKEN = re.compile(r"[^\W_]+")
+MAX_TERMS = 8
+
+
+def match_expression(query: str) -> str | None:
+    """A safe FTS5 prefix query for ``query``, or ``None`` if it has no words."""
+    terms = _TOKEN.findall(query)[:MAX_TERMS]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def reindex(db: sqlite3.Connection) -> dict[str, int]:
+    """Rebuild every index from its content table; returns rows indexed per table."""
+    counts: dict[str, int] = {}
+    for table in FTS_TABLES:
+        db.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        row = db.execute(f"SELECT COUNT(*) AS cnt FROM {table}").fetchone()
+        counts[table] = row["cnt"]
+    return counts
@@ -0,0 +1,104 @@
+"""Job repository — the durable queue behind goh.jobs.durable (migration 008)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from goh.domain.entities.job import Job
+
+_CLAIM_NEXT = """
+    UPDATE jobs SET status = 'running', attempts = attempts + 1, locked_until = ?
+    WHERE id = (
+        SELECT id FROM jobs WHERE status = 'queued' AND run_after <= ?
+        ORDER BY priority DESC, run_after, id LIMIT 1
+    )
+    RETURNING *
+"""
+
+_CLAIM_ONE = """
+    UPDATE jobs SET status = 'running', attempts = attempts + 1, locked_until = ?
+    WHERE id = ? AND status = 'queued' AND run_after <= ?
+    RETURNING *
+"""
+
+
+def enqueue(
+    db: sqlite3.Connection,
+    *,
+    name: str,
+    payload: dict,
+    priority: int,
+    idempotency_key: str | None,
+    max_attempts: int,
+    run_after: float,
+) -> int | None:
+    """Insert a job; ``None`` if a pending job already holds ``idempotency_key``."""
+    row = db.execute(
+        """INSERT INTO jobs (name, payload, priority, idempotency_key, max_attempts, run_after)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT (idempotency_key)
+               WHERE idempotency_key IS NOT NULL AND status != 'failed' DO NOTHING
+           RETURNING id""",
+        (name, json.dumps(payload), priority, idempotency_key, max_attempts, run_after),
+    ).fetchone()
+    return row["id"] if row else None
+
+
+def find_by_id(db: sqlite3.Connection, job_id: int) -> Job | None:
+    row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return Job.from_row(row) if row else None
+
+
+def claim(
+    db: sqlite3.Connection, *, now: float, locked_until: float, job_id: int | None = None
+) -> Job | None:
+    """Mark the next due job (or ``job_id``, if still due) running and return it."""
+    if job_id is None:
+        row = db.execute(_CLAIM_NEXT, (locked_until, now)).fetchone()
+    else:
+        row = db.execute(_CLAIM_ONE, (locked_until, job_id, now)).fetchone()
+    return Job.from_row(row) if row else None
+
+
+def complete(db: sqlite3.Connection, job_id: int) -> None:
+    db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+
+def retry(db: sqlite3.Connection, job_id: int, *, run_after: float, error: str) -> None:
+    db.execute(
+        """UPDATE jobs SET status = 'queued', run_after = ?, locked_until = NULL, last_error = ?
+           WHERE id = ?""",
+        (run_after, error, job_id),
+    )
+
+
+def fail(db: sqlite3.Connection, job_id: int, *, error: str) -> None:
+    db.execute(
+        "UPDATE jobs SET status = 'failed', locked_until = NULL, last_error = ? WHERE id = ?",
+        (error, job_id),
+    )
+
+
+def requeue_expired(db: sqlite3.Connection, *, now: float) -> int:
+    """Release jobs whose worker stopped renewing its lease; out of attempts means failed."""
+    cursor = db.execute(
+        """UPDATE jobs
+           SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+               locked_until = NULL, last_error = 'lease expired'
+           WHERE status = 'running' AND locked_until < ?""",
+        (now,),
+    )
+    return cursor.rowcount
+
+
+def count_by_status(db: sqlite3.Connection) -> dict[str, int]:
+    rows = db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+    return {row["status"]: row["n"] for row in rows}
+
+
+def list_failed(db: sqlite3.Connection, limit: int = 50) -> list[Job]:
+    rows = db.execute(
+        "SELECT * FROM jobs WHERE status = 'failed' ORDER BY id DESC LIMIT ?", (limit,)
+    ).fetchall()
+    return [Job.from_row(r) for r in rows]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import sqlite3
 
+from goh.repositories.session_repo import NOW_ISO
+
 
 def create(
     db: sqlite3.Connection,
@@ -16,7 +18,6 @@ def create(
         "INSERT INTO magic_links (user_id, token, expires_at) VALUES (?, ?, ?)",
         (user_id, token, expires_at),
     )
-    db.commit()
     assert cursor.lastrowid is not None
     return cursor.lastrowid
 
@@ -33,4 +34,17 @@ def mark_used(db: sqlite3.Connection, token: str) -> None:
         "UPDATE magic_links SET used = 1 WHERE token = ?",
         (token,),
     )
-    db.commit()
+
+
+def purge(db: sqlite3.Connection, *, limit: int) -> int:
+    """Delete up to ``limit`` used or expired magic links; returns how many went."""
+    cursor = db.execute(
+        f"""DELETE FROM magic_links WHERE id IN (
+               SELECT id FROM magic_links WHERE used = 1
+               UNION
+               SELECT id FROM magic_links WHERE expires_at <= {NOW_ISO}
+               LIMIT ?
+           )""",
+        (limit,),
+    )
+    return cursor.rowcount
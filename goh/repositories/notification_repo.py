@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import json
+import os
 import sqlite3
+import time
+from collections.abc import Sequence
+from typing import Any
 
+from goh.cache.service_cache import invalidate
+from goh.db.transaction import on_commit
 from goh.domain.entities.notification import Notification
+from goh.realtime.bus import bus
+from goh.repositories import counter_repo
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
+
+# Maintained here in the write transaction; deletes of unread rows adjust it by trigger
+_UNREAD = "unread_notifications"
+
+# Actor names kept for a coalesced title; the rest are summarised as "N others"
+_TITLE_ACTORS = 2
 
 
 def create(
@@ -17,47 +33,227 @@ def create(
     link: str | None = None,
     source_user_id: int | None = None,
 ) -> Notification:
-    cursor = db.execute(
+    row = db.execute(
         """INSERT INTO notifications (user_id, type, title, body, link, source_user_id)
-           VALUES (?, ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?, ?) RETURNING *""",
         (user_id, type, title, body, link, source_user_id),
-    )
-    db.commit()
-    notif_id = cursor.lastrowid
-    row = db.execute("SELECT * FROM notifications WHERE id = ?", (notif_id,)).fetchone()
+    ).fetchone()
     assert row is not None
-    return Notification.from_row(row)
+    notification = Notification.from_row(row)
+    unread = counter_repo.add(db, "user", user_id, _UNREAD, 1)
+    _publish(db, user_id, "notification", {
+        "notification": notification.to_dict(),
+        "unread": unread,
+    })
+    return notification
 
 
-def list_for_user(
-    db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
+def create_coalesced(
+    db: sqlite3.Connection,
+    *,
+    user_id: int,
+    type: str,
+    group_key: str,
+    actor: str,
+    action: str,
+    link: str | None = None,
+    source_user_id: int | None = None,
+) -> Notification:
+    """Create "<actor> <action>", or fold it into the user's unread one for ``group_key``.
+
+    Folding bumps the existing notification to the top with a title such as
+    "Bo, Al and 3 others started following you"; the unread count is unchanged.
+    """
+    existing = db.execute(
+        """SELECT id, actors, actor_count FROM notifications
+           WHERE user_id = ? AND group_key = ? AND is_read = 0
+           ORDER BY id DESC LIMIT 1""",
+        (user_id, group_key),
+    ).fetchone()
+    if existing is None:
+        row = db.execute(
+            """INSERT INTO notifications
+               (user_id, type, title, link, source_user_id, group_key, actors)
+               VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING *""",
+            (user_id, type, f"{actor} {action}", link, source_user_id, group_key,
+             json.dumps([actor])),
+        ).fetchone()
+        unread = counter_repo.add(db, "user", user_id, _UNREAD, 1)
+    else:
+        actors = [actor, *json.loads(existing["actors"] or "[]")][:_TITLE_ACTORS]
+        count = existing["actor_count"] + 1
+        row = db.execute(
+            """UPDATE notifications
+               SET title = ?, actors = ?, actor_count = ?, source_user_id = ?,
+                   created_at = datetime('now')
+               WHERE id = ? RETURNING *""",
+            (f"{_actor_summary(actors, count)} {action}", json.dumps(actors), count,
+             source_user_id, existing["id"]),
+        ).fetchone()
+        unread = count_unread(db, user_id)
+    assert row is not None
+    notification = Notification.from_row(row)
+    _publish(db, user_id, "notification", {
+        "notification": notification.to_dict(),
+        "unread": unread,
+    })
+    return notification
+
+
+def _actor_summary(actors: list[str], count: int) -> str:
+    """"A", "A and B", "A, B and 1 other", "A, B and 7 others"."""
+    if count == 1:
+        return actors[0]
+    if count == 2:
+        return f"{actors[0]} and {actors[1]}"
+    others = count - len(actors)
+    return f"{', '.join(actors)} and {others} other{'s' if others > 1 else ''}"
+
+
+def create_many(
+    db: sqlite3.Connection,
+    user_ids: Sequence[int],
+    *,
+    type: str,
+    title: str,
+    body: str = "",
+    link: str | None = None,
+    source_user_id: int | None = None,
 ) -> list[Notification]:
+    """Create the same notification for every recipient with one INSERT ... SELECT.
+
+    ``user_ids`` must be distinct; IDs of users that no longer exist are skipped.
+    """
+    if not user_ids:
+        return []
     rows = db.execute(
-        "SELECT * FROM notifications WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        (user_id, limit, offset),
+        """INSERT INTO notifications (user_id, type, title, body, link, source_user_id)
+           SELECT u.id, ?, ?, ?, ?, ? FROM json_each(?) j JOIN users u ON u.id = j.value
+           RETURNING *""",
+        (type, title, body, link, source_user_id, json.dumps(list(user_ids))),
     ).fetchall()
+    notifications = [Notification.from_row(r) for r in rows]
+    recipients = json.dumps([n.user_id for n in notifications])
+
+    unread = {
+        r["entity_id"]: r["value"]
+        for r in db.execute(
+            """INSERT INTO counters (entity, entity_id, name, value)
+               SELECT 'user', value, ?, 1 FROM json_each(?) WHERE true
+               ON CONFLICT DO UPDATE SET value = value + 1
+               RETURNING entity_id, value""",
+            (_UNREAD, recipients),
+        ).fetchall()
+    }
+    _publish_many(db, [
+        (n.user_id, "notification", {"notification": n.to_dict(), "unread": unread[n.user_id]})
+        for n in notifications
+    ])
+    return notifications
+
+
+def list_for_user(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
+) -> list[Notification]:
+    rows = _user_rows(db, user_id, limit, offset=offset)
     return [Notification.from_row(r) for r in rows]
 
 
+def list_for_user_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: Cursor | None = None
+) -> Page[Notification]:
+    rows = _user_rows(db, user_id, limit + 1, cursor=cursor)
+    return build_page(rows, limit, Notification.from_row)
+
+
+def _user_rows(
+    db: sqlite3.Connection, user_id: int, limit: int,
+    *, offset: int = 0, cursor: Cursor | None = None,
+) -> list[dict]:
+    after, params = keyset_condition("created_at, id", cursor)
+    return db.execute(
+        f"""SELECT * FROM notifications WHERE user_id = ? AND {after}
+            ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?""",
+        (user_id, *params, limit, offset),
+    ).fetchall()
+
+
 def count_unread(db: sqlite3.Connection, user_id: int) -> int:
-    row = db.execute(
-        "SELECT COUNT(*) as cnt FROM notifications WHERE user_id = ? AND is_read = 0",
-        (user_id,),
-    ).fetchone()
-    return row["cnt"] if row else 0
+    return counter_repo.get(db, "user", user_id, _UNREAD)
 
 
 def mark_read(db: sqlite3.Connection, notification_id: int, user_id: int) -> None:
-    db.execute(
-        "UPDATE notifications SET is_read = 1 WHERE id = ? AND user_id = ?",
+    cursor = db.execute(
+        "UPDATE notifications SET is_read = 1 WHERE id = ? AND user_id = ? AND is_read = 0",
         (notification_id, user_id),
     )
-    db.commit()
+    if cursor.rowcount:
+        unread = counter_repo.add(db, "user", user_id, _UNREAD, -cursor.rowcount)
+        _publish(db, user_id, "unread", {"unread": unread})
 
 
 def mark_all_read(db: sqlite3.Connection, user_id: int) -> None:
-    db.execute(
+    cursor = db.execute(
         "UPDATE notifications SET is_read = 1 WHERE user_id = ? AND is_read = 0",
         (user_id,),
     )
-    db.commit()
+    if cursor.rowcount:
+        counter_repo.reset(db, "user", user_id, _UNREAD)
+        _publish(db, user_id, "unread", {"unread": 0})
+
+
+def purge_read(db: sqlite3.Connection, *, older_than_days: int, limit: int) -> int:
+    """Delete up to ``limit`` read notifications older than the TTL. Returns the count."""
+    cursor = db.execute(
+        """DELETE FROM notifications WHERE id IN (
+               SELECT id FROM notifications
+               WHERE is_read = 1 AND created_at < datetime('now', ?)
+               LIMIT ?
+           )""",
+        (f"-{older_than_days} days", limit),
+    )
+    return cursor.rowcount
+
+
+def purge_changes(db: sqlite3.Connection, *, older_than_seconds: float) -> int:
+    """Delete stream events every relay has long since seen."""
+    cursor = db.execute(
+        "DELETE FROM notification_changes WHERE created_at < ?",
+        (time.time() - older_than_seconds,),
+    )
+    return cursor.rowcount
+
+
+def _publish(db: sqlite3.Connection, user_id: int, event: str, data: dict[str, Any]) -> None:
+    _publish_many(db, [(user_id, event, data)])
+
+
+def _publish_many(
+    db: sqlite3.Connection, events: Sequence[tuple[int, str, dict[str, Any]]]
+) -> None:
+    """Record stream events for other workers and publish them locally on commit.
+
+    Every unread-count change goes through here, so it also drops the cached counts.
+    """
+    now = time.time()
+    pid = os.getpid()
+    messages = [
+        (user_id, {"event": event, "data": data, "published_at": now})
+        for user_id, event, data in events
+    ]
+    db.executemany(
+        """INSERT INTO notification_changes (user_id, origin, payload, created_at)
+           VALUES (?, ?, ?, ?)""",
+        [(user_id, pid, json.dumps(message), now) for user_id, message in messages],
+    )
+
+    def publish() -> None:
+        for user_id, message in messages:
+            bus.publish(user_id, message)
+
+    on_commit(db, publish)
+    invalidate(db, *(unread_cache_key(user_id) for user_id, _ in messages))
+
+
+def unread_cache_key(user_id: int) -> str:
+    return f"notifications.unread:{user_id}"
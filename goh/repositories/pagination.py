@@ -0,0 +1,82 @@
+"""Keyset (cursor) pagination — opaque (sort key, id) cursors and result pages."""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from goh.domain.exceptions import ValidationError
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# Decoded cursor: (sort key of the last row seen, id of the last row seen)
+Cursor = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    def map(self, fn: Callable[[T], U]) -> Page[U]:
+        return Page(items=[fn(item) for item in self.items], next_cursor=self.next_cursor)
+
+    def to_dict(self) -> dict:
+        return {"items": self.items, "next_cursor": self.next_cursor}
+
+
+def encode_cursor(key: str, row_id: int) -> str:
+    raw = json.dumps([key, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None) -> Cursor | None:
+    """Decode an opaque cursor. Empty/None means "first page"."""
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(key, str) or not isinstance(row_id, int):
+            raise TypeError
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor") from e
+    return key, row_id
+
+
+def keyset_condition(columns: str, cursor: Cursor | None) -> tuple[str, tuple]:
+    """SQL condition selecting rows strictly after the cursor in DESC order.
+
+    ``columns`` is the row-value pair used in ORDER BY, e.g. ``"p.created_at, p.id"``.
+    """
+    if cursor is None:
+        return "1", ()
+    return f"({columns}) < (?, ?)", cursor
+
+
+def build_page(
+    rows: Sequence[Any],
+    limit: int,
+    factory: Callable[[Any], T],
+    *,
+    key: str | int = "created_at",
+    id_key: str | int = "id",
+) -> Page[T]:
+    """Build a page from ``limit + 1`` fetched rows; the extra row signals more data.
+
+    Rows may be dicts (``key``/``id_key`` are column names) or raw tuples
+    (``key``/``id_key`` are positions).
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(last[key], last[id_key])
+    return Page(items=[factory(r) for r in rows], next_cursor=next_cursor)
@@ -5,12 +5,21 @@ from __future__ import annotations
 import sqlite3
 
 from goh.domain.entities.post import Post
+from goh.repositories import user_repo
+from goh.repositories.fulltext import match_expression
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
 
-_POST_JOIN = """
-    SELECT p.*, u.username as author_username,
-           u.display_name as author_display_name, u.avatar as author_avatar
-    FROM posts p JOIN users u ON p.author_id = u.id
+# Selected in Post field order, which its JSON shape follows, so raw tuples map
+# onto Post.json_from_tuple
+_POST_COLUMNS = """
+    p.id, p.author_id, p.content, p.post_type, p.image_url, p.created_at, p.updated_at,
+    u.username as author_username, u.display_name as author_display_name,
+    u.avatar as author_avatar
 """
+_POST_JOIN = f"SELECT {_POST_COLUMNS} FROM posts p JOIN users u ON p.author_id = u.id"
+
+# Tuple positions of the keyset columns in raw rows
+_ID, _CREATED_AT = 0, 5
 
 
 def create(
@@ -21,15 +30,18 @@ def create(
     post_type: str = "text",
     image_url: str | None = None,
 ) -> Post:
-    cursor = db.execute(
-        "INSERT INTO posts (author_id, content, post_type, image_url) VALUES (?, ?, ?, ?)",
+    row = db.execute(
+        """INSERT INTO posts (author_id, content, post_type, image_url)
+           VALUES (?, ?, ?, ?) RETURNING *""",
         (author_id, content, post_type, image_url),
-    )
-    db.commit()
-    post_id = cursor.lastrowid
-    post = find_by_id(db, post_id)
-    assert post is not None
-    return post
+    ).fetchone()
+    assert row is not None
+    author = user_repo.get_summary(db, author_id)
+    if author:
+        row["author_username"] = author["username"]
+        row["author_display_name"] = author["display_name"]
+        row["author_avatar"] = author["avatar"]
+    return Post.from_row(row)
 
 
 def find_by_id(db: sqlite3.Connection, post_id: int | None) -> Post | None:
@@ -40,38 +52,216 @@ def find_by_id(db: sqlite3.Connection, post_id: int | None) -> Post | None:
 def list_by_author(
     db: sqlite3.Connection, author_id: int, limit: int = 50, offset: int = 0
 ) -> list[Post]:
-    rows = db.execute(
-        f"{_POST_JOIN} WHERE p.author_id = ? ORDER BY p.created_at DESC LIMIT ? OFFSET ?",
-        (author_id, limit, offset),
-    ).fetchall()
+    rows = _author_rows(db, author_id, limit, offset=offset)
     return [Post.from_row(r) for r in rows]
 
 
+def list_by_author_json(
+    db: sqlite3.Connection, author_id: int, limit: int = 50, offset: int = 0
+) -> list[dict]:
+    rows = _author_rows(db, author_id, limit, offset=offset, raw=True)
+    return [Post.json_from_tuple(r) for r in rows]
+
+
+def list_by_author_page(
+    db: sqlite3.Connection, author_id: int, limit: int = 50, cursor: Cursor | None = None
+) -> Page[Post]:
+    rows = _author_rows(db, author_id, limit + 1, cursor=cursor)
+    return build_page(rows, limit, Post.from_row)
+
+
+def list_by_author_page_json(
+    db: sqlite3.Connection, author_id: int, limit: int = 50, cursor: Cursor | None = None
+) -> Page[dict]:
+    rows = _author_rows(db, author_id, limit + 1, cursor=cursor, raw=True)
+    return build_page(rows, limit, Post.json_from_tuple, key=_CREATED_AT, id_key=_ID)
+
+
+def _author_rows(
+    db: sqlite3.Connection, author_id: int, limit: int,
+    *, offset: int = 0, cursor: Cursor | None = None, raw: bool = False,
+) -> list:
+    after, params = keyset_condition("p.created_at, p.id", cursor)
+    return _fetch(
+        db,
+        f"""{_POST_JOIN} WHERE p.author_id = ? AND {after}
+        ORDER BY p.created_at DESC, p.id DESC LIMIT ? OFFSET ?""",
+        (author_id, *params, limit, offset),
+        raw=raw,
+    )
+
+
 def feed(
-    db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
+    db: sqlite3.Connection,
+    user_id: int,
+    limit: int = 50,
+    offset: int = 0,
+    *,
+    merged_author_ids: list[int] | None = None,
 ) -> list[Post]:
-    """Get posts from followed users + own posts, sorted by newest."""
-    rows = db.execute(
+    """Get posts from followed users + own posts, sorted by newest.
+
+    Reads the materialized inbox (feed_items). Posts by high-follower authors are
+    not fanned out; pass their IDs as ``merged_author_ids`` to merge them in.
+    """
+    rows = _feed_rows(db, user_id, limit, merged_author_ids, offset=offset)
+    return [Post.from_row(r) for r in rows]
+
+
+def feed_json(
+    db: sqlite3.Connection,
+    user_id: int,
+    limit: int = 50,
+    offset: int = 0,
+    *,
+    merged_author_ids: list[int] | None = None,
+) -> list[dict]:
+    rows = _feed_rows(db, user_id, limit, merged_author_ids, offset=offset, raw=True)
+    return [Post.json_from_tuple(r) for r in rows]
+
+
+def feed_page(
+    db: sqlite3.Connection,
+    user_id: int,
+    limit: int = 50,
+    cursor: Cursor | None = None,
+    *,
+    merged_author_ids: list[int] | None = None,
+) -> Page[Post]:
+    rows = _feed_rows(db, user_id, limit + 1, merged_author_ids, cursor=cursor)
+    return build_page(rows, limit, Post.from_row)
+
+
+def feed_page_json(
+    db: sqlite3.Connection,
+    user_id: int,
+    limit: int = 50,
+    cursor: Cursor | None = None,
+    *,
+    merged_author_ids: list[int] | None = None,
+) -> Page[dict]:
+    rows = _feed_rows(db, user_id, limit + 1, merged_author_ids, cursor=cursor, raw=True)
+    return build_page(rows, limit, Post.json_from_tuple, key=_CREATED_AT, id_key=_ID)
+
+
+def _feed_rows(
+    db: sqlite3.Connection,
+    user_id: int,
+    limit: int,
+    merged_author_ids: list[int] | None,
+    *,
+    offset: int = 0,
+    cursor: Cursor | None = None,
+    raw: bool = False,
+) -> list:
+    if not merged_author_ids:
+        after, params = keyset_condition("fi.created_at, fi.post_id", cursor)
+        return _fetch(
+            db,
+            f"""SELECT {_POST_COLUMNS}
+                FROM feed_items fi
+                JOIN posts p ON p.id = fi.post_id
+                JOIN users u ON p.author_id = u.id
+                WHERE fi.user_id = ? AND {after}
+                ORDER BY fi.created_at DESC, fi.post_id DESC LIMIT ? OFFSET ?""",
+            (user_id, *params, limit, offset),
+            raw=raw,
+        )
+
+    # Top-N of the union is contained in the union of each side's top-N
+    window = limit + offset
+    inbox_after, inbox_params = keyset_condition("created_at, post_id", cursor)
+    posts_after, posts_params = keyset_condition("created_at, id", cursor)
+    placeholders = ", ".join("?" * len(merged_author_ids))
+    return _fetch(
+        db,
         f"""{_POST_JOIN}
-        WHERE p.author_id IN (
-            SELECT following_id FROM follows WHERE follower_id = ?
-            UNION SELECT ?
+        WHERE p.id IN (
+            SELECT post_id FROM (
+                SELECT post_id FROM feed_items WHERE user_id = ? AND {inbox_after}
+                ORDER BY created_at DESC, post_id DESC LIMIT ?
+            )
+            UNION
+            SELECT id FROM (
+                SELECT id FROM posts WHERE author_id IN ({placeholders}) AND {posts_after}
+                ORDER BY created_at DESC, id DESC LIMIT ?
+            )
         )
-        ORDER BY p.created_at DESC LIMIT ? OFFSET ?""",
-        (user_id, user_id, limit, offset),
-    ).fetchall()
-    return [Post.from_row(r) for r in rows]
+        ORDER BY p.created_at DESC, p.id DESC LIMIT ? OFFSET ?""",
+        (user_id, *inbox_params, window, *merged_author_ids, *posts_params, window,
+         limit, offset),
+        raw=raw,
+    )
 
 
 def timeline(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[Post]:
     """Global timeline — all posts, newest first."""
+    rows = _timeline_rows(db, limit, offset=offset)
+    return [Post.from_row(r) for r in rows]
+
+
+def timeline_json(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[dict]:
+    rows = _timeline_rows(db, limit, offset=offset, raw=True)
+    return [Post.json_from_tuple(r) for r in rows]
+
+
+def timeline_page(
+    db: sqlite3.Connection, limit: int = 50, cursor: Cursor | None = None
+) -> Page[Post]:
+    """Global timeline, keyset-paginated by (created_at, id)."""
+    rows = _timeline_rows(db, limit + 1, cursor=cursor)
+    return build_page(rows, limit, Post.from_row)
+
+
+def timeline_page_json(
+    db: sqlite3.Connection, limit: int = 50, cursor: Cursor | None = None
+) -> Page[dict]:
+    rows = _timeline_rows(db, limit + 1, cursor=cursor, raw=True)
+    return build_page(rows, limit, Post.json_from_tuple, key=_CREATED_AT, id_key=_ID)
+
+
+def timeline_since_json(db: sqlite3.Connection, after_id: int, limit: int) -> list[dict]:
+    """Up to ``limit`` posts with ids above ``after_id``, newest first."""
+    rows = _fetch(
+        db, f"{_POST_JOIN} WHERE p.id > ? ORDER BY p.id DESC LIMIT ?", (after_id, limit), raw=True
+    )
+    return [Post.json_from_tuple(r) for r in rows]
+
+
+def _timeline_rows(
+    db: sqlite3.Connection, limit: int,
+    *, offset: int = 0, cursor: Cursor | None = None, raw: bool = False,
+) -> list:
+    after, params = keyset_condition("p.created_at, p.id", cursor)
+    return _fetch(
+        db,
+        f"{_POST_JOIN} WHERE {after} ORDER BY p.created_at DESC, p.id DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+        raw=raw,
+    )
+
+
+def search(db: sqlite3.Connection, query: str, limit: int = 20) -> list[Post]:
+    """Posts whose content has words starting with the query's, best match first."""
+    expression = match_expression(query)
+    if expression is None:
+        return []
     rows = db.execute(
-        f"{_POST_JOIN} ORDER BY p.created_at DESC LIMIT ? OFFSET ?",
-        (limit, offset),
+        f"""{_POST_JOIN} JOIN posts_fts ON posts_fts.rowid = p.id
+            WHERE posts_fts MATCH ? ORDER BY bm25(posts_fts), p.id DESC LIMIT ?""",
+        (expression, limit),
     ).fetchall()
     return [Post.from_row(r) for r in rows]
 
 
+def _fetch(db: sqlite3.Connection, sql: str, params: tuple, *, raw: bool = False) -> list:
+    """Run a listing query. ``raw`` returns plain tuples for the JSON fast path."""
+    if not raw:
+        return db.execute(sql, params).fetchall()
+    cursor = db.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchall()
+
+
 def delete(db: sqlite3.Connection, post_id: int) -> None:
     db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
-    db.commit()
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import sqlite3
 
+# Current UTC time in the isoformat() form the auth service writes to expires_at, so
+# expiry compares as text against idx_sessions_expires_at
+NOW_ISO = "strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')"
+
 
 def create(
     db: sqlite3.Connection,
@@ -19,14 +23,15 @@ def create(
            VALUES (?, ?, ?, ?, ?)""",
         (user_id, refresh_token, expires_at, user_agent, ip_address),
     )
-    db.commit()
     assert cursor.lastrowid is not None
     return cursor.lastrowid
 
 
 def find_by_refresh_token(db: sqlite3.Connection, refresh_token: str) -> dict | None:
+    """The live session for ``refresh_token``; revoked and expired ones are not returned."""
     return db.execute(
-        "SELECT * FROM sessions WHERE refresh_token = ? AND revoked = 0",
+        f"""SELECT * FROM sessions
+            WHERE refresh_token = ? AND revoked = 0 AND expires_at > {NOW_ISO}""",
         (refresh_token,),
     ).fetchone()
 
@@ -36,7 +41,6 @@ def revoke(db: sqlite3.Connection, refresh_token: str) -> None:
         "UPDATE sessions SET revoked = 1 WHERE refresh_token = ?",
         (refresh_token,),
     )
-    db.commit()
 
 
 def revoke_all_for_user(db: sqlite3.Connection, user_id: int) -> None:
@@ -44,4 +48,17 @@ def revoke_all_for_user(db: sqlite3.Connection, user_id: int) -> None:
         "UPDATE sessions SET revoked = 1 WHERE user_id = ?",
         (user_id,),
     )
-    db.commit()
+
+
+def purge(db: sqlite3.Connection, *, limit: int) -> int:
+    """Delete up to ``limit`` revoked or expired sessions; returns how many went."""
+    cursor = db.execute(
+        f"""DELETE FROM sessions WHERE id IN (
+               SELECT id FROM sessions WHERE revoked = 1
+               UNION
+               SELECT id FROM sessions WHERE expires_at <= {NOW_ISO}
+               LIMIT ?
+           )""",
+        (limit,),
+    )
+    return cursor.rowcount
@@ -3,8 +3,51 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 
+from goh.cache.completion import MAX_COMPLETIONS, CompletionIndex
+from goh.db.transaction import on_commit
 from goh.domain.entities.user import User
+from goh.repositories.fulltext import match_expression
+from goh.repositories.pagination import Cursor, Page, build_page, keyset_condition
+
+# Per-process cache of the denormalised user fields that other entities carry
+# (author/organizer username, display name, avatar). The TTL bounds staleness
+# when another worker process updates a profile.
+SUMMARY_CACHE_SIZE = 4096
+SUMMARY_CACHE_TTL_SECONDS = 60.0
+
+_summaries: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+_summaries_lock = threading.Lock()
+
+
+# Per-process @-mention completion index. Local writes apply on commit; writes
+# from other workers arrive with the next refresh, and a periodic full reload
+# picks up follower counts, which change without touching the users row.
+COMPLETION_REFRESH_SECONDS = 5.0
+COMPLETION_RELOAD_SECONDS = 600.0
+
+_completion = CompletionIndex()
+_completion_refresh_lock = threading.Lock()
+
+_COMPLETION_SELECT = """
+    SELECT u.id, u.username, u.display_name, u.avatar, COALESCE(c.value, 0), u.updated_at
+    FROM users u LEFT JOIN counters c
+      ON c.entity = 'user' AND c.entity_id = u.id AND c.name = 'followers'
+"""
+
+
+def configure_summary_cache(*, ttl_seconds: float) -> None:
+    global SUMMARY_CACHE_TTL_SECONDS
+    SUMMARY_CACHE_TTL_SECONDS = ttl_seconds
+
+
+def configure_completion(*, refresh_seconds: float, reload_seconds: float) -> None:
+    global COMPLETION_REFRESH_SECONDS, COMPLETION_RELOAD_SECONDS
+    COMPLETION_REFRESH_SECONDS = refresh_seconds
+    COMPLETION_RELOAD_SECONDS = reload_seconds
 
 
 def find_by_id(db: sqlite3.Connection, user_id: int) -> User | None:
@@ -27,6 +70,13 @@ def get_password_hash(db: sqlite3.Connection, user_id: int) -> str | None:
     return row["password_hash"] if row else None
 
 
+def set_password_hash(db: sqlite3.Connection, user_id: int, password_hash: str) -> None:
+    db.execute(
+        "UPDATE users SET password_hash = ?, updated_at = datetime('now') WHERE id = ?",
+        (password_hash, user_id),
+    )
+
+
 def create(
     db: sqlite3.Connection,
     *,
@@ -36,17 +86,58 @@ def create(
     display_name: str,
     role: str = "player",
 ) -> User:
-    cursor = db.execute(
+    row = db.execute(
         """INSERT INTO users (username, email, password_hash, display_name, role)
-           VALUES (?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?) RETURNING *""",
         (username, email, password_hash, display_name, role),
-    )
-    db.commit()
-    user_id = cursor.lastrowid
-    assert user_id is not None
-    user = find_by_id(db, user_id)
-    assert user is not None
-    return user
+    ).fetchone()
+    assert row is not None
+    # Only once committed: a rolled-back rowid can be handed to the next user
+    def remember() -> None:
+        _remember_summary(row)
+
+    on_commit(db, remember)
+    completion_row = (row["id"], row["username"], row["display_name"], row["avatar"], 0)
+    on_commit(db, lambda: _completion.upsert(completion_row))
+    return User.from_row(row)
+
+
+def get_summary(db: sqlite3.Connection, user_id: int) -> dict | None:
+    """Username, display name and avatar for a user, served from a small LRU."""
+    now = time.monotonic()
+    with _summaries_lock:
+        cached = _summaries.get(user_id)
+        if cached is not None and cached[0] > now:
+            _summaries.move_to_end(user_id)
+            return cached[1]
+    row = db.execute(
+        "SELECT id, username, display_name, avatar FROM users WHERE id = ?", (user_id,)
+    ).fetchone()
+    return _remember_summary(row) if row else None
+
+
+def invalidate_summary(user_id: int) -> None:
+    with _summaries_lock:
+        _summaries.pop(user_id, None)
+
+
+def clear_summary_cache() -> None:
+    with _summaries_lock:
+        _summaries.clear()
+
+
+def _remember_summary(row: dict) -> dict:
+    summary = {
+        "username": row["username"],
+        "display_name": row["display_name"],
+        "avatar": row.get("avatar"),
+    }
+    with _summaries_lock:
+        _summaries[row["id"]] = (time.monotonic() + SUMMARY_CACHE_TTL_SECONDS, summary)
+        _summaries.move_to_end(row["id"])
+        while len(_summaries) > SUMMARY_CACHE_SIZE:
+            _summaries.popitem(last=False)
+    return summary
 
 
 def update_profile(
@@ -73,7 +164,11 @@ def update_profile(
     updates.append("updated_at = datetime('now')")
     params.append(user_id)
     db.execute(f"UPDATE users SET {', '.join(updates)} WHERE id = ?", params)
-    db.commit()
+    # After commit, so a concurrent reader cannot re-cache the old profile
+    on_commit(db, lambda: invalidate_summary(user_id))
+    on_commit(
+        db, lambda: _completion.update(user_id, display_name=display_name, avatar=avatar)
+    )
 
 
 def set_role(db: sqlite3.Connection, user_id: int, role: str) -> None:
@@ -81,7 +176,6 @@ def set_role(db: sqlite3.Connection, user_id: int, role: str) -> None:
         "UPDATE users SET role = ?, updated_at = datetime('now') WHERE id = ?",
         (role, user_id),
     )
-    db.commit()
 
 
 def verify_email(db: sqlite3.Connection, user_id: int) -> None:
@@ -89,23 +183,94 @@ def verify_email(db: sqlite3.Connection, user_id: int) -> None:
         "UPDATE users SET email_verified = 1, updated_at = datetime('now') WHERE id = ?",
         (user_id,),
     )
-    db.commit()
 
 
 def search(db: sqlite3.Connection, query: str, limit: int = 20) -> list[User]:
-    pattern = f"%{query}%"
+    """Users whose username or display name has words starting with the query's, best first."""
+    expression = match_expression(query)
+    if expression is None:
+        return []
     rows = db.execute(
-        """SELECT * FROM users
-           WHERE username LIKE ? OR display_name LIKE ?
-           ORDER BY username LIMIT ?""",
-        (pattern, pattern, limit),
+        """SELECT users.* FROM users_fts JOIN users ON users.id = users_fts.rowid
+           WHERE users_fts MATCH ?
+           ORDER BY bm25(users_fts, 2.0, 1.0), users.id LIMIT ?""",
+        (expression, limit),
     ).fetchall()
     return [User.from_row(r) for r in rows]
 
 
+def complete(db: sqlite3.Connection, prefix: str, limit: int = MAX_COMPLETIONS) -> list[dict]:
+    """Users whose username or display-name words start with ``prefix``, most followed first.
+
+    Served from the in-memory index, refreshed first when it is due.
+    """
+    loaded = bool(_completion.loaded_at)
+    due = not loaded or time.monotonic() - _completion.refreshed_at >= COMPLETION_REFRESH_SECONDS
+    # One thread refreshes; the others keep answering from the current index
+    if due and _completion_refresh_lock.acquire(blocking=not loaded):
+        try:
+            _refresh_completion_if_due(db)
+        finally:
+            _completion_refresh_lock.release()
+    return _completion.complete(prefix, limit)
+
+
+def load_completion_index(db: sqlite3.Connection) -> int:
+    """(Re)build the completion index from every user; returns the number indexed."""
+    _completion.load(_completion_rows(db))
+    _completion.loaded_at = _completion.refreshed_at = time.monotonic()
+    return len(_completion)
+
+
+def clear_completion_index() -> None:
+    _completion.clear()
+
+
+def _refresh_completion_if_due(db: sqlite3.Connection) -> None:
+    now = time.monotonic()
+    if not _completion.loaded_at or now - _completion.loaded_at >= COMPLETION_RELOAD_SECONDS:
+        load_completion_index(db)
+    elif now - _completion.refreshed_at >= COMPLETION_REFRESH_SECONDS:
+        _refresh_completion_index(db)
+
+
+def _refresh_completion_index(db: sqlite3.Connection) -> None:
+    rows = _completion_rows(
+        db, "WHERE u.id > ? OR u.updated_at >= ?", (_completion.max_id, _completion.watermark)
+    )
+    for row in rows:
+        _completion.upsert(row)
+    _completion.refreshed_at = time.monotonic()
+
+
+def _completion_rows(db: sqlite3.Connection, where: str = "", params: tuple = ()) -> list:
+    """Index rows from ``_COMPLETION_SELECT``, advancing the refresh watermarks."""
+    cursor = db.cursor()
+    cursor.row_factory = None
+    rows = cursor.execute(f"{_COMPLETION_SELECT} {where}", params).fetchall()
+    for row in rows:
+        _completion.max_id = max(_completion.max_id, row[0])
+        _completion.watermark = max(_completion.watermark, row[5])
+    return [row[:5] for row in rows]
+
+
 def list_all(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[User]:
-    rows = db.execute(
-        "SELECT * FROM users ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        (limit, offset),
-    ).fetchall()
+    rows = _all_rows(db, limit, offset=offset)
     return [User.from_row(r) for r in rows]
+
+
+def list_all_page(
+    db: sqlite3.Connection, limit: int = 50, cursor: Cursor | None = None
+) -> Page[User]:
+    rows = _all_rows(db, limit + 1, cursor=cursor)
+    return build_page(rows, limit, User.from_row)
+
+
+def _all_rows(
+    db: sqlite3.Connection, limit: int, *, offset: int = 0, cursor: Cursor | None = None
+) -> list[dict]:
+    after, params = keyset_condition("created_at, id", cursor)
+    return db.execute(
+        f"SELECT * FROM users WHERE {after} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    ).fetchall()
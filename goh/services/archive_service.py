@@ -6,6 +6,8 @@ import sqlite3
 
 import structlog
 
+from goh.cache.service_cache import invalidate
+from goh.db.transaction import transaction
 from goh.observability.timing import timed
 from goh.repositories import campaign_repo
 
@@ -15,11 +17,13 @@ logger = structlog.get_logger(__name__)
 @timed
 def archive_completed_campaigns(db: sqlite3.Connection) -> list[int]:
     """Archive all campaigns with status 'completed'. Returns list of archived campaign IDs."""
-    campaigns = campaign_repo.list_all(db, limit=1000)
-    archived: list[int] = []
-    for c in campaigns:
-        if c.status == "completed":
-            campaign_repo.update_status(db, c.id, "archived")
-            archived.append(c.id)
-            logger.info("archive.campaign_archived", campaign_id=c.id)
-    return archived
+    with transaction(db):
+        campaigns = campaign_repo.list_all(db, limit=1000)
+        archived: list[int] = []
+        for c in campaigns:
+            if c.status == "completed":
+                campaign_repo.update_status(db, c.id, "archived")
+                archived.append(c.id)
+                logger.info("archive.campaign_archived", campaign_id=c.id)
+        invalidate(db, *(f"campaign:{cid}" for cid in archived))
+        return archived
@@ -6,10 +6,11 @@ import secrets
 import sqlite3
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 import jwt
 import structlog
 
+from goh.auth.hasher import calibrate_rounds, get_hasher
+from goh.db.transaction import transaction
 from goh.domain.entities.user import User
 from goh.domain.exceptions import (
     DuplicateError,
@@ -21,7 +22,7 @@ from goh.domain.exceptions import (
 )
 from goh.observability.metrics import metrics
 from goh.observability.timing import timed
-from goh.repositories import audit_repo, magic_link_repo, session_repo, user_repo
+from goh.repositories import audit_repo, counter_repo, magic_link_repo, session_repo, user_repo
 
 logger = structlog.get_logger(__name__)
 
@@ -29,14 +30,15 @@ logger = structlog.get_logger(__name__)
 DEFAULT_ACCESS_EXPIRES_MINUTES = 30
 DEFAULT_REFRESH_EXPIRES_DAYS = 30
 DEFAULT_MAGIC_LINK_EXPIRES_MINUTES = 15
+DEFAULT_PRUNE_BATCH_SIZE = 1000
 
 
 def _hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return get_hasher().hash(password)
 
 
 def _verify_password(password: str, password_hash: str) -> bool:
-    return bcrypt.checkpw(password.encode(), password_hash.encode())
+    return get_hasher().verify(password, password_hash)
 
 
 def _create_access_token(
@@ -91,33 +93,32 @@ def register(
     if user_repo.find_by_email(db, email):
         raise DuplicateError("User", "email", email)
 
-    # Create user
+    # Hash and mint outside the transaction, which holds the process's writer
     password_hash = _hash_password(password)
-    user = user_repo.create(
-        db,
-        username=username,
-        email=email,
-        password_hash=password_hash,
-        display_name=display_name or username,
-    )
-
-    # Create tokens
-    access_token = _create_access_token(user, jwt_secret, access_expires_minutes)
     refresh_token = _create_refresh_token()
     refresh_expires = (
         datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
     ).isoformat()
 
-    session_repo.create(
-        db,
-        user_id=user.id,
-        refresh_token=refresh_token,
-        expires_at=refresh_expires,
-    )
-
-    audit_repo.log_action(
-        db, user_id=user.id, action="register", resource_type="user", resource_id=user.id
-    )
+    with transaction(db):
+        user = user_repo.create(
+            db,
+            username=username,
+            email=email,
+            password_hash=password_hash,
+            display_name=display_name or username,
+        )
+        session_repo.create(
+            db,
+            user_id=user.id,
+            refresh_token=refresh_token,
+            expires_at=refresh_expires,
+        )
+
+        audit_repo.log_action(
+            db, user_id=user.id, action="register", resource_type="user", resource_id=user.id
+        )
+    access_token = _create_access_token(user, jwt_secret, access_expires_minutes)
     metrics.increment("auth.register.success")
     logger.info("auth.register", user_id=user.id, username=username)
 
@@ -157,18 +158,25 @@ def login_password(
         datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
     ).isoformat()
 
-    session_repo.create(
-        db,
-        user_id=user.id,
-        refresh_token=refresh_token,
-        expires_at=refresh_expires,
-        user_agent=user_agent,
-        ip_address=ip_address,
-    )
-
-    audit_repo.log_action(
-        db, user_id=user.id, action="login_password", resource_type="session"
-    )
+    # Upgrade hashes made at a lower cost while the plain password is at hand
+    new_hash = _hash_password(password) if get_hasher().needs_rehash(pw_hash) else None
+
+    with transaction(db):
+        if new_hash is not None:
+            user_repo.set_password_hash(db, user.id, new_hash)
+            metrics.increment("auth.password.rehashed")
+        session_repo.create(
+            db,
+            user_id=user.id,
+            refresh_token=refresh_token,
+            expires_at=refresh_expires,
+            user_agent=user_agent,
+            ip_address=ip_address,
+        )
+
+        audit_repo.log_action(
+            db, user_id=user.id, action="login_password", resource_type="session"
+        )
     metrics.increment("auth.login.success")
     logger.info("auth.login_password", user_id=user.id)
 
@@ -194,11 +202,12 @@ def create_magic_link(
     token = secrets.token_urlsafe(48)
     expires_at = (datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)).isoformat()
 
-    magic_link_repo.create(db, user_id=user.id, token=token, expires_at=expires_at)
+    with transaction(db):
+        magic_link_repo.create(db, user_id=user.id, token=token, expires_at=expires_at)
 
-    audit_repo.log_action(
-        db, user_id=user.id, action="create_magic_link", resource_type="magic_link"
-    )
+        audit_repo.log_action(
+            db, user_id=user.id, action="create_magic_link", resource_type="magic_link"
+        )
     logger.info("auth.magic_link_created", user_id=user.id)
 
     return {"token": token, "expires_at": expires_at}
@@ -227,34 +236,35 @@ def login_magic_link(
         metrics.increment("auth.magic_link.failure")
         raise TokenExpiredError()
 
-    magic_link_repo.mark_used(db, token)
-
-    user = user_repo.find_by_id(db, link["user_id"])
-    if not user:
-        raise NotFoundError("User", link["user_id"])
-
-    # Verify email on first magic link login
-    if not user.email_verified:
-        user_repo.verify_email(db, user.id)
-        user = user_repo.find_by_id(db, user.id)
-        assert user is not None
-
-    access_token = _create_access_token(user, jwt_secret, access_expires_minutes)
-    refresh_token = _create_refresh_token()
-    refresh_expires = (
-        datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
-    ).isoformat()
-
-    session_repo.create(
-        db,
-        user_id=user.id,
-        refresh_token=refresh_token,
-        expires_at=refresh_expires,
-    )
-
-    audit_repo.log_action(
-        db, user_id=user.id, action="login_magic_link", resource_type="session"
-    )
+    with transaction(db):
+        magic_link_repo.mark_used(db, token)
+
+        user = user_repo.find_by_id(db, link["user_id"])
+        if not user:
+            raise NotFoundError("User", link["user_id"])
+
+        # Verify email on first magic link login
+        if not user.email_verified:
+            user_repo.verify_email(db, user.id)
+            user = user_repo.find_by_id(db, user.id)
+            assert user is not None
+
+        access_token = _create_access_token(user, jwt_secret, access_expires_minutes)
+        refresh_token = _create_refresh_token()
+        refresh_expires = (
+            datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
+        ).isoformat()
+
+        session_repo.create(
+            db,
+            user_id=user.id,
+            refresh_token=refresh_token,
+            expires_at=refresh_expires,
+        )
+
+        audit_repo.log_action(
+            db, user_id=user.id, action="login_magic_link", resource_type="session"
+        )
     metrics.increment("auth.magic_link.success")
     logger.info("auth.login_magic_link", user_id=user.id)
 
@@ -275,35 +285,31 @@ def refresh_tokens(
     refresh_expires_days: int = DEFAULT_REFRESH_EXPIRES_DAYS,
 ) -> dict:
     """Exchange a refresh token for new access + refresh tokens."""
-    session = session_repo.find_by_refresh_token(db, refresh_token)
-    if not session:
-        raise InvalidTokenError()
+    with transaction(db):
+        # Revoked and expired sessions are both filtered out in SQL
+        session = session_repo.find_by_refresh_token(db, refresh_token)
+        if not session:
+            raise InvalidTokenError()
 
-    expires_at = datetime.fromisoformat(session["expires_at"])
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
-    if datetime.now(timezone.utc) > expires_at:
-        raise TokenExpiredError()
+        # Revoke old, issue new
+        session_repo.revoke(db, refresh_token)
 
-    # Revoke old, issue new
-    session_repo.revoke(db, refresh_token)
+        user = user_repo.find_by_id(db, session["user_id"])
+        if not user:
+            raise NotFoundError("User", session["user_id"])
 
-    user = user_repo.find_by_id(db, session["user_id"])
-    if not user:
-        raise NotFoundError("User", session["user_id"])
+        new_access = _create_access_token(user, jwt_secret, access_expires_minutes)
+        new_refresh = _create_refresh_token()
+        new_refresh_expires = (
+            datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
+        ).isoformat()
 
-    new_access = _create_access_token(user, jwt_secret, access_expires_minutes)
-    new_refresh = _create_refresh_token()
-    new_refresh_expires = (
-        datetime.now(timezone.utc) + timedelta(days=refresh_expires_days)
-    ).isoformat()
-
-    session_repo.create(
-        db,
-        user_id=user.id,
-        refresh_token=new_refresh,
-        expires_at=new_refresh_expires,
-    )
+        session_repo.create(
+            db,
+            user_id=user.id,
+            refresh_token=new_refresh,
+            expires_at=new_refresh_expires,
+        )
 
     metrics.increment("auth.refresh.success")
     return {
@@ -329,7 +335,8 @@ def verify_access_token(token: str, *, jwt_secret: str = "change-me") -> dict:
 @timed
 def logout(db: sqlite3.Connection, *, refresh_token: str) -> None:
     """Revoke a refresh token (logout)."""
-    session_repo.revoke(db, refresh_token)
+    with transaction(db):
+        session_repo.revoke(db, refresh_token)
     logger.info("auth.logout")
 
 
@@ -339,3 +346,41 @@ def whoami(db: sqlite3.Connection, *, user_id: int) -> dict:
     if not user:
         raise NotFoundError("User", user_id)
     return user.to_private_dict()
+
+
+@timed
+def prune_sessions(
+    db: sqlite3.Connection, *, batch_size: int = DEFAULT_PRUNE_BATCH_SIZE
+) -> dict[str, int]:
+    """Delete revoked or expired sessions and used or expired magic links.
+
+    Each batch of ``batch_size`` rows is its own transaction, so the write lock
+    is never held for long.
+    """
+    result = {}
+    for table, purge in (("sessions", session_repo.purge), ("magic_links", magic_link_repo.purge)):
+        deleted = 0
+        while True:
+            with transaction(db):
+                batch = purge(db, limit=batch_size)
+            deleted += batch
+            if batch < batch_size:
+                break
+        result[table] = deleted
+    metrics.increment("auth.sessions.pruned", result["sessions"])
+    logger.info("auth.sessions_pruned", **result)
+    return result
+
+
+def calibrated_rounds(db: sqlite3.Connection, target_ms: float, *, minimum: int) -> int:
+    """The bcrypt cost for ``target_ms``, timed by the first worker and shared via the database.
+
+    Timing in every worker would leave them a cost apart on noise alone. The
+    result is kept per target; delete the ``bcrypt`` counter row to re-time it.
+    """
+    with transaction(db):
+        rounds = counter_repo.get(db, "bcrypt", int(target_ms), "rounds")
+        if not rounds:
+            rounds = calibrate_rounds(target_ms, minimum=minimum)
+            counter_repo.add(db, "bcrypt", int(target_ms), "rounds", rounds)
+    return max(rounds, minimum)
@@ -6,6 +6,8 @@ import sqlite3
 
 import structlog
 
+from goh.db.transaction import transaction
+from goh.domain.entities.character import Character
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
 from goh.observability.timing import timed
 from goh.repositories import audit_repo, character_repo
@@ -38,17 +40,18 @@ def create_character(
     if level < 1 or level > 20:
         raise ValidationError("Level must be between 1 and 20")
 
-    char = character_repo.create(
-        db, owner_id=owner_id, name=name, race=race, char_class=char_class,
-        level=level, strength=strength, dexterity=dexterity,
-        constitution=constitution, intelligence=intelligence,
-        wisdom=wisdom, charisma=charisma, hit_points=hit_points,
-        armor_class=armor_class, backstory=backstory, campaign_id=campaign_id,
-    )
-    audit_repo.log_action(
-        db, user_id=owner_id, action="create_character",
-        resource_type="character", resource_id=char.id,
-    )
+    with transaction(db):
+        char = character_repo.create(
+            db, owner_id=owner_id, name=name, race=race, char_class=char_class,
+            level=level, strength=strength, dexterity=dexterity,
+            constitution=constitution, intelligence=intelligence,
+            wisdom=wisdom, charisma=charisma, hit_points=hit_points,
+            armor_class=armor_class, backstory=backstory, campaign_id=campaign_id,
+        )
+        audit_repo.log_action(
+            db, user_id=owner_id, action="create_character",
+            resource_type="character", resource_id=char.id,
+        )
     logger.info("character.created", character_id=char.id)
     return char.to_dict()
 
@@ -64,22 +67,23 @@ def get_character(db: sqlite3.Connection, char_id: int) -> dict:
 @timed
 def list_characters(db: sqlite3.Connection, owner_id: int) -> list[dict]:
     chars = character_repo.list_by_owner(db, owner_id)
-    return [c.to_dict() for c in chars]
+    return Character.to_dicts(chars)
 
 
 @timed
 def update_character(db: sqlite3.Connection, char_id: int, user_id: int, **fields: object) -> dict:
-    char = character_repo.find_by_id(db, char_id)
-    if not char:
-        raise NotFoundError("Character", char_id)
-    if char.owner_id != user_id:
-        raise ForbiddenError("Cannot edit another user's character")
-
-    character_repo.update(db, char_id, **fields)
-    audit_repo.log_action(
-        db, user_id=user_id, action="update_character",
-        resource_type="character", resource_id=char_id,
-    )
+    with transaction(db):
+        char = character_repo.find_by_id(db, char_id)
+        if not char:
+            raise NotFoundError("Character", char_id)
+        if char.owner_id != user_id:
+            raise ForbiddenError("Cannot edit another user's character")
+
+        character_repo.update(db, char_id, **fields)
+        audit_repo.log_action(
+            db, user_id=user_id, action="update_character",
+            resource_type="character", resource_id=char_id,
+        )
     updated = character_repo.find_by_id(db, char_id)
     assert updated is not None
     return updated.to_dict()
@@ -87,14 +91,15 @@ def update_character(db: sqlite3.Connection, char_id: int, user_id: int, **field
 
 @timed
 def delete_character(db: sqlite3.Connection, char_id: int, user_id: int) -> None:
-    char = character_repo.find_by_id(db, char_id)
-    if not char:
-        raise NotFoundError("Character", char_id)
-    if char.owner_id != user_id:
-        raise ForbiddenError("Cannot delete another user's character")
-
-    character_repo.delete(db, char_id)
-    audit_repo.log_action(
-        db, user_id=user_id, action="delete_character",
-        resource_type="character", resource_id=char_id,
-    )
+    with transaction(db):
+        char = character_repo.find_by_id(db, char_id)
+        if not char:
+            raise NotFoundError("Character", char_id)
+        if char.owner_id != user_id:
+            raise ForbiddenError("Cannot delete another user's character")
+
+        character_repo.delete(db, char_id)
+        audit_repo.log_action(
+            db, user_id=user_id, action="delete_character",
+            resource_type="character", resource_id=char_id,
+        )
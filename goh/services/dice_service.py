@@ -6,6 +6,7 @@ import sqlite3
 
 import structlog
 
+from goh.db.transaction import transaction
 from goh.domain.entities.dice import parse_and_roll
 from goh.domain.exceptions import ValidationError
 from goh.observability.timing import timed
@@ -35,10 +36,11 @@ def roll(
     )
 
     if save:
-        roll_record = dice_repo.save(
-            db, user_id=user_id, expression=expression,
-            results=results, total=total, campaign_id=campaign_id,
-        )
+        with transaction(db):
+            roll_record = dice_repo.save(
+                db, user_id=user_id, expression=expression,
+                results=results, total=total, campaign_id=campaign_id,
+            )
         return roll_record.to_dict()
 
     return {
@@ -6,9 +6,14 @@ import sqlite3
 
 import structlog
 
+from goh.cache.service_cache import cached, invalidates
+from goh.db.transaction import transaction
+from goh.domain.entities.event import Event
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
 from goh.observability.timing import timed
-from goh.repositories import audit_repo, event_repo
+from goh.repositories import audit_repo, event_repo, user_repo
+from goh.repositories.pagination import decode_cursor
+from goh.services import notification_service
 
 logger = structlog.get_logger(__name__)
 
@@ -36,27 +41,42 @@ def create_event(
     if event_type not in VALID_EVENT_TYPES:
         raise ValidationError(f"Invalid event type: {event_type}")
 
-    event = event_repo.create(
-        db, organizer_id=organizer_id, title=title, description=description,
-        event_type=event_type, location=location, start_time=start_time,
-        end_time=end_time, min_players=min_players, max_players=max_players,
-        campaign_id=campaign_id,
-    )
-    audit_repo.log_action(
-        db, user_id=organizer_id, action="create_event",
-        resource_type="event", resource_id=event.id,
-    )
+    with transaction(db):
+        event = event_repo.create(
+            db, organizer_id=organizer_id, title=title, description=description,
+            event_type=event_type, location=location, start_time=start_time,
+            end_time=end_time, min_players=min_players, max_players=max_players,
+            campaign_id=campaign_id,
+        )
+        audit_repo.log_action(
+            db, user_id=organizer_id, action="create_event",
+            resource_type="event", resource_id=event.id,
+        )
     logger.info("event.created", event_id=event.id)
     return event.to_dict()
 
 
 @timed
 def get_event(db: sqlite3.Connection, event_id: int) -> dict:
+    event = _get_event(db, event_id)
+    for rsvp in event["rsvps"]:
+        summary = user_repo.get_summary(db, rsvp["user_id"])
+        if summary:
+            rsvp["username"] = summary["username"]
+            rsvp["display_name"] = summary["display_name"]
+    return event
+
+
+@cached("event:{event_id}")
+def _get_event(db: sqlite3.Connection, event_id: int) -> dict:
+    """The event without RSVP names, which change with profile edits."""
     event = event_repo.find_by_id(db, event_id)
     if not event:
         raise NotFoundError("Event", event_id)
     result = event.to_dict()
     result["rsvps"] = [r.to_dict() for r in event_repo.get_rsvps(db, event_id)]
+    for rsvp in result["rsvps"]:
+        del rsvp["username"], rsvp["display_name"]
     result["going_count"] = event_repo.count_going(db, event_id)
     return result
 
@@ -64,48 +84,68 @@ def get_event(db: sqlite3.Connection, event_id: int) -> dict:
 @timed
 def list_events(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[dict]:
     events = event_repo.list_all(db, limit, offset)
-    return [e.to_dict() for e in events]
+    return Event.to_dicts(events)
+
+
+@timed
+def list_events_page(db: sqlite3.Connection, limit: int = 50, cursor: str | None = None) -> dict:
+    page = event_repo.list_all_page(db, limit, decode_cursor(cursor))
+    return page.map(Event.to_dict).to_dict()
 
 
 @timed
 def list_upcoming_events(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[dict]:
     events = event_repo.list_upcoming(db, limit, offset)
-    return [e.to_dict() for e in events]
+    return Event.to_dicts(events)
 
 
 @timed
+@invalidates("event:{event_id}")
 def rsvp_event(
     db: sqlite3.Connection, event_id: int, user_id: int, status: str = "going"
 ) -> dict:
     if status not in VALID_RSVP_STATUSES:
         raise ValidationError(f"Invalid RSVP status: {status}")
 
-    event = event_repo.find_by_id(db, event_id)
-    if not event:
-        raise NotFoundError("Event", event_id)
-
-    rsvp = event_repo.rsvp(db, event_id, user_id, status)
-    audit_repo.log_action(
-        db, user_id=user_id, action="rsvp",
-        resource_type="event", resource_id=event_id,
-        details={"status": status},
-    )
+    with transaction(db):
+        event = event_repo.find_by_id(db, event_id)
+        if not event:
+            raise NotFoundError("Event", event_id)
+
+        rsvp = event_repo.rsvp(db, event_id, user_id, status)
+        audit_repo.log_action(
+            db, user_id=user_id, action="rsvp",
+            resource_type="event", resource_id=event_id,
+            details={"status": status},
+        )
     return rsvp.to_dict()
 
 
 @timed
+@invalidates("event:{event_id}")
 def cancel_event(db: sqlite3.Connection, event_id: int, user_id: int) -> dict:
-    event = event_repo.find_by_id(db, event_id)
-    if not event:
-        raise NotFoundError("Event", event_id)
-    if event.organizer_id != user_id:
-        raise ForbiddenError("Only the organizer can cancel an event")
-
-    event_repo.update_status(db, event_id, "cancelled")
-    audit_repo.log_action(
-        db, user_id=user_id, action="cancel_event",
-        resource_type="event", resource_id=event_id,
-    )
+    with transaction(db):
+        event = event_repo.find_by_id(db, event_id)
+        if not event:
+            raise NotFoundError("Event", event_id)
+        if event.organizer_id != user_id:
+            raise ForbiddenError("Only the organizer can cancel an event")
+
+        event_repo.update_status(db, event_id, "cancelled")
+        audit_repo.log_action(
+            db, user_id=user_id, action="cancel_event",
+            resource_type="event", resource_id=event_id,
+        )
+        notification_service.notify_many(
+            db,
+            (r.user_id for r in event_repo.get_rsvps(db, event_id)
+             if r.status != "not_going" and r.user_id != user_id),
+            type="event_cancelled",
+            title=f"{event.title} was cancelled",
+            link=f"/events/{event_id}",
+            source_user_id=user_id,
+            background=True,
+        )
     updated = event_repo.find_by_id(db, event_id)
     assert updated is not None
     return updated.to_dict()
@@ -6,14 +6,22 @@ import sqlite3
 
 import structlog
 
+from goh.cache.service_cache import invalidates
+from goh.db.transaction import transaction
+from goh.domain.entities.user import User
 from goh.domain.exceptions import NotFoundError, ValidationError
+from goh.jobs.durable import enqueue, job
 from goh.observability.timing import timed
-from goh.repositories import audit_repo, follow_repo, notification_repo, user_repo
+from goh.repositories import audit_repo, feed_repo, follow_repo, notification_repo, user_repo
+from goh.repositories.pagination import decode_cursor
 
 logger = structlog.get_logger(__name__)
 
+FOLLOW_NOTIFICATION_JOB = "notification.follow"
+
 
 @timed
+@invalidates("user.profile:{follower_id}", "user.profile:{following_id}")
 def follow_user(db: sqlite3.Connection, follower_id: int, following_id: int) -> dict:
     if follower_id == following_id:
         raise ValidationError("Cannot follow yourself")
@@ -22,36 +30,68 @@ def follow_user(db: sqlite3.Connection, follower_id: int, following_id: int) ->
     if not target:
         raise NotFoundError("User", following_id)
 
-    already = follow_repo.is_following(db, follower_id, following_id)
-    follow_repo.follow(db, follower_id, following_id)
-
-    if not already:
-        follower = user_repo.find_by_id(db, follower_id)
-        follower_name = follower.display_name if follower else "Someone"
-        notification_repo.create(
-            db,
-            user_id=following_id,
-            type="follow",
-            title=f"{follower_name} started following you",
-            link=f"/users/{follower_id}",
-            source_user_id=follower_id,
-        )
-        audit_repo.log_action(
-            db, user_id=follower_id, action="follow", resource_type="follow",
-            details={"following_id": following_id},
-        )
-        logger.info("follow.created", follower_id=follower_id, following_id=following_id)
+    with transaction(db):
+        already = follow_repo.is_following(db, follower_id, following_id)
+        follow_repo.follow(db, follower_id, following_id)
+
+        if not already:
+            _update_feed_on_follow(db, follower_id, following_id)
+            enqueue(
+                db,
+                FOLLOW_NOTIFICATION_JOB,
+                {"follower_id": follower_id, "following_id": following_id},
+                idempotency_key=f"follow:{follower_id}:{following_id}",
+            )
+            audit_repo.log_action(
+                db, user_id=follower_id, action="follow", resource_type="follow",
+                details={"following_id": following_id},
+            )
+            logger.info("follow.created", follower_id=follower_id, following_id=following_id)
 
     return {"following": True}
 
 
+@job(FOLLOW_NOTIFICATION_JOB)
+def _notify_follow(db: sqlite3.Connection, payload: dict) -> None:
+    """Tell the followed user, unless the follow was undone before the job ran."""
+    follower_id, following_id = payload["follower_id"], payload["following_id"]
+    if not follow_repo.is_following(db, follower_id, following_id):
+        return
+    follower = user_repo.find_by_id(db, follower_id)
+    notification_repo.create_coalesced(
+        db,
+        user_id=following_id,
+        type="follow",
+        group_key="follow",
+        actor=follower.display_name if follower else "Someone",
+        action="started following you",
+        link=f"/users/{follower_id}",
+        source_user_id=follower_id,
+    )
+
+
+def _update_feed_on_follow(db: sqlite3.Connection, follower_id: int, following_id: int) -> None:
+    """Backfill the new follower's inbox, switching big authors to read-time merge."""
+    if feed_repo.is_merged_author(db, following_id):
+        return
+    threshold = feed_repo.FANOUT_FOLLOWER_THRESHOLD
+    if feed_repo.has_followers_at_least(db, following_id, threshold):
+        feed_repo.mark_merged_author(db, following_id)
+        logger.info("feed.author_merged", author_id=following_id, threshold=threshold)
+        return
+    feed_repo.backfill(db, user_id=follower_id, author_id=following_id)
+
+
 @timed
+@invalidates("user.profile:{follower_id}", "user.profile:{following_id}")
 def unfollow_user(db: sqlite3.Connection, follower_id: int, following_id: int) -> dict:
-    follow_repo.unfollow(db, follower_id, following_id)
-    audit_repo.log_action(
-        db, user_id=follower_id, action="unfollow", resource_type="follow",
-        details={"following_id": following_id},
-    )
+    with transaction(db):
+        follow_repo.unfollow(db, follower_id, following_id)
+        feed_repo.prune(db, user_id=follower_id, author_id=following_id)
+        audit_repo.log_action(
+            db, user_id=follower_id, action="unfollow", resource_type="follow",
+            details={"following_id": following_id},
+        )
     logger.info("follow.removed", follower_id=follower_id, following_id=following_id)
     return {"following": False}
 
@@ -61,7 +101,15 @@ def get_followers(
     db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
 ) -> list[dict]:
     users = follow_repo.get_followers(db, user_id, limit, offset)
-    return [u.to_public_dict() for u in users]
+    return User.to_public_dicts(users)
+
+
+@timed
+def get_followers_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: str | None = None
+) -> dict:
+    page = follow_repo.get_followers_page(db, user_id, limit, decode_cursor(cursor))
+    return page.map(User.to_public_dict).to_dict()
 
 
 @timed
@@ -69,7 +117,15 @@ def get_following(
     db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0
 ) -> list[dict]:
     users = follow_repo.get_following(db, user_id, limit, offset)
-    return [u.to_public_dict() for u in users]
+    return User.to_public_dicts(users)
+
+
+@timed
+def get_following_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: str | None = None
+) -> dict:
+    page = follow_repo.get_following_page(db, user_id, limit, decode_cursor(cursor))
+    return page.map(User.to_public_dict).to_dict()
 
 
 @timed
@@ -1,16 +1,72 @@
-"""Notification service — list, mark read, count unread."""
+"""Notification service — list, mark read, count unread, fan-out, retention."""
 
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
 
 import structlog
 
+from goh.cache.service_cache import cached
+from goh.db.transaction import transaction
+from goh.jobs.durable import enqueue, job
+from goh.observability.metrics import metrics
 from goh.observability.timing import timed
+from goh.realtime.relay import DEFAULT_RETENTION_SECONDS
 from goh.repositories import notification_repo
+from goh.repositories.pagination import decode_cursor
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_PRUNE_BATCH_SIZE = 1000
+FAN_OUT_JOB = "notification.fan_out"
+
+
+@timed
+def notify_many(
+    db: sqlite3.Connection,
+    user_ids: Iterable[int],
+    *,
+    type: str,
+    title: str,
+    body: str = "",
+    link: str | None = None,
+    source_user_id: int | None = None,
+    background: bool = False,
+) -> int:
+    """Send one notification to many users in a single transaction.
+
+    With ``background=True`` the fan-out is queued as a durable job in the
+    caller's transaction and runs once it commits. Returns the number of
+    recipients.
+    """
+    recipients = list(dict.fromkeys(user_ids))
+    if not recipients:
+        return 0
+    if background:
+        with transaction(db):
+            enqueue(db, FAN_OUT_JOB, {
+                "user_ids": recipients, "type": type, "title": title, "body": body,
+                "link": link, "source_user_id": source_user_id,
+            })
+        return len(recipients)
+
+    with transaction(db):
+        notifications = notification_repo.create_many(
+            db, recipients, type=type, title=title, body=body, link=link,
+            source_user_id=source_user_id,
+        )
+    logger.info("notifications.fanned_out", type=type, recipients=len(notifications))
+    return len(notifications)
+
+
+@job(FAN_OUT_JOB)
+def _fan_out(db: sqlite3.Connection, payload: dict) -> None:
+    notify_many(
+        db, payload["user_ids"], type=payload["type"], title=payload["title"],
+        body=payload["body"], link=payload["link"], source_user_id=payload["source_user_id"],
+    )
+
 
 @timed
 def list_notifications(
@@ -21,15 +77,53 @@ def list_notifications(
 
 
 @timed
+def list_notifications_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: str | None = None
+) -> dict:
+    page = notification_repo.list_for_user_page(db, user_id, limit, decode_cursor(cursor))
+    return page.map(lambda n: n.to_dict()).to_dict()
+
+
+@timed
+@cached("notifications.unread:{user_id}")
 def count_unread(db: sqlite3.Connection, user_id: int) -> int:
     return notification_repo.count_unread(db, user_id)
 
 
 @timed
 def mark_read(db: sqlite3.Connection, notification_id: int, user_id: int) -> None:
-    notification_repo.mark_read(db, notification_id, user_id)
+    with transaction(db):
+        notification_repo.mark_read(db, notification_id, user_id)
 
 
 @timed
 def mark_all_read(db: sqlite3.Connection, user_id: int) -> None:
-    notification_repo.mark_all_read(db, user_id)
+    with transaction(db):
+        notification_repo.mark_all_read(db, user_id)
+
+
+@timed
+def prune(
+    db: sqlite3.Connection, *, read_ttl_days: int, batch_size: int = DEFAULT_PRUNE_BATCH_SIZE
+) -> dict[str, int]:
+    """Delete read notifications older than ``read_ttl_days`` and stale stream events.
+
+    Deletes in batches of ``batch_size``, one transaction each, so the write
+    lock is never held for long. Unread notifications are kept.
+    """
+    deleted = 0
+    while True:
+        with transaction(db):
+            batch = notification_repo.purge_read(
+                db, older_than_days=read_ttl_days, limit=batch_size
+            )
+        deleted += batch
+        if batch < batch_size:
+            break
+    with transaction(db):
+        changes = notification_repo.purge_changes(
+            db, older_than_seconds=DEFAULT_RETENTION_SECONDS
+        )
+    metrics.increment("notifications.pruned", deleted)
+    logger.info("notifications.pruned", notifications=deleted, changes=changes)
+    return {"notifications": deleted, "changes": changes}
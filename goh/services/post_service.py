@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 
 import structlog
 
+from goh.cache.service_cache import cached, invalidates
+from goh.cache.timeline import TimelineBuffer, get_timeline_buffer
+from goh.db.transaction import on_commit, transaction
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
+from goh.observability.metrics import metrics
 from goh.observability.timing import timed
-from goh.repositories import audit_repo, post_repo
+from goh.repositories import audit_repo, counter_repo, feed_repo, post_repo, user_repo
+from goh.repositories.pagination import build_page, decode_cursor
 
 logger = structlog.get_logger(__name__)
 
@@ -16,6 +22,7 @@ VALID_POST_TYPES = {"text", "image", "event_share", "character_share"}
 
 
 @timed
+@invalidates("user.profile:{author_id}")
 def create_post(
     db: sqlite3.Connection,
     *,
@@ -29,55 +36,168 @@ def create_post(
     if post_type not in VALID_POST_TYPES:
         raise ValidationError(f"Invalid post type: {post_type}")
 
-    post = post_repo.create(
-        db, author_id=author_id, content=content,
-        post_type=post_type, image_url=image_url,
-    )
-    audit_repo.log_action(
-        db, user_id=author_id, action="create_post", resource_type="post", resource_id=post.id
-    )
+    with transaction(db):
+        post = post_repo.create(
+            db, author_id=author_id, content=content,
+            post_type=post_type, image_url=image_url,
+        )
+        feed_repo.fan_out(
+            db, post_id=post.id, author_id=author_id, created_at=post.created_at,
+            include_followers=not feed_repo.is_merged_author(db, author_id),
+        )
+        audit_repo.log_action(
+            db, user_id=author_id, action="create_post", resource_type="post", resource_id=post.id
+        )
+        buffer = get_timeline_buffer()
+        if buffer is not None:
+            on_commit(db, lambda: buffer.add(post.to_dict()))
     logger.info("post.created", post_id=post.id, author_id=author_id)
     return post.to_dict()
 
 
 @timed
 def get_post(db: sqlite3.Connection, post_id: int) -> dict:
+    post = _get_post(db, post_id)
+    author = user_repo.get_summary(db, post["author_id"])
+    if author:
+        post["author"] = dict(author)
+    return post
+
+
+@cached("post:{post_id}")
+def _get_post(db: sqlite3.Connection, post_id: int) -> dict:
+    """The post without its author, whose fields change with profile edits."""
     post = post_repo.find_by_id(db, post_id)
     if not post:
         raise NotFoundError("Post", post_id)
-    return post.to_dict()
+    result = post.to_dict()
+    del result["author"]
+    return result
 
 
 @timed
 def list_posts(
     db: sqlite3.Connection, author_id: int, limit: int = 50, offset: int = 0
 ) -> list[dict]:
-    posts = post_repo.list_by_author(db, author_id, limit, offset)
-    return [p.to_dict() for p in posts]
+    return post_repo.list_by_author_json(db, author_id, limit, offset)
+
+
+@timed
+def list_posts_page(
+    db: sqlite3.Connection, author_id: int, limit: int = 50, cursor: str | None = None
+) -> dict:
+    return post_repo.list_by_author_page_json(db, author_id, limit, decode_cursor(cursor)).to_dict()
 
 
 @timed
 def get_feed(db: sqlite3.Connection, user_id: int, limit: int = 50, offset: int = 0) -> list[dict]:
-    posts = post_repo.feed(db, user_id, limit, offset)
-    return [p.to_dict() for p in posts]
+    merged = feed_repo.merged_followees(db, user_id)
+    return post_repo.feed_json(db, user_id, limit, offset, merged_author_ids=merged)
+
+
+@timed
+def get_feed_page(
+    db: sqlite3.Connection, user_id: int, limit: int = 50, cursor: str | None = None
+) -> dict:
+    merged = feed_repo.merged_followees(db, user_id)
+    page = post_repo.feed_page_json(
+        db, user_id, limit, decode_cursor(cursor), merged_author_ids=merged
+    )
+    return page.to_dict()
 
 
 @timed
 def get_timeline(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[dict]:
-    posts = post_repo.timeline(db, limit, offset)
-    return [p.to_dict() for p in posts]
+    buffer = _timeline_buffer(db) if limit > 0 and offset >= 0 else None
+    posts = buffer.window(limit, offset) if buffer is not None else None
+    if buffer is None or posts is None:
+        metrics.increment("timeline.buffer.miss")
+        return post_repo.timeline_json(db, limit, offset)
+    metrics.increment("timeline.buffer.hit")
+    if buffer.verify:
+        _check_timeline(posts, post_repo.timeline_json(db, limit, offset))
+    return posts
+
+
+@timed
+def get_timeline_page(db: sqlite3.Connection, limit: int = 50, cursor: str | None = None) -> dict:
+    after = decode_cursor(cursor)
+    buffer = _timeline_buffer(db) if limit > 0 else None
+    posts = buffer.after(after, limit + 1) if buffer is not None else None
+    if buffer is None or posts is None:
+        metrics.increment("timeline.buffer.miss")
+        return post_repo.timeline_page_json(db, limit, after).to_dict()
+    metrics.increment("timeline.buffer.hit")
+    page = build_page(posts, limit, lambda post: post).to_dict()
+    if buffer.verify:
+        _check_timeline(page, post_repo.timeline_page_json(db, limit, after).to_dict())
+    return page
 
 
 @timed
+@invalidates("post:{post_id}", "user.profile:{user_id}")
 def delete_post(db: sqlite3.Connection, post_id: int, user_id: int) -> None:
-    post = post_repo.find_by_id(db, post_id)
-    if not post:
-        raise NotFoundError("Post", post_id)
-    if post.author_id != user_id:
-        raise ForbiddenError("Cannot delete another user's post")
+    with transaction(db):
+        post = post_repo.find_by_id(db, post_id)
+        if not post:
+            raise NotFoundError("Post", post_id)
+        if post.author_id != user_id:
+            raise ForbiddenError("Cannot delete another user's post")
+
+        feed_repo.remove_post(db, post_id)
+        post_repo.delete(db, post_id)
+        audit_repo.log_action(
+            db, user_id=user_id, action="delete_post", resource_type="post", resource_id=post_id
+        )
+        buffer = get_timeline_buffer()
+        if buffer is not None:
+            on_commit(db, lambda: buffer.remove(post_id))
+    logger.info("post.deleted", post_id=post_id, user_id=user_id)
 
-    post_repo.delete(db, post_id)
-    audit_repo.log_action(
-        db, user_id=user_id, action="delete_post", resource_type="post", resource_id=post_id
+
+def _timeline_buffer(db: sqlite3.Connection) -> TimelineBuffer | None:
+    """The installed timeline buffer, brought up to date first when it is due."""
+    buffer = get_timeline_buffer()
+    if buffer is None:
+        return None
+    loaded = bool(buffer.loaded_at)
+    due = not loaded or time.monotonic() - buffer.refreshed_at >= buffer.refresh_seconds
+    # One thread refreshes; the others keep answering from the current contents
+    if due and buffer.refresh_lock.acquire(blocking=not loaded):
+        try:
+            _refresh_timeline(db, buffer)
+        finally:
+            buffer.refresh_lock.release()
+    return buffer
+
+
+def _refresh_timeline(db: sqlite3.Connection, buffer: TimelineBuffer) -> None:
+    now = time.monotonic()
+    # Read before the posts, so a delete racing the load forces another reload
+    deletions = counter_repo.get(db, "timeline", 0, "deleted")
+    reload = (
+        not buffer.loaded_at
+        or now - buffer.loaded_at >= buffer.reload_seconds
+        or deletions != buffer.deletions
     )
-    logger.info("post.deleted", post_id=post_id, user_id=user_id)
+    if not reload:
+        if now - buffer.refreshed_at < buffer.refresh_seconds:
+            return
+        new = post_repo.timeline_since_json(db, buffer.last_seen_id, buffer.capacity + 1)
+        if len(new) <= buffer.capacity:
+            buffer.merge(new)
+            buffer.last_seen_id = max([buffer.last_seen_id, *(p["id"] for p in new)])
+            buffer.refreshed_at = now
+            return
+    posts = post_repo.timeline_json(db, buffer.capacity)
+    buffer.load(posts)
+    buffer.last_seen_id = max((p["id"] for p in posts), default=0)
+    buffer.deletions = deletions
+    buffer.loaded_at = buffer.refreshed_at = now
+
+
+def _check_timeline(buffered: object, expected: object) -> None:
+    """Consistency check mode: a buffered answer must equal what SQL returns."""
+    if buffered != expected:
+        metrics.increment("timeline.buffer.mismatch")
+        raise AssertionError(f"timeline buffer out of sync: {buffered!r} != {expected!r}")
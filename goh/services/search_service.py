@@ -0,0 +1,59 @@
+"""Search service — full-text search across users, posts, events and campaigns."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import structlog
+
+from goh.db.transaction import transaction
+from goh.domain.entities.campaign import Campaign
+from goh.domain.entities.event import Event
+from goh.domain.entities.post import Post
+from goh.domain.entities.user import User
+from goh.domain.exceptions import ValidationError
+from goh.observability.timing import timed
+from goh.repositories import campaign_repo, event_repo, fulltext, post_repo, user_repo
+
+logger = structlog.get_logger(__name__)
+
+SEARCH_KINDS = ("users", "posts", "events", "campaigns")
+MAX_SEARCH_LIMIT = 50
+
+
+@timed
+def search(
+    db: sqlite3.Connection,
+    query: str,
+    *,
+    kinds: list[str] | None = None,
+    limit: int = 20,
+) -> dict:
+    """Prefix-matched results per kind, each list ranked by bm25."""
+    kinds = kinds or list(SEARCH_KINDS)
+    unknown = [k for k in kinds if k not in SEARCH_KINDS]
+    if unknown:
+        raise ValidationError(
+            f"Unknown search type: {', '.join(unknown)}", {"allowed": list(SEARCH_KINDS)}
+        )
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+
+    results: dict[str, list[dict]] = {}
+    if "users" in kinds:
+        results["users"] = User.to_public_dicts(user_repo.search(db, query, limit))
+    if "posts" in kinds:
+        results["posts"] = Post.to_dicts(post_repo.search(db, query, limit))
+    if "events" in kinds:
+        results["events"] = Event.to_dicts(event_repo.search(db, query, limit))
+    if "campaigns" in kinds:
+        results["campaigns"] = Campaign.to_dicts(campaign_repo.search(db, query, limit))
+    return {"query": query, "results": results}
+
+
+@timed
+def reindex(db: sqlite3.Connection) -> dict[str, int]:
+    """Rebuild the full-text indexes from the source tables."""
+    with transaction(db):
+        counts = fulltext.reindex(db)
+    logger.info("search.reindexed", **counts)
+    return counts
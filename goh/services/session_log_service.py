@@ -6,9 +6,11 @@ import sqlite3
 
 import structlog
 
+from goh.db.transaction import transaction
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
 from goh.observability.timing import timed
 from goh.repositories import audit_repo, campaign_repo
+from goh.services import notification_service
 
 logger = structlog.get_logger(__name__)
 
@@ -24,23 +26,34 @@ def create_session_log(
     summary: str = "",
     session_date: str = "",
 ) -> dict:
-    campaign = campaign_repo.find_by_id(db, campaign_id)
-    if not campaign:
-        raise NotFoundError("Campaign", campaign_id)
-    if not campaign_repo.is_member(db, campaign_id, author_id):
-        raise ForbiddenError("Must be a campaign member to create session logs")
-    if not title.strip():
-        raise ValidationError("Session log title cannot be empty")
-
-    log = campaign_repo.create_session_log(
-        db, campaign_id=campaign_id, author_id=author_id,
-        session_number=session_number, title=title,
-        summary=summary, session_date=session_date,
-    )
-    audit_repo.log_action(
-        db, user_id=author_id, action="create_session_log",
-        resource_type="session_log", resource_id=log.id,
-    )
+    with transaction(db):
+        campaign = campaign_repo.find_by_id(db, campaign_id)
+        if not campaign:
+            raise NotFoundError("Campaign", campaign_id)
+        if not campaign_repo.is_member(db, campaign_id, author_id):
+            raise ForbiddenError("Must be a campaign member to create session logs")
+        if not title.strip():
+            raise ValidationError("Session log title cannot be empty")
+
+        log = campaign_repo.create_session_log(
+            db, campaign_id=campaign_id, author_id=author_id,
+            session_number=session_number, title=title,
+            summary=summary, session_date=session_date,
+        )
+        audit_repo.log_action(
+            db, user_id=author_id, action="create_session_log",
+            resource_type="session_log", resource_id=log.id,
+        )
+        notification_service.notify_many(
+            db,
+            (m["user_id"] for m in campaign_repo.get_members(db, campaign_id)
+             if m["user_id"] != author_id),
+            type="session_log",
+            title=f"New session log in {campaign.name}: {title}",
+            link=f"/campaigns/{campaign_id}",
+            source_user_id=author_id,
+            background=True,
+        )
     return log.to_dict()
 
 
@@ -6,25 +6,34 @@ import sqlite3
 
 import structlog
 
+from goh.cache.service_cache import cached, invalidates
+from goh.cache.timeline import get_timeline_buffer
+from goh.db.transaction import on_commit, transaction
+from goh.domain.entities.user import User
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
 from goh.observability.timing import timed
-from goh.repositories import audit_repo, follow_repo, user_repo
+from goh.repositories import audit_repo, counter_repo, user_repo
+from goh.repositories.pagination import decode_cursor
 
 logger = structlog.get_logger(__name__)
 
 
 @timed
+@cached("user.profile:{user_id}")
 def get_profile(db: sqlite3.Connection, user_id: int) -> dict:
     user = user_repo.find_by_id(db, user_id)
     if not user:
         raise NotFoundError("User", user_id)
     profile = user.to_public_dict()
-    profile["followers_count"] = follow_repo.count_followers(db, user_id)
-    profile["following_count"] = follow_repo.count_following(db, user_id)
+    counts = counter_repo.get_all(db, "user", user_id)
+    profile["followers_count"] = counts.get("followers", 0)
+    profile["following_count"] = counts.get("following", 0)
+    profile["posts_count"] = counts.get("posts", 0)
     return profile
 
 
 @timed
+@invalidates("user.profile:{user_id}")
 def update_profile(
     db: sqlite3.Connection,
     user_id: int,
@@ -33,22 +42,32 @@ def update_profile(
     bio: str | None = None,
     avatar: str | None = None,
 ) -> dict:
-    user = user_repo.find_by_id(db, user_id)
-    if not user:
-        raise NotFoundError("User", user_id)
+    with transaction(db):
+        user = user_repo.find_by_id(db, user_id)
+        if not user:
+            raise NotFoundError("User", user_id)
+
+        user_repo.update_profile(db, user_id, display_name=display_name, bio=bio, avatar=avatar)
+
+        audit_repo.log_action(
+            db, user_id=user_id, action="update_profile", resource_type="user", resource_id=user_id
+        )
+        updated = user_repo.find_by_id(db, user_id)
+        assert updated is not None
+        buffer = get_timeline_buffer()
+        if buffer is not None:
+            author = {
+                "username": updated.username,
+                "display_name": updated.display_name,
+                "avatar": updated.avatar,
+            }
+            on_commit(db, lambda: buffer.update_author(user_id, author))
 
-    user_repo.update_profile(db, user_id, display_name=display_name, bio=bio, avatar=avatar)
-
-    audit_repo.log_action(
-        db, user_id=user_id, action="update_profile", resource_type="user", resource_id=user_id
-    )
-
-    updated = user_repo.find_by_id(db, user_id)
-    assert updated is not None
     return updated.to_private_dict()
 
 
 @timed
+@invalidates("user.profile:{target_user_id}")
 def set_role(db: sqlite3.Connection, admin_user_id: int, target_user_id: int, role: str) -> dict:
     admin = user_repo.find_by_id(db, admin_user_id)
     if not admin or admin.role != "admin":
@@ -57,16 +76,17 @@ def set_role(db: sqlite3.Connection, admin_user_id: int, target_user_id: int, ro
     if role not in ("player", "dm", "admin"):
         raise ValidationError(f"Invalid role: {role}")
 
-    target = user_repo.find_by_id(db, target_user_id)
-    if not target:
-        raise NotFoundError("User", target_user_id)
+    with transaction(db):
+        target = user_repo.find_by_id(db, target_user_id)
+        if not target:
+            raise NotFoundError("User", target_user_id)
 
-    user_repo.set_role(db, target_user_id, role)
+        user_repo.set_role(db, target_user_id, role)
 
-    audit_repo.log_action(
-        db, user_id=admin_user_id, action="set_role", resource_type="user",
-        resource_id=target_user_id, details={"role": role},
-    )
+        audit_repo.log_action(
+            db, user_id=admin_user_id, action="set_role", resource_type="user",
+            resource_id=target_user_id, details={"role": role},
+        )
 
     updated = user_repo.find_by_id(db, target_user_id)
     assert updated is not None
@@ -76,10 +96,22 @@ def set_role(db: sqlite3.Connection, admin_user_id: int, target_user_id: int, ro
 @timed
 def search_users(db: sqlite3.Connection, query: str, limit: int = 20) -> list[dict]:
     users = user_repo.search(db, query, limit)
-    return [u.to_public_dict() for u in users]
+    return User.to_public_dicts(users)
+
+
+@timed
+def complete_users(db: sqlite3.Connection, prefix: str, limit: int = 10) -> list[dict]:
+    """@-mention suggestions: usernames and display names starting with ``prefix``."""
+    return user_repo.complete(db, prefix, limit)
 
 
 @timed
 def list_users(db: sqlite3.Connection, limit: int = 50, offset: int = 0) -> list[dict]:
     users = user_repo.list_all(db, limit, offset)
-    return [u.to_public_dict() for u in users]
+    return User.to_public_dicts(users)
+
+
+@timed
+def list_users_page(db: sqlite3.Connection, limit: int = 50, cursor: str | None = None) -> dict:
+    page = user_repo.list_all_page(db, limit, decode_cursor(cursor))
+    return page.map(User.to_public_dict).to_dict()
@@ -16,12 +16,21 @@ def settings(tmp_path) -> Settings:  # type: ignore[no-untyped-def]
         GOH_DB_PATH=str(tmp_path / "test.db"),
         GOH_SECRET_KEY="test-secret-key-minimum-32-chars!",
         GOH_JWT_SECRET="test-jwt-secret-minimum-32-chars!",
+        GOH_BCRYPT_ROUNDS=4,
+        GOH_BCRYPT_WORKERS=0,
+        GOH_TIMELINE_BUFFER_REFRESH_SECONDS=0,
+        GOH_TIMELINE_BUFFER_VERIFY=True,
     )
 
 
 @pytest.fixture()
 def app(settings):  # type: ignore[no-untyped-def]
-    return create_app(settings)
+    app = create_app(settings)
+    yield app
+    app.extensions["background_queue"].close()
+    app.extensions["notification_relay"].close()
+    app.extensions["audit_sink"].close()
+    app.extensions["password_hasher"].close()
 
 
 @pytest.fixture()
@@ -124,6 +133,27 @@ class TestPostsAPI:
         assert resp.status_code == 200
         assert len(resp.json()) >= 1
 
+    def test_timeline_cursor(self, client: httpx.Client) -> None:
+        auth = _register(client)
+        headers = _auth_header(auth)
+        for i in range(3):
+            client.post("/api/v1/posts", json={"content": f"Post {i}"}, headers=headers)
+
+        resp = client.get("/api/v1/posts/timeline", params={"limit": 2, "cursor": ""})
+        assert resp.status_code == 200
+        page = resp.json()
+        assert [p["content"] for p in page["items"]] == ["Post 2", "Post 1"]
+
+        resp = client.get(
+            "/api/v1/posts/timeline", params={"limit": 2, "cursor": page["next_cursor"]}
+        )
+        page = resp.json()
+        assert [p["content"] for p in page["items"]] == ["Post 0"]
+        assert page["next_cursor"] is None
+
+        resp = client.get("/api/v1/posts/timeline", params={"cursor": "bogus"})
+        assert resp.status_code == 400
+
 
 class TestEventsAPI:
     def test_create_event(self, client: httpx.Client) -> None:
@@ -224,6 +254,191 @@ class TestCharactersAPI:
         assert len(resp.json()) == 1
 
 
+class TestNotificationsAPI:
+    def test_unread_count_etag(self, app, client: httpx.Client) -> None:  # type: ignore[no-untyped-def]
+        alice = _register(client, "alice")
+        bob = _register(client, "bob")
+        headers = _auth_header(bob)
+        resp = client.get("/api/v1/notifications/unread-count", headers=headers)
+        assert resp.json() == {"unread": 0}
+        etag = resp.headers["etag"]
+
+        resp = client.get(
+            "/api/v1/notifications/unread-count", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        client.post(f"/api/v1/follows/{bob['user']['id']}", headers=_auth_header(alice))
+        app.extensions["background_queue"].join()  # the follow notification is a job
+        resp = client.get(
+            "/api/v1/notifications/unread-count", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.json() == {"unread": 1}
+        assert resp.headers["etag"] != etag
+
+
+class TestNotificationStream:
+    @pytest.fixture()
+    def settings(self, tmp_path) -> Settings:  # type: ignore[no-untyped-def]
+        return Settings(
+            GOH_ENV="testing",
+            GOH_DB_PATH=str(tmp_path / "test.db"),
+            GOH_SECRET_KEY="test-secret-key-minimum-32-chars!",
+            GOH_JWT_SECRET="test-jwt-secret-minimum-32-chars!",
+            GOH_NOTIFICATION_STREAM_MAX_SECONDS=0.3,
+            GOH_NOTIFICATION_STREAM_HEARTBEAT_SECONDS=0.1,
+            GOH_BCRYPT_ROUNDS=4,
+            GOH_BCRYPT_WORKERS=0,
+        )
+
+    def test_requires_auth(self, client: httpx.Client) -> None:
+        assert client.get("/api/v1/notifications/stream").status_code == 401
+
+    def test_streams_unread_and_new_notifications(self, client: httpx.Client) -> None:
+        alice = _register(client, "alice")
+        bob = _register(client, "bob")
+        with client.stream(
+            "GET", "/api/v1/notifications/stream", headers=_auth_header(bob)
+        ) as resp:
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            client.post(
+                f"/api/v1/follows/{bob['user']['id']}", headers=_auth_header(alice)
+            )
+            body = "".join(resp.iter_text())
+
+        events = [block.split("\n") for block in body.split("\n\n") if block]
+        named = [lines for lines in events if lines[0].startswith("event:")]
+        assert named[0] == ["event: unread", 'data: {"unread": 0}']
+        assert named[1][0] == "event: notification"
+        assert '"unread": 1' in named[1][1]
+        assert any(lines == [": keep-alive"] for lines in events)
+
+
+class TestUsersAPI:
+    def test_complete(self, client: httpx.Client) -> None:
+        _register(client, "gandalf")
+        _register(client, "galadriel")
+        resp = client.get("/api/v1/users/complete", params={"prefix": "gan"})
+        assert resp.status_code == 200
+        assert [u["username"] for u in resp.json()] == ["gandalf"]
+
+
+class TestSearchAPI:
+    def test_search(self, client: httpx.Client) -> None:
+        auth = _register(client, "dragonslayer")
+        client.post("/api/v1/posts", json={"content": "Slew a dragon"}, headers=_auth_header(auth))
+
+        resp = client.get("/api/v1/search", params={"q": "drag"})
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [u["username"] for u in results["users"]] == ["dragonslayer"]
+        assert [p["content"] for p in results["posts"]] == ["Slew a dragon"]
+
+        resp = client.get("/api/v1/search", params={"q": "drag", "type": "posts"})
+        assert list(resp.json()["results"]) == ["posts"]
+
+    def test_unknown_type(self, client: httpx.Client) -> None:
+        resp = client.get("/api/v1/search", params={"q": "drag", "type": "spells"})
+        assert resp.status_code == 400
+
+
+class TestHttpCache:
+    def test_etag_and_cache_control(self, client: httpx.Client) -> None:
+        resp = client.get("/api/v1/posts/timeline")
+        assert resp.status_code == 200
+        assert resp.headers["ETag"].startswith('W/"')
+        assert resp.headers["Cache-Control"] == "public, max-age=0, s-maxage=5"
+
+    def test_not_modified(self, client: httpx.Client) -> None:
+        etag = client.get("/api/v1/events").headers["ETag"]
+        resp = client.get("/api/v1/events", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert resp.content == b""
+
+    def test_etag_changes_on_write(self, client: httpx.Client) -> None:
+        auth = _register(client, "scribe")
+        etag = client.get("/api/v1/posts/timeline").headers["ETag"]
+        assert client.get("/api/v1/posts/timeline?limit=5").headers["ETag"] != etag
+
+        client.post("/api/v1/posts", json={"content": "New scroll"}, headers=_auth_header(auth))
+        resp = client.get("/api/v1/posts/timeline", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert resp.json()[0]["content"] == "New scroll"
+
+    def test_errors_not_cached(self, client: httpx.Client) -> None:
+        resp = client.get("/api/v1/posts/999")
+        assert resp.status_code == 404
+        assert "ETag" not in resp.headers
+
+
+class TestJsonProvider:
+    def test_orjson_by_default(self, app, client: httpx.Client) -> None:  # type: ignore[no-untyped-def]
+        assert type(app.json).__name__ == "OrjsonProvider"
+        auth = _register(client, "bard")
+        client.post("/api/v1/posts", json={"content": "Ballad — «ünïcode»"}, headers=_auth_header(auth))
+        resp = client.get("/api/v1/posts/timeline")
+        assert resp.headers["Content-Type"] == "application/json"
+        assert resp.json()[0]["content"] == "Ballad — «ünïcode»"
+
+    def test_stdlib_backend(self, settings: Settings) -> None:
+        from flask.json.provider import DefaultJSONProvider
+
+        app = create_app(settings.model_copy(update={"json_backend": "stdlib"}))
+        try:
+            assert type(app.json) is DefaultJSONProvider
+        finally:
+            for name in ("background_queue", "notification_relay", "audit_sink", "password_hasher"):
+                app.extensions[name].close()
+
+    def test_matches_stdlib_encoding(self, app) -> None:  # type: ignore[no-untyped-def]
+        import datetime
+        import json
+
+        from flask.json.provider import DefaultJSONProvider
+
+        value = {"when": datetime.date(2030, 1, 1), "scores": {1: [None, True, 1.5]}}
+        stdlib = DefaultJSONProvider(app)
+        assert json.loads(app.json.dumps(value)) == json.loads(stdlib.dumps(value))
+
+
+class TestDatabaseRouting:
+    def test_reads_use_readonly_pool(self, app, client: httpx.Client) -> None:  # type: ignore[no-untyped-def]
+        client.get("/api/v1/posts/timeline")
+        pool = app.extensions["db_pool"]
+        assert pool.created == 1
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()["query_only"] == 1
+
+    def test_writes_use_writer(self, app, client: httpx.Client) -> None:  # type: ignore[no-untyped-def]
+        headers = _auth_header(_register(client))
+        resp = client.post("/api/v1/posts", json={"content": "Hi"}, headers=headers)
+        assert resp.status_code == 201
+        assert app.extensions["db_pool"].created == 0
+
+    def test_migrations_hold_the_write_gate(
+        self, settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import api.app
+        from goh.db.migrations.runner import run_migrations
+        from goh.observability.metrics import metrics
+
+        held: list[float] = []
+
+        def recording(db):  # type: ignore[no-untyped-def]
+            held.append(metrics.get_gauge("db.writer.busy"))
+            return run_migrations(db)
+
+        monkeypatch.setattr(api.app, "run_migrations", recording)
+        app = create_app(settings)
+        for name in ("background_queue", "notification_relay", "audit_sink", "password_hasher"):
+            app.extensions[name].close()
+        assert held == [1]
+
+
 class TestErrorHandling:
     def test_404(self, client: httpx.Client) -> None:
         resp = client.get("/api/v1/nonexistent")
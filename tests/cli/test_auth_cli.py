@@ -82,3 +82,17 @@ class TestAuthCLI:
         assert result.exit_code == 0
         data = _extract_json(result.output)
         assert data["username"] == "testuser"
+
+    def test_prune_sessions(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        db_path = _setup_db(tmp_path)
+        result = cli_runner.invoke(
+            cli,
+            ["--db", db_path, "auth", "register",
+             "-u", "testuser", "-e", "test@test.com", "-p", "password123"],
+        )
+        refresh_token = _extract_json(result.output)["refresh_token"]
+        cli_runner.invoke(cli, ["--db", db_path, "auth", "refresh", "-t", refresh_token])
+
+        result = cli_runner.invoke(cli, ["--db", db_path, "auth", "prune-sessions"])
+        assert result.exit_code == 0
+        assert _extract_json(result.output) == {"sessions": 1, "magic_links": 0}
@@ -7,6 +7,8 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from cli.main import cli
+from goh.db.connection import get_connection
+from goh.repositories import counter_repo
 
 
 class TestDBMigrate:
@@ -35,3 +37,23 @@ class TestDBStats:
         assert result.exit_code == 0
         assert "users" in result.output
         assert "Tables:" in result.output
+
+
+class TestDBRecount:
+    def test_recount_repairs_drift(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        cli_runner.invoke(cli, ["--db", db_path, "db", "migrate"])
+        db = get_connection(db_path)
+        db.execute(
+            """INSERT INTO users (username, email, display_name)
+               VALUES ('a', 'a@test.com', 'A'), ('b', 'b@test.com', 'B')"""
+        )
+        db.execute("INSERT INTO follows (follower_id, following_id) VALUES (1, 2)")
+        db.execute("UPDATE counters SET value = 7 WHERE name = 'followers'")
+        db.commit()
+
+        result = cli_runner.invoke(cli, ["--db", db_path, "db", "recount"])
+        assert result.exit_code == 0
+        assert "user.followers: 1 corrected" in result.output
+        assert counter_repo.get(db, "user", 2, "followers") == 1
+        db.close()
@@ -0,0 +1,50 @@
+"""Tests for search CLI commands."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cli.main import cli
+from goh.db.connection import get_connection
+
+
+def _extract_json(output: str) -> dict:
+    """Extract JSON from CLI output that may contain structlog lines."""
+    start = output.index("{")
+    depth = 0
+    for i, ch in enumerate(output[start:], start):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return json.loads(output[start : i + 1])
+    raise ValueError("No JSON found")
+
+
+class TestSearchCLI:
+    def test_reindex_and_query(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        cli_runner.invoke(cli, ["--db", db_path, "db", "migrate"])
+        db = get_connection(db_path)
+        db.execute(
+            "INSERT INTO users (username, email, display_name) VALUES ('gandalf', 'g@test.com', 'G')"
+        )
+        db.execute("INSERT INTO users_fts(users_fts) VALUES ('delete-all')")
+        db.commit()
+        db.close()
+
+        result = cli_runner.invoke(cli, ["--db", db_path, "search", "reindex"])
+        assert result.exit_code == 0
+        assert "users_fts: 1 rows" in result.output
+        assert "Rebuilt 4 full-text index(es)." in result.output
+
+        result = cli_runner.invoke(
+            cli, ["--db", db_path, "search", "query", "gan", "--type", "users"]
+        )
+        assert result.exit_code == 0
+        data = _extract_json(result.output)
+        assert [u["username"] for u in data["results"]["users"]] == ["gandalf"]
@@ -0,0 +1,41 @@
+"""Tests for the job worker CLI commands."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from cli.main import cli
+from goh.db.connection import get_connection
+from goh.db.transaction import transaction
+from goh.jobs.durable import configure_jobs, enqueue
+from goh.services import notification_service
+
+
+class TestWorkerRun:
+    def test_once_runs_queued_jobs(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test.db")
+        cli_runner.invoke(cli, ["--db", db_path, "db", "migrate"])
+        db = get_connection(db_path)
+        db.execute(
+            """INSERT INTO users (username, email, display_name)
+               VALUES ('a', 'a@test.com', 'A'), ('b', 'b@test.com', 'B')"""
+        )
+        db.execute("INSERT INTO follows (follower_id, following_id) VALUES (1, 2)")
+        configure_jobs(run_locally=False)
+        with transaction(db):
+            enqueue(db, "notification.follow", {"follower_id": 1, "following_id": 2})
+            enqueue(db, "notification.unknown", max_attempts=1)
+
+        result = cli_runner.invoke(cli, ["--db", db_path, "worker", "run", "--once"])
+        assert result.exit_code == 0
+        assert "Ran 2 job(s)." in result.output
+        assert notification_service.count_unread(db, 2) == 1
+
+        result = cli_runner.invoke(cli, ["--db", db_path, "worker", "status"])
+        status = json.loads(result.output)
+        assert status["counts"] == {"failed": 1}
+        assert status["failed"][0]["name"] == "notification.unknown"
+        db.close()
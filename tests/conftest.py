@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
 
 import pytest
 from click.testing import CliRunner
 
+from goh.auth.hasher import configure_hasher
+from goh.auth.tokens import configure_token_verifier
+from goh.cache.service_cache import configure_cache
+from goh.cache.timeline import configure_timeline_buffer
 from goh.db.connection import get_memory_connection
 from goh.db.migrations.runner import run_migrations
+from goh.jobs.background import configure_queue
+from goh.jobs.durable import configure_jobs
 from goh.observability.logging import setup_logging
 from goh.observability.metrics import metrics
+from goh.repositories import audit_repo, user_repo
 
 
 @pytest.fixture(autouse=True)
@@ -25,6 +33,62 @@ def _reset_metrics() -> None:
     metrics.reset()
 
 
+@pytest.fixture(autouse=True)
+def _reset_user_summaries() -> None:
+    """Clear the per-process user summary cache and completion index between tests."""
+    user_repo.clear_summary_cache()
+    user_repo.clear_completion_index()
+
+
+@pytest.fixture(autouse=True)
+def _reset_audit_sink() -> Iterator[None]:
+    """Drop any audit sink an app configured, so other tests write synchronously."""
+    yield
+    audit_repo.configure_sink(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache() -> Iterator[None]:
+    """Turn service caching back off after tests that configured a backend."""
+    yield
+    configure_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_timeline_buffer() -> Iterator[None]:
+    """Serve the timeline from SQL again after tests that installed a buffer."""
+    yield
+    configure_timeline_buffer(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_background_queue() -> Iterator[None]:
+    """Drop any background queue an app configured, so deferred work runs inline."""
+    yield
+    configure_queue(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_jobs() -> Iterator[None]:
+    """Run durable jobs in-process again after tests that handed them to a worker."""
+    yield
+    configure_jobs(run_locally=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_hasher() -> Iterator[None]:
+    """Go back to inline hashing after tests that configured a pooled hasher."""
+    yield
+    configure_hasher(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_token_verifier() -> Iterator[None]:
+    """Drop the verified-token cache an app installed."""
+    yield
+    configure_token_verifier(None)
+
+
 @pytest.fixture()
 def db() -> sqlite3.Connection:
     """In-memory SQLite connection with all migrations applied."""
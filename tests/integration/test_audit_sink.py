@@ -0,0 +1,100 @@
+"""Integration tests for the buffered audit sink."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from goh.db.audit_sink import AuditSink
+from goh.db.transaction import transaction
+from goh.observability.correlation import set_correlation_id
+from goh.repositories import audit_repo, user_repo
+from goh.services import post_service
+
+
+def _create_user(db: sqlite3.Connection, username: str = "testuser") -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+def _audit_rows(db: sqlite3.Connection) -> list[dict]:
+    return db.execute("SELECT * FROM audit_log ORDER BY id").fetchall()
+
+
+def _sink(db: sqlite3.Connection, **kwargs: object) -> AuditSink:
+    @contextmanager
+    def connection() -> Iterator[sqlite3.Connection]:
+        yield db
+
+    sink = AuditSink(connection, **kwargs)  # type: ignore[arg-type]
+    audit_repo.configure_sink(sink)
+    return sink
+
+
+class TestAuditSink:
+    def test_buffers_until_flush(self, db: sqlite3.Connection) -> None:
+        sink = _sink(db)
+        uid = _create_user(db)
+        set_correlation_id("req-123")
+        post_service.create_post(db, author_id=uid, content="Hello")
+        post_service.create_post(db, author_id=uid, content="World")
+
+        assert _audit_rows(db) == []
+        assert sink.pending == 2
+        assert sink.flush() == 2
+        rows = _audit_rows(db)
+        assert [r["action"] for r in rows] == ["create_post", "create_post"]
+        assert {r["correlation_id"] for r in rows} == {"req-123"}
+
+    def test_rolled_back_entries_are_dropped(self, db: sqlite3.Connection) -> None:
+        sink = _sink(db)
+        with pytest.raises(RuntimeError), transaction(db):
+            audit_repo.log_action(db, user_id=None, action="doomed", resource_type="test")
+            raise RuntimeError("abort")
+        assert sink.pending == 0
+
+    def test_durable_writes_through(self, db: sqlite3.Connection) -> None:
+        sink = _sink(db, durable=True)
+        uid = _create_user(db)
+        post_service.create_post(db, author_id=uid, content="Hello")
+        assert sink.pending == 0
+        assert [r["action"] for r in _audit_rows(db)] == ["create_post"]
+
+    def test_background_flush_on_batch_size(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        from goh.db.connection import get_connection
+        from goh.db.migrations.runner import run_migrations
+        from goh.db.writer import Writer
+
+        path = tmp_path / "audit.db"
+        run_migrations(get_connection(path))
+        writer = Writer(path)
+        sink = AuditSink(writer.connection, batch_size=3, flush_interval=60)
+        audit_repo.configure_sink(sink)
+        sink.start()
+        with writer.connection() as db:
+            for i in range(3):
+                with transaction(db):
+                    audit_repo.log_action(db, user_id=None, action=f"a{i}", resource_type="test")
+
+        deadline = time.monotonic() + 2.0
+        while sink.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sink.close()
+        reader = get_connection(path)
+        assert len(_audit_rows(reader)) == 3
+        writer.close()
+
+    def test_close_flushes(self, db: sqlite3.Connection) -> None:
+        sink = _sink(db, flush_interval=60)
+        sink.start()
+        with transaction(db):
+            audit_repo.log_action(db, user_id=None, action="last", resource_type="test")
+        sink.close()
+        assert [r["action"] for r in _audit_rows(db)] == ["last"]
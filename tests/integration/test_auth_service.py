@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import sqlite3
+from pathlib import Path
+from typing import Any
 
 import pytest
 
+from goh.auth.hasher import PasswordHasher, configure_hasher, hash_rounds
+from goh.db.migrations.runner import run_migrations
+from goh.db.writer import Writer
 from goh.domain.exceptions import (
     DuplicateError,
     InvalidCredentialsError,
     InvalidTokenError,
     ValidationError,
 )
+from goh.observability.metrics import metrics
+from goh.repositories import user_repo
 from goh.services import auth_service
 
 JWT_SECRET = "test-secret"
@@ -81,6 +88,66 @@ class TestLoginPassword:
         assert "access_token" in result
         assert "refresh_token" in result
 
+    def test_login_rehashes_when_cost_changes(self, db: sqlite3.Connection) -> None:
+        configure_hasher(PasswordHasher(rounds=4))
+        user_id = _register_user(db)["user"]["id"]
+        assert hash_rounds(user_repo.get_password_hash(db, user_id)) == 4
+
+        configure_hasher(PasswordHasher(rounds=5))
+        auth_service.login_password(
+            db, username="testuser", password="password123", jwt_secret=JWT_SECRET
+        )
+        assert hash_rounds(user_repo.get_password_hash(db, user_id)) == 5
+        assert metrics.get("auth.password.rehashed") == 1
+
+        auth_service.login_password(
+            db, username="testuser", password="password123", jwt_secret=JWT_SECRET
+        )
+        assert metrics.get("auth.password.rehashed") == 1
+
+    def test_bcrypt_runs_without_the_writer(self, tmp_path: Path) -> None:
+        writer = Writer(tmp_path / "auth.db")
+        with writer.connection() as conn:
+            run_migrations(conn)
+        held: list[bool] = []
+
+        class ProbingHasher(PasswordHasher):
+            def _run(self, *args: Any) -> Any:
+                held.append(writer.busy)
+                return super()._run(*args)
+
+        configure_hasher(ProbingHasher(rounds=4))
+        db = writer.checkout()
+        _register_user(db)
+        configure_hasher(ProbingHasher(rounds=5))  # login also rehashes
+        auth_service.login_password(
+            db, username="testuser", password="password123", jwt_secret=JWT_SECRET
+        )
+        writer.checkin(db)
+        writer.close()
+        assert held == [False, False, False]
+
+    def test_calibration_is_shared(
+        self, db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        timed = iter([13, 12])
+        monkeypatch.setattr(auth_service, "calibrate_rounds", lambda *a, **kw: next(timed))
+        assert auth_service.calibrated_rounds(db, 250, minimum=10) == 13
+        # A second worker reads the first one's result instead of timing its own
+        assert auth_service.calibrated_rounds(db, 250, minimum=10) == 13
+        assert auth_service.calibrated_rounds(db, 250, minimum=14) == 14
+
+    def test_workers_on_different_costs_settle(self, db: sqlite3.Connection) -> None:
+        configure_hasher(PasswordHasher(rounds=4))
+        user_id = _register_user(db)["user"]["id"]
+        for rounds in (5, 4, 5, 4):
+            configure_hasher(PasswordHasher(rounds=rounds))
+            auth_service.login_password(
+                db, username="testuser", password="password123", jwt_secret=JWT_SECRET
+            )
+        assert hash_rounds(user_repo.get_password_hash(db, user_id)) == 5
+        assert metrics.get("auth.password.rehashed") == 1
+
     def test_login_wrong_password(self, db: sqlite3.Connection) -> None:
         _register_user(db)
         with pytest.raises(InvalidCredentialsError):
@@ -149,6 +216,34 @@ class TestTokens:
             )
 
 
+class TestPruneSessions:
+    def test_expired_refresh_token_is_rejected(self, db: sqlite3.Connection) -> None:
+        result = _register_user(db)
+        db.execute("UPDATE sessions SET expires_at = '2000-01-01T00:00:00+00:00'")
+        with pytest.raises(InvalidTokenError):
+            auth_service.refresh_tokens(
+                db, refresh_token=result["refresh_token"], jwt_secret=JWT_SECRET
+            )
+
+    def test_prunes_revoked_and_expired_rows_in_batches(self, db: sqlite3.Connection) -> None:
+        first = _register_user(db, "first")
+        _register_user(db, "second")
+        live = _register_user(db, "third")
+        auth_service.logout(db, refresh_token=first["refresh_token"])
+        db.execute(
+            """UPDATE sessions SET expires_at = '2000-01-01T00:00:00+00:00'
+               WHERE user_id = (SELECT id FROM users WHERE username = 'second')"""
+        )
+        auth_service.create_magic_link(db, email="first@test.com")
+        auth_service.create_magic_link(db, email="second@test.com", expires_minutes=-1)
+
+        result = auth_service.prune_sessions(db, batch_size=1)
+        assert result == {"sessions": 2, "magic_links": 1}
+        assert db.execute("SELECT COUNT(*) AS n FROM sessions").fetchone()["n"] == 1
+        assert db.execute("SELECT COUNT(*) AS n FROM magic_links").fetchone()["n"] == 1
+        auth_service.refresh_tokens(db, refresh_token=live["refresh_token"], jwt_secret=JWT_SECRET)
+
+
 class TestLogout:
     def test_logout_revokes_session(self, db: sqlite3.Connection) -> None:
         result = _register_user(db)
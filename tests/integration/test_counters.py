@@ -0,0 +1,126 @@
+"""Integration tests for the trigger-maintained counters."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from goh.repositories import counter_repo, user_repo
+from goh.services import (
+    campaign_service,
+    event_service,
+    follow_service,
+    notification_service,
+    post_service,
+    user_service,
+)
+
+
+def _create_user(db: sqlite3.Connection, username: str) -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+class TestCounters:
+    def test_profile_counts(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        follow_service.follow_user(db, alice, bob)  # idempotent
+        post = post_service.create_post(db, author_id=bob, content="Hello")
+        post_service.create_post(db, author_id=bob, content="Again")
+
+        profile = user_service.get_profile(db, bob)
+        assert profile["followers_count"] == 1
+        assert profile["posts_count"] == 2
+        assert user_service.get_profile(db, alice)["following_count"] == 1
+
+        follow_service.unfollow_user(db, alice, bob)
+        post_service.delete_post(db, post["id"], bob)
+        profile = user_service.get_profile(db, bob)
+        assert profile["followers_count"] == 0
+        assert profile["posts_count"] == 1
+
+    def test_going_follows_rsvp_status(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        event = event_service.create_event(
+            db, organizer_id=alice, title="One-shot", start_time="2030-01-01T18:00:00"
+        )
+        event_service.rsvp_event(db, event["id"], alice)
+        event_service.rsvp_event(db, event["id"], bob, status="maybe")
+        assert event_service.get_event(db, event["id"])["going_count"] == 1
+
+        event_service.rsvp_event(db, event["id"], bob)
+        assert event_service.get_event(db, event["id"])["going_count"] == 2
+        event_service.rsvp_event(db, event["id"], alice, status="not_going")
+        assert event_service.get_event(db, event["id"])["going_count"] == 1
+
+    def test_campaign_members(self, db: sqlite3.Connection) -> None:
+        dm = _create_user(db, "dm")
+        player = _create_user(db, "player")
+        camp = campaign_service.create_campaign(db, dm_id=dm, name="Curse of Strahd")
+        before = campaign_service.get_campaign(db, camp["id"])["member_count"]
+        campaign_service.join_campaign(db, camp["id"], player)
+        assert campaign_service.get_campaign(db, camp["id"])["member_count"] == before + 1
+        campaign_service.leave_campaign(db, camp["id"], player)
+        assert campaign_service.get_campaign(db, camp["id"])["member_count"] == before
+
+    def test_unread_notifications(self, db: sqlite3.Connection) -> None:
+        bob = _create_user(db, "bob")
+        for title in ("One", "Two", "Three"):
+            notification_service.notify_many(db, [bob], type="announcement", title=title)
+        assert notification_service.count_unread(db, bob) == 3
+
+        first = notification_service.list_notifications(db, bob)[0]
+        notification_service.mark_read(db, first["id"], bob)
+        notification_service.mark_read(db, first["id"], bob)  # already read
+        assert notification_service.count_unread(db, bob) == 2
+
+        db.execute("DELETE FROM notifications WHERE id = (SELECT MIN(id) FROM notifications)")
+        assert notification_service.count_unread(db, bob) == 1
+        notification_service.mark_all_read(db, bob)
+        assert notification_service.count_unread(db, bob) == 0
+        assert counter_repo.recount(db)["user.unread_notifications"] == 0
+
+    def test_cascade_delete_updates_counts(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        db.execute("DELETE FROM users WHERE id = ?", (alice,))
+        assert counter_repo.get(db, "user", bob, "followers") == 0
+        assert counter_repo.get_all(db, "user", alice) == {}
+
+    def test_recount(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        assert counter_repo.recount(db)["user.followers"] == 0
+
+        db.execute("UPDATE counters SET value = 5 WHERE name = 'followers'")
+        db.execute("DELETE FROM counters WHERE name = 'following'")
+        corrected = counter_repo.recount(db)
+        assert corrected["user.followers"] == 1
+        assert corrected["user.following"] == 1
+        assert counter_repo.get(db, "user", bob, "followers") == 1
+        assert counter_repo.get(db, "user", alice, "following") == 1
+
+    def test_resource_versions(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        before = counter_repo.get_all(db, "version", 0)
+        post = post_service.create_post(db, author_id=alice, content="Hello")
+        event_service.create_event(
+            db, organizer_id=alice, title="One-shot", start_time="2030-01-01T18:00:00"
+        )
+        after = counter_repo.get_all(db, "version", 0)
+        assert after["posts"] == before.get("posts", 0) + 1
+        assert after["events"] > before.get("events", 0)
+        assert after["users"] == before["users"]
+
+        # Columns outside the public user shape leave the version alone
+        db.execute("UPDATE users SET email = 'new@test.com' WHERE id = ?", (alice,))
+        assert counter_repo.get(db, "version", 0, "users") == after["users"]
+        post_service.delete_post(db, post["id"], alice)
+        assert counter_repo.get(db, "version", 0, "posts") == after["posts"] + 1
@@ -0,0 +1,172 @@
+"""Integration tests for the durable job queue and its worker."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from goh.db.connection import get_connection
+from goh.db.migrations.runner import run_migrations
+from goh.db.transaction import transaction
+from goh.jobs import durable
+from goh.jobs.durable import configure_jobs, enqueue, job, run_next
+from goh.jobs.worker import Worker
+from goh.observability.metrics import metrics
+from goh.repositories import job_repo, user_repo
+from goh.services import follow_service, notification_service
+
+ran: list[tuple[str, dict]] = []
+
+
+@job("test.record")
+def _record(db: sqlite3.Connection, payload: dict) -> None:
+    ran.append(("test.record", payload))
+
+
+@job("test.boom")
+def _boom(db: sqlite3.Connection, payload: dict) -> None:
+    db.execute("INSERT INTO users (username, email, display_name) VALUES ('x', 'x@t', 'X')")
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def _queue_only() -> None:
+    """Leave jobs in the table so tests drive the worker side explicitly."""
+    ran.clear()
+    configure_jobs(run_locally=False)
+
+
+def _enqueue(db: sqlite3.Connection, name: str, payload: dict | None = None, **kwargs) -> int | None:  # type: ignore[no-untyped-def]
+    with transaction(db):
+        return enqueue(db, name, payload, **kwargs)
+
+
+def _create_user(db: sqlite3.Connection, username: str) -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+class TestQueue:
+    def test_runs_by_priority_then_age(self, db: sqlite3.Connection) -> None:
+        _enqueue(db, "test.record", {"n": 1})
+        _enqueue(db, "test.record", {"n": 2}, priority=10)
+        _enqueue(db, "test.record", {"n": 3})
+        while run_next(db):
+            pass
+        assert [p["n"] for _, p in ran] == [2, 1, 3]
+        assert job_repo.count_by_status(db) == {}
+        assert metrics.get("jobs.completed") == 3
+        assert metrics.snapshot()["jobs.test.record.count"] == 3
+
+    def test_idempotency_key_dedupes_pending_jobs(self, db: sqlite3.Connection) -> None:
+        assert _enqueue(db, "test.record", idempotency_key="k") is not None
+        assert _enqueue(db, "test.record", idempotency_key="k") is None
+        run_next(db)
+        assert _enqueue(db, "test.record", idempotency_key="k") is not None
+        assert metrics.get("jobs.deduplicated") == 1
+
+    def test_delayed_job_waits(self, db: sqlite3.Connection) -> None:
+        _enqueue(db, "test.record", delay=60)
+        assert run_next(db) is False
+
+    def test_failure_rolls_back_and_retries_with_backoff(self, db: sqlite3.Connection) -> None:
+        job_id = _enqueue(db, "test.boom", max_attempts=2)
+        assert run_next(db) is True
+        retried = job_repo.find_by_id(db, job_id)
+        assert retried.status == "queued"
+        assert retried.attempts == 1
+        assert retried.run_after > time.time()
+        assert retried.last_error == "RuntimeError: boom"
+        assert user_repo.find_by_username(db, "x") is None
+        assert metrics.get("jobs.retried") == 1
+
+        db.execute("UPDATE jobs SET run_after = 0 WHERE id = ?", (job_id,))
+        run_next(db)
+        assert job_repo.find_by_id(db, job_id).status == "failed"
+        assert metrics.get("jobs.failed") == 1
+
+    def test_unknown_job_fails_over_attempts(self, db: sqlite3.Connection) -> None:
+        job_id = _enqueue(db, "test.missing", max_attempts=1)
+        run_next(db)
+        failed = job_repo.find_by_id(db, job_id)
+        assert failed.status == "failed"
+        assert "No handler registered" in failed.last_error
+
+    def test_expired_lease_is_released(self, db: sqlite3.Connection) -> None:
+        job_id = _enqueue(db, "test.record")
+        with transaction(db):
+            job_repo.claim(db, now=time.time(), locked_until=time.time() - 1)
+        assert durable.release_expired(db) == 1
+        assert job_repo.find_by_id(db, job_id).status == "queued"
+        assert run_next(db) is True
+        assert len(ran) == 1
+
+    def test_runs_after_commit_without_external_worker(self, db: sqlite3.Connection) -> None:
+        configure_jobs(run_locally=True)
+        _enqueue(db, "test.record", {"n": 1})
+        assert ran == [("test.record", {"n": 1})]
+
+    def test_rolled_back_job_never_exists(self, db: sqlite3.Connection) -> None:
+        with pytest.raises(RuntimeError), transaction(db):
+            enqueue(db, "test.record")
+            raise RuntimeError("rollback")
+        assert run_next(db) is False
+
+
+class TestFollowNotificationJob:
+    def test_follow_notification_runs_as_job(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        assert notification_service.count_unread(db, bob) == 0
+        assert run_next(db) is True
+        assert notification_service.count_unread(db, bob) == 1
+
+    def test_skipped_when_unfollowed_first(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        follow_service.unfollow_user(db, alice, bob)
+        run_next(db)
+        assert notification_service.count_unread(db, bob) == 0
+
+
+class TestNotificationFanOutJob:
+    def test_background_fan_out_is_durable(self, db: sqlite3.Connection) -> None:
+        users = [_create_user(db, f"user{i}") for i in range(3)]
+        notification_service.notify_many(
+            db, users, type="announcement", title="Hi", background=True
+        )
+        assert job_repo.count_by_status(db) == {"queued": 1}
+        assert notification_service.count_unread(db, users[0]) == 0
+        assert run_next(db) is True
+        assert all(notification_service.count_unread(db, uid) == 1 for uid in users)
+
+
+class TestWorker:
+    def test_threads_drain_the_queue(self, tmp_path: Path) -> None:
+        path = tmp_path / "jobs.db"
+        setup = get_connection(path)
+        run_migrations(setup)
+        for n in range(10):
+            _enqueue(setup, "test.record", {"n": n})
+
+        worker = Worker(
+            lambda: get_connection(path, check_same_thread=False),
+            concurrency=3,
+            poll_interval=0.01,
+        )
+        worker.start()
+        deadline = time.monotonic() + 5
+        while len(ran) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        worker.stop()
+        assert sorted(p["n"] for _, p in ran) == list(range(10))
+        assert job_repo.count_by_status(setup) == {}
+        setup.close()
@@ -0,0 +1,110 @@
+"""Integration tests for multi-recipient notifications and the background queue."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from goh.db.connection import get_connection
+from goh.db.migrations.runner import run_migrations
+from goh.jobs.background import BackgroundQueue, configure_queue
+from goh.repositories import user_repo
+from goh.services import (
+    campaign_service,
+    event_service,
+    notification_service,
+    session_log_service,
+)
+
+
+def _create_user(db: sqlite3.Connection, username: str) -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+def _types(db: sqlite3.Connection, user_id: int) -> list[str]:
+    return [n["type"] for n in notification_service.list_notifications(db, user_id)]
+
+
+class TestNotifyMany:
+    def test_single_commit(self, db: sqlite3.Connection) -> None:
+        users = [_create_user(db, f"user{i}") for i in range(20)]
+        commits: list[str] = []
+        db.set_trace_callback(lambda sql: commits.append(sql) if sql == "COMMIT" else None)
+        sent = notification_service.notify_many(db, users, type="announcement", title="Hi")
+        db.set_trace_callback(None)
+        assert sent == 20
+        assert len(commits) == 1
+        assert all(notification_service.count_unread(db, uid) == 1 for uid in users)
+
+    def test_deduplicates_and_skips_missing_users(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        assert notification_service.notify_many(
+            db, [alice, alice, 999], type="announcement", title="Hi"
+        ) == 1
+        assert notification_service.count_unread(db, alice) == 1
+
+    def test_empty(self, db: sqlite3.Connection) -> None:
+        assert notification_service.notify_many(db, [], type="announcement", title="Hi") == 0
+
+    def test_cancel_event_notifies_attendees(self, db: sqlite3.Connection) -> None:
+        host = _create_user(db, "host")
+        going = _create_user(db, "going")
+        maybe = _create_user(db, "maybe")
+        declined = _create_user(db, "declined")
+        event = event_service.create_event(
+            db, organizer_id=host, title="One-shot", start_time="2030-01-01T18:00:00"
+        )
+        event_service.rsvp_event(db, event["id"], host)
+        event_service.rsvp_event(db, event["id"], going)
+        event_service.rsvp_event(db, event["id"], maybe, status="maybe")
+        event_service.rsvp_event(db, event["id"], declined, status="not_going")
+
+        event_service.cancel_event(db, event["id"], host)
+        assert _types(db, going) == ["event_cancelled"]
+        assert _types(db, maybe) == ["event_cancelled"]
+        assert _types(db, declined) == []
+        assert _types(db, host) == []
+
+    def test_session_log_notifies_members(self, db: sqlite3.Connection) -> None:
+        dm = _create_user(db, "dm")
+        players = [_create_user(db, f"player{i}") for i in range(3)]
+        camp = campaign_service.create_campaign(db, dm_id=dm, name="Curse of Strahd")
+        for player in players:
+            campaign_service.join_campaign(db, camp["id"], player)
+
+        session_log_service.create_session_log(
+            db, campaign_id=camp["id"], author_id=players[0], session_number=1, title="Barovia"
+        )
+        assert _types(db, players[0]) == []
+        assert all(_types(db, uid) == ["session_log"] for uid in players[1:])
+
+
+class TestBackgroundQueue:
+    def test_runs_after_commit_off_thread(self, tmp_path: Path) -> None:
+        db = get_connection(tmp_path / "bg.db", check_same_thread=False)
+        run_migrations(db)
+
+        @contextmanager
+        def connection() -> Iterator[sqlite3.Connection]:
+            yield db
+
+        background = BackgroundQueue(connection)
+        configure_queue(background)
+        users = [_create_user(db, f"user{i}") for i in range(3)]
+
+        queued = notification_service.notify_many(
+            db, users, type="announcement", title="Hi", background=True
+        )
+        assert queued == 3
+        assert notification_service.count_unread(db, users[0]) == 0
+
+        background.start()
+        background.close()  # drains the queue
+        assert all(notification_service.count_unread(db, uid) == 1 for uid in users)
+        db.close()
@@ -0,0 +1,119 @@
+"""Integration tests for the notification bus and the cross-worker relay."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from goh.observability.metrics import metrics
+from goh.realtime.bus import NotificationBus, bus
+from goh.realtime.relay import ChangeRelay
+from goh.repositories import user_repo
+from goh.services import follow_service, notification_service
+
+
+def _create_user(db: sqlite3.Connection, username: str) -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+def _relay(db: sqlite3.Connection, target: NotificationBus) -> ChangeRelay:
+    @contextmanager
+    def writer() -> Iterator[sqlite3.Connection]:
+        yield db
+
+    relay = ChangeRelay(lambda: db, writer, target=target)
+    relay._conn = db
+    return relay
+
+
+class TestNotificationBus:
+    def test_publish_reaches_only_that_user(self) -> None:
+        local = NotificationBus()
+        alice = local.subscribe(1)
+        bob = local.subscribe(2)
+        assert local.publish(1, {"event": "unread", "data": {}}) == 1
+        assert alice.qsize() == 1
+        assert bob.qsize() == 0
+        assert metrics.get_gauge("notifications.stream.connections") == 2
+
+    def test_slow_subscriber_drops_oldest(self) -> None:
+        local = NotificationBus(max_queue=2)
+        subscription = local.subscribe(1)
+        for i in range(3):
+            local.publish(1, {"event": "unread", "data": {"unread": i}})
+        assert [subscription.get_nowait()["data"]["unread"] for _ in range(2)] == [1, 2]
+        assert metrics.get("notifications.stream.dropped") == 1
+
+    def test_listen_heartbeats_and_unsubscribes(self) -> None:
+        local = NotificationBus()
+        subscription = local.subscribe(1)
+        local.publish(1, {"event": "unread", "data": {}, "published_at": time.time()})
+        received = list(local.listen(1, subscription, max_seconds=0.15, heartbeat=0.05))
+        assert received[0]["event"] == "unread"
+        assert None in received
+        assert local.connections == 0
+        assert metrics.snapshot()["notifications.delivery_lag.count"] == 1
+
+
+class TestNotificationEvents:
+    def test_published_on_commit(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        subscription = bus.subscribe(bob)
+        try:
+            follow_service.follow_user(db, alice, bob)
+            message = subscription.get_nowait()
+            assert message["event"] == "notification"
+            assert message["data"]["unread"] == 1
+
+            notification_service.mark_all_read(db, bob)
+            assert subscription.get_nowait()["data"] == {"unread": 0}
+            notification_service.mark_all_read(db, bob)
+            assert subscription.empty()
+        finally:
+            bus.unsubscribe(bob, subscription)
+
+
+class TestChangeRelay:
+    def test_relays_changes_from_other_processes(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        local = NotificationBus()
+        relay = _relay(db, local)
+        subscription = local.subscribe(bob)
+
+        follow_service.follow_user(db, alice, bob)  # recorded by this process
+        message = {"event": "unread", "data": {"unread": 0}, "published_at": time.time()}
+        db.execute(
+            """INSERT INTO notification_changes (user_id, origin, payload, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (bob, -1, json.dumps(message), message["published_at"]),
+        )
+        assert relay.poll() == 1
+        assert subscription.get_nowait() == message
+        assert relay.poll() == 0
+
+    def test_skips_backlog_without_listeners(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        local = NotificationBus()
+        relay = _relay(db, local)
+        follow_service.follow_user(db, alice, bob)
+        assert relay.poll() == 0
+        assert relay._last_id == 1
+
+    def test_prune(self, db: sqlite3.Connection) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        follow_service.follow_user(db, alice, bob)
+        relay = _relay(db, NotificationBus())
+        assert relay.prune() == 0
+        relay.retention = -1
+        assert relay.prune() == 1
@@ -0,0 +1,110 @@
+"""Integration tests for full-text search."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from goh.domain.exceptions import ValidationError
+from goh.repositories import fulltext, user_repo
+from goh.services import (
+    campaign_service,
+    event_service,
+    post_service,
+    search_service,
+    user_service,
+)
+
+
+def _create_user(db: sqlite3.Connection, username: str, display_name: str = "") -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=display_name or username.title(),
+    )
+    return user.id
+
+
+class TestMatchExpression:
+    def test_words_become_prefix_terms(self) -> None:
+        assert fulltext.match_expression("gan dal") == '"gan"* "dal"*'
+
+    def test_syntax_is_dropped(self) -> None:
+        assert fulltext.match_expression('a" OR b* NEAR(c') == '"a"* "OR"* "b"* "NEAR"* "c"*'
+        assert fulltext.match_expression("snake_case") == '"snake"* "case"*'
+
+    def test_no_words(self) -> None:
+        assert fulltext.match_expression(' "*()- ') is None
+
+
+class TestSearchService:
+    def test_search_all_kinds(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db, "dragonslayer", "Siegfried")
+        _create_user(db, "aragorn")
+        post_service.create_post(db, author_id=uid, content="Slew a red dragon today")
+        post_service.create_post(db, author_id=uid, content="Quiet tavern evening")
+        event_service.create_event(
+            db, organizer_id=uid, title="Dragon Hunt", start_time="2026-03-01T18:00:00",
+        )
+        campaign_service.create_campaign(
+            db, dm_id=uid, name="Curse of Strahd", description="Dragons optional",
+        )
+
+        result = search_service.search(db, "drag")
+        results = result["results"]
+        assert [u["username"] for u in results["users"]] == ["dragonslayer"]
+        assert [p["content"] for p in results["posts"]] == ["Slew a red dragon today"]
+        assert results["posts"][0]["author"]["username"] == "dragonslayer"
+        assert [e["title"] for e in results["events"]] == ["Dragon Hunt"]
+        assert [c["name"] for c in results["campaigns"]] == ["Curse of Strahd"]
+
+    def test_ranked_by_relevance(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db, "bard")
+        post_service.create_post(db, author_id=uid, content="lute " + "filler words " * 20)
+        post_service.create_post(db, author_id=uid, content="lute lute lute")
+        posts = search_service.search(db, "lute", kinds=["posts"])["results"]["posts"]
+        assert [p["content"] for p in posts][0] == "lute lute lute"
+
+    def test_all_words_must_match(self, db: sqlite3.Connection) -> None:
+        _create_user(db, "gandalf", "Gandalf Grey")
+        _create_user(db, "saruman", "Saruman White")
+        assert len(user_service.search_users(db, "gan grey")) == 1
+        assert user_service.search_users(db, "gan white") == []
+
+    def test_kinds_filter(self, db: sqlite3.Connection) -> None:
+        _create_user(db, "gandalf")
+        result = search_service.search(db, "gan", kinds=["users"])
+        assert list(result["results"]) == ["users"]
+
+    def test_unknown_kind(self, db: sqlite3.Connection) -> None:
+        with pytest.raises(ValidationError, match="Unknown search type"):
+            search_service.search(db, "gan", kinds=["spells"])
+
+    def test_empty_query(self, db: sqlite3.Connection) -> None:
+        _create_user(db, "gandalf")
+        assert search_service.search(db, "  ")["results"]["users"] == []
+
+
+class TestIndexSync:
+    def test_profile_update_reindexes(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db, "strider")
+        user_service.update_profile(db, uid, display_name="Elessar")
+        assert [u["id"] for u in user_service.search_users(db, "eless")] == [uid]
+        assert user_service.search_users(db, "strider")[0]["id"] == uid
+
+    def test_deleted_post_leaves_index(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db, "bard")
+        post = post_service.create_post(db, author_id=uid, content="Ballad of the lost")
+        post_service.delete_post(db, post["id"], uid)
+        assert search_service.search(db, "ballad", kinds=["posts"])["results"]["posts"] == []
+
+    def test_reindex_rebuilds_from_content(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db, "gandalf")
+        # Empty the index behind the triggers' back
+        db.execute("INSERT INTO users_fts(users_fts) VALUES ('delete-all')")
+        assert user_service.search_users(db, "gan") == []
+
+        counts = search_service.reindex(db)
+        assert counts["users_fts"] == 1
+        assert [u["id"] for u in user_service.search_users(db, "gan")] == [uid]
+        db.execute("INSERT INTO users_fts(users_fts) VALUES ('integrity-check')")
@@ -0,0 +1,152 @@
+"""Integration tests for cached service reads and write-through invalidation."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from goh.cache.backends import MemoryCache
+from goh.cache.service_cache import configure_cache
+from goh.domain.exceptions import ForbiddenError, NotFoundError
+from goh.observability.metrics import metrics
+from goh.repositories import user_repo
+from goh.services import (
+    campaign_service,
+    event_service,
+    follow_service,
+    notification_service,
+    post_service,
+    user_service,
+)
+
+
+@pytest.fixture()
+def cache() -> Iterator[MemoryCache]:
+    cache = MemoryCache()
+    configure_cache(cache, ttl=60)
+    yield cache
+
+
+def _create_user(db: sqlite3.Connection, username: str) -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+def _queries(db: sqlite3.Connection) -> list[str]:
+    statements: list[str] = []
+    db.set_trace_callback(statements.append)
+    return statements
+
+
+class TestServiceCache:
+    def test_hit_skips_database(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        uid = _create_user(db, "alice")
+        first = user_service.get_profile(db, uid)
+        statements = _queries(db)
+        assert user_service.get_profile(db, uid) == first
+        assert statements == []
+        assert metrics.get("cache.miss") == 1
+        assert metrics.get("cache.hit") == 1
+        assert metrics.get("cache.user.profile.hit") == 1
+
+    def test_not_found_is_not_cached(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        with pytest.raises(NotFoundError):
+            post_service.get_post(db, 999)
+        assert cache.get("post:999") is None
+
+    def test_update_profile_invalidates(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        uid = _create_user(db, "alice")
+        user_service.get_profile(db, uid)
+        user_service.update_profile(db, uid, bio="Bard")
+        assert user_service.get_profile(db, uid)["bio"] == "Bard"
+
+    def test_follow_invalidates_both_profiles(
+        self, db: sqlite3.Connection, cache: MemoryCache
+    ) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        user_service.get_profile(db, alice)
+        user_service.get_profile(db, bob)
+        follow_service.follow_user(db, alice, bob)
+        assert user_service.get_profile(db, alice)["following_count"] == 1
+        assert user_service.get_profile(db, bob)["followers_count"] == 1
+
+    def test_cached_post_follows_profile_edits(
+        self, db: sqlite3.Connection, cache: MemoryCache
+    ) -> None:
+        uid = _create_user(db, "alice")
+        post = post_service.create_post(db, author_id=uid, content="Hello")
+        assert post_service.get_post(db, post["id"]) == post
+        user_service.update_profile(db, uid, display_name="Alicia", avatar="/a.png")
+        author = post_service.get_post(db, post["id"])["author"]
+        assert author == {"username": "alice", "display_name": "Alicia", "avatar": "/a.png"}
+        assert metrics.get("cache.post.hit") == 1
+
+    def test_cached_event_and_campaign_follow_profile_edits(
+        self, db: sqlite3.Connection, cache: MemoryCache
+    ) -> None:
+        uid = _create_user(db, "alice")
+        event = event_service.create_event(
+            db, organizer_id=uid, title="One-shot", start_time="2030-01-01T18:00:00"
+        )
+        event_service.rsvp_event(db, event["id"], uid)
+        camp = campaign_service.create_campaign(db, dm_id=uid, name="Curse of Strahd")
+        event_service.get_event(db, event["id"])
+        campaign_service.get_campaign(db, camp["id"])
+
+        user_service.update_profile(db, uid, display_name="Alicia")
+        assert event_service.get_event(db, event["id"])["rsvps"][0]["display_name"] == "Alicia"
+        member = campaign_service.get_campaign(db, camp["id"])["members"][0]
+        assert (member["username"], member["display_name"]) == ("alice", "Alicia")
+        assert metrics.get("cache.event.hit") == 1
+        assert metrics.get("cache.campaign.hit") == 1
+
+    def test_delete_post_invalidates(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        uid = _create_user(db, "alice")
+        post = post_service.create_post(db, author_id=uid, content="Hello")
+        post_service.get_post(db, post["id"])
+        post_service.delete_post(db, post["id"], uid)
+        assert cache.get(f"post:{post['id']}") is None
+
+    def test_rsvp_invalidates(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        uid = _create_user(db, "alice")
+        event = event_service.create_event(
+            db, organizer_id=uid, title="One-shot", start_time="2030-01-01T18:00:00"
+        )
+        assert event_service.get_event(db, event["id"])["going_count"] == 0
+        event_service.rsvp_event(db, event["id"], uid)
+        assert event_service.get_event(db, event["id"])["going_count"] == 1
+
+    def test_join_campaign_invalidates(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        dm = _create_user(db, "dm")
+        player = _create_user(db, "player")
+        camp = campaign_service.create_campaign(db, dm_id=dm, name="Curse of Strahd")
+        before = campaign_service.get_campaign(db, camp["id"])["member_count"]
+        campaign_service.join_campaign(db, camp["id"], player)
+        assert campaign_service.get_campaign(db, camp["id"])["member_count"] == before + 1
+
+    def test_unread_count_invalidated_by_notifications(
+        self, db: sqlite3.Connection, cache: MemoryCache
+    ) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        assert notification_service.count_unread(db, bob) == 0
+        follow_service.follow_user(db, alice, bob)
+        assert notification_service.count_unread(db, bob) == 1
+        notification_service.mark_all_read(db, bob)
+        assert notification_service.count_unread(db, bob) == 0
+        assert metrics.get("cache.notifications.unread.hit") == 0
+
+    def test_failed_write_keeps_entry(self, db: sqlite3.Connection, cache: MemoryCache) -> None:
+        alice = _create_user(db, "alice")
+        bob = _create_user(db, "bob")
+        post = post_service.create_post(db, author_id=alice, content="Hello")
+        post_service.get_post(db, post["id"])
+        with pytest.raises(ForbiddenError):
+            post_service.delete_post(db, post["id"], bob)
+        assert cache.get(f"post:{post['id']}") is not None
@@ -6,8 +6,9 @@ import sqlite3
 
 import pytest
 
+from goh.db.transaction import transaction
 from goh.domain.exceptions import ForbiddenError, NotFoundError, ValidationError
-from goh.repositories import user_repo
+from goh.repositories import feed_repo, post_repo, user_repo
 from goh.services import follow_service, notification_service, post_service, user_service
 
 
@@ -81,6 +82,59 @@ class TestPostService:
         assert "alice" in authors
         assert "charlie" not in authors
 
+    def test_feed_backfilled_on_follow(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        post_service.create_post(db, author_id=uid2, content="Before the follow")
+
+        assert post_service.get_feed(db, uid1) == []
+        follow_service.follow_user(db, uid1, uid2)
+        feed = post_service.get_feed(db, uid1)
+        assert [p["content"] for p in feed] == ["Before the follow"]
+
+    def test_feed_pruned_on_unfollow(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        follow_service.follow_user(db, uid1, uid2)
+        post_service.create_post(db, author_id=uid2, content="Bob's post")
+
+        follow_service.unfollow_user(db, uid1, uid2)
+        assert post_service.get_feed(db, uid1) == []
+
+    def test_deleted_post_leaves_feed(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        follow_service.follow_user(db, uid1, uid2)
+        post = post_service.create_post(db, author_id=uid2, content="Oops")
+
+        post_service.delete_post(db, post["id"], uid2)
+        assert post_service.get_feed(db, uid1) == []
+        row = db.execute("SELECT COUNT(*) as cnt FROM feed_items").fetchone()
+        assert row["cnt"] == 0
+
+    def test_feed_merges_high_follower_authors(
+        self, db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(feed_repo, "FANOUT_FOLLOWER_THRESHOLD", 2)
+        star = _create_user(db, "star")
+        fan1 = _create_user(db, "fan1")
+        fan2 = _create_user(db, "fan2")
+        follow_service.follow_user(db, fan1, star)
+        follow_service.follow_user(db, fan2, star)
+        assert feed_repo.is_merged_author(db, star)
+
+        post_service.create_post(db, author_id=star, content="Hello fans")
+        post_service.create_post(db, author_id=fan1, content="Fan post")
+        # Only the author's own inbox row is written for merged authors
+        row = db.execute(
+            "SELECT COUNT(*) as cnt FROM feed_items WHERE author_id = ?", (star,)
+        ).fetchone()
+        assert row["cnt"] == 1
+
+        feed = post_service.get_feed(db, fan1)
+        assert {p["content"] for p in feed} == {"Hello fans", "Fan post"}
+        assert [p["content"] for p in post_service.get_feed(db, fan2)] == ["Hello fans"]
+
     def test_timeline(self, db: sqlite3.Connection) -> None:
         uid1 = _create_user(db, "user1")
         uid2 = _create_user(db, "user2")
@@ -89,6 +143,74 @@ class TestPostService:
         timeline = post_service.get_timeline(db)
         assert len(timeline) == 2
 
+    def test_timeline_pages(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        # Posts created in the same second share created_at; the id breaks the tie
+        for i in range(5):
+            post_service.create_post(db, author_id=uid, content=f"Post {i}")
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = post_service.get_timeline_page(db, limit=2, cursor=cursor)
+            seen.extend(p["content"] for p in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [f"Post {i}" for i in reversed(range(5))]
+
+    def test_timeline_page_stable_under_inserts(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        for i in range(3):
+            post_service.create_post(db, author_id=uid, content=f"Post {i}")
+
+        first = post_service.get_timeline_page(db, limit=2)
+        post_service.create_post(db, author_id=uid, content="Newer")
+        second = post_service.get_timeline_page(db, limit=2, cursor=first["next_cursor"])
+        assert [p["content"] for p in second["items"]] == ["Post 0"]
+        assert second["next_cursor"] is None
+
+    def test_feed_page_with_merged_authors(
+        self, db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(feed_repo, "FANOUT_FOLLOWER_THRESHOLD", 1)
+        star = _create_user(db, "star")
+        fan = _create_user(db, "fan")
+        follow_service.follow_user(db, fan, star)
+        for i in range(3):
+            post_service.create_post(db, author_id=star, content=f"Star {i}")
+            post_service.create_post(db, author_id=fan, content=f"Fan {i}")
+
+        first = post_service.get_feed_page(db, fan, limit=4)
+        second = post_service.get_feed_page(db, fan, limit=4, cursor=first["next_cursor"])
+        contents = [p["content"] for p in first["items"] + second["items"]]
+        assert len(contents) == 6
+        assert set(contents) == {f"Star {i}" for i in range(3)} | {f"Fan {i}" for i in range(3)}
+        assert second["next_cursor"] is None
+
+    def test_json_listings_match_entities(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        other = _create_user(db, "other")
+        follow_service.follow_user(db, uid, other)
+        for i in range(3):
+            post_service.create_post(db, author_id=uid, content=f"Mine {i}")
+            post_service.create_post(db, author_id=other, content=f"Theirs {i}")
+
+        def as_dicts(posts: list) -> list[dict]:
+            return [p.to_dict() for p in posts]
+
+        assert post_repo.timeline_json(db) == as_dicts(post_repo.timeline(db))
+        assert post_repo.feed_json(db, uid) == as_dicts(post_repo.feed(db, uid))
+        assert post_repo.list_by_author_json(db, other) == as_dicts(
+            post_repo.list_by_author(db, other)
+        )
+        page = post_repo.timeline_page_json(db, limit=4)
+        assert page.next_cursor == post_repo.timeline_page(db, limit=4).next_cursor
+
+    def test_invalid_cursor(self, db: sqlite3.Connection) -> None:
+        with pytest.raises(ValidationError, match="cursor"):
+            post_service.get_timeline_page(db, cursor="not-a-cursor")
+
 
 class TestFollowService:
     def test_follow_and_unfollow(self, db: sqlite3.Connection) -> None:
@@ -135,6 +257,17 @@ class TestFollowService:
         assert len(following) == 1
         assert following[0]["username"] == "bob"
 
+    def test_followers_pages(self, db: sqlite3.Connection) -> None:
+        target = _create_user(db, "target")
+        for name in ("a1", "a2", "a3"):
+            follow_service.follow_user(db, _create_user(db, name), target)
+
+        first = follow_service.get_followers_page(db, target, limit=2)
+        assert [u["username"] for u in first["items"]] == ["a3", "a2"]
+        second = follow_service.get_followers_page(db, target, limit=2, cursor=first["next_cursor"])
+        assert [u["username"] for u in second["items"]] == ["a1"]
+        assert second["next_cursor"] is None
+
 
 class TestNotificationService:
     def test_count_unread(self, db: sqlite3.Connection) -> None:
@@ -160,10 +293,51 @@ class TestNotificationService:
         follow_service.follow_user(db, uid1, uid2)
         follow_service.follow_user(db, uid3, uid2)
 
-        assert notification_service.count_unread(db, uid2) == 2
+        # Both follows coalesce into one notification
+        notifs = notification_service.list_notifications(db, uid2)
+        assert [(n["type"], n["actor_count"]) for n in notifs] == [("follow", 2)]
+        assert notification_service.count_unread(db, uid2) == 1
         notification_service.mark_all_read(db, uid2)
         assert notification_service.count_unread(db, uid2) == 0
 
+    def test_follow_notifications_coalesce(self, db: sqlite3.Connection) -> None:
+        target = _create_user(db, "target")
+        for name in ("alice", "bob", "carol", "dave"):
+            follow_service.follow_user(db, _create_user(db, name), target)
+
+        notifs = notification_service.list_notifications(db, target)
+        assert len(notifs) == 1
+        assert notifs[0]["title"] == "Dave, Carol and 2 others started following you"
+        assert notifs[0]["actor_count"] == 4
+        assert notification_service.count_unread(db, target) == 1
+
+        # Once read, the next follow starts a new notification
+        notification_service.mark_all_read(db, target)
+        follow_service.follow_user(db, _create_user(db, "erin"), target)
+        notifs = notification_service.list_notifications(db, target)
+        assert [n["title"] for n in notifs][0] == "Erin started following you"
+        assert notification_service.count_unread(db, target) == 1
+
+    def test_prune_read_notifications(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        notification_service.notify_many(db, [uid2], type="announcement", title="Old, read")
+        notification_service.notify_many(db, [uid2], type="announcement", title="Old, unread")
+        notification_service.notify_many(db, [uid2], type="announcement", title="New, read")
+        db.execute("UPDATE notifications SET created_at = datetime('now', '-60 days')")
+        notification_service.notify_many(db, [uid2], type="announcement", title="Fresh")
+        db.execute(
+            "UPDATE notifications SET is_read = 1 WHERE title IN ('Old, read', 'New, read')"
+        )
+        db.execute("UPDATE notifications SET created_at = datetime('now') WHERE title = 'New, read'")
+        follow_service.follow_user(db, uid1, uid2)
+
+        result = notification_service.prune(db, read_ttl_days=30, batch_size=1)
+        assert result["notifications"] == 1
+        titles = {n["title"] for n in notification_service.list_notifications(db, uid2)}
+        assert "Old, read" not in titles
+        assert {"Old, unread", "New, read", "Fresh"} <= titles
+
 
 class TestUserService:
     def test_get_profile(self, db: sqlite3.Connection) -> None:
@@ -178,9 +352,62 @@ class TestUserService:
         assert result["display_name"] == "New Name"
         assert result["bio"] == "Adventurer"
 
+    def test_profile_update_refreshes_author_fields(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        post_service.create_post(db, author_id=uid, content="Before")
+        user_service.update_profile(db, uid, display_name="Renamed", avatar="/a.png")
+        post = post_service.create_post(db, author_id=uid, content="After")
+        assert post["author"]["display_name"] == "Renamed"
+        assert post["author"]["avatar"] == "/a.png"
+        assert post_service.get_post(db, post["id"]) == post
+
+    def test_rolled_back_user_not_cached(self, db: sqlite3.Connection) -> None:
+        with pytest.raises(RuntimeError), transaction(db):
+            ghost = _create_user(db, "ghost")
+            raise RuntimeError
+        # Another worker takes the rolled-back rowid
+        uid = db.execute(
+            """INSERT INTO users (username, email, display_name)
+               VALUES ('real', 'real@test.com', 'Real') RETURNING id"""
+        ).fetchone()["id"]
+        assert uid == ghost
+        assert user_repo.get_summary(db, uid)["username"] == "real"
+
     def test_search_users(self, db: sqlite3.Connection) -> None:
         _create_user(db, "gandalf")
         _create_user(db, "aragorn")
         results = user_service.search_users(db, "gan")
         assert len(results) == 1
         assert results[0]["username"] == "gandalf"
+
+    def test_complete_users(self, db: sqlite3.Connection) -> None:
+        gandalf = _create_user(db, "gandalf")
+        galadriel = _create_user(db, "galadriel")
+        fan = _create_user(db, "fan")
+        follow_service.follow_user(db, fan, galadriel)
+        user_repo.load_completion_index(db)
+
+        results = user_service.complete_users(db, "ga")
+        assert [u["id"] for u in results] == [galadriel, gandalf]
+        assert results[0]["followers_count"] == 1
+
+    def test_complete_users_stays_fresh(self, db: sqlite3.Connection) -> None:
+        assert user_service.complete_users(db, "mith") == []
+        uid = _create_user(db, "gandalf")
+        user_service.update_profile(db, uid, display_name="Mithrandir")
+        assert [u["id"] for u in user_service.complete_users(db, "mith")] == [uid]
+
+    def test_complete_users_picks_up_other_writers(self, db: sqlite3.Connection) -> None:
+        user_service.complete_users(db, "x")
+        # As another worker process would: straight to the table, bypassing this index
+        db.execute(
+            """INSERT INTO users (username, email, display_name)
+               VALUES ('radagast', 'r@test.com', 'Radagast')"""
+        )
+        user_repo.configure_completion(refresh_seconds=0, reload_seconds=600)
+        try:
+            assert [u["username"] for u in user_service.complete_users(db, "rad")] == [
+                "radagast"
+            ]
+        finally:
+            user_repo.configure_completion(refresh_seconds=5, reload_seconds=600)
@@ -0,0 +1,107 @@
+"""Integration tests for serving the public timeline from the ring buffer."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from goh.cache.timeline import TimelineBuffer, configure_timeline_buffer
+from goh.observability.metrics import metrics
+from goh.repositories import post_repo, user_repo
+from goh.services import post_service, user_service
+
+
+def _create_user(db: sqlite3.Connection, username: str = "bard") -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    return user.id
+
+
+def _install(capacity: int = 5, **kwargs: object) -> TimelineBuffer:
+    kwargs = {"refresh_seconds": 0.0, "verify": True, **kwargs}
+    buffer = TimelineBuffer(capacity, **kwargs)  # type: ignore[arg-type]
+    configure_timeline_buffer(buffer)
+    return buffer
+
+
+def _ids(posts: list[dict]) -> list[int]:
+    return [p["id"] for p in posts]
+
+
+class TestTimelineBuffer:
+    def test_pages_served_from_buffer(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        posts = [post_service.create_post(db, author_id=uid, content=f"#{i}") for i in range(8)]
+        _install(capacity=5)
+
+        assert _ids(post_service.get_timeline(db, limit=3)) == _ids(posts[::-1][:3])
+        page = post_service.get_timeline_page(db, limit=2)
+        page = post_service.get_timeline_page(db, limit=2, cursor=page["next_cursor"])
+        assert _ids(page["items"]) == _ids(posts[::-1][2:4])
+        assert metrics.get("timeline.buffer.hit") == 3
+
+        # Past the buffered posts: SQL
+        assert len(post_service.get_timeline(db, limit=3, offset=4)) == 3
+        assert metrics.get("timeline.buffer.miss") == 1
+
+    def test_local_create_and_delete(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        buffer = _install(refresh_seconds=3600)
+        post_service.get_timeline(db)
+        post = post_service.create_post(db, author_id=uid, content="Fresh")
+        assert _ids(post_service.get_timeline(db)) == [post["id"]]
+        post_service.delete_post(db, post["id"], uid)
+        assert post_service.get_timeline(db) == []
+        assert len(buffer) == 0
+
+    def test_rolled_back_create_is_not_buffered(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        buffer = _install(refresh_seconds=3600)
+        post_service.get_timeline(db)
+        with pytest.raises(sqlite3.IntegrityError):
+            post_service.create_post(db, author_id=uid + 100, content="Orphan")
+        assert len(buffer) == 0
+
+    def test_picks_up_other_workers(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        _install()
+        post_service.get_timeline(db)
+        # As another worker process would: straight to the table, bypassing this buffer
+        first = post_repo.create(db, author_id=uid, content="Elsewhere")
+        second = post_repo.create(db, author_id=uid, content="Again")
+        assert _ids(post_service.get_timeline(db)) == [second.id, first.id]
+        post_repo.delete(db, first.id)
+        assert _ids(post_service.get_timeline(db)) == [second.id]
+
+    def test_reload_picks_up_profile_edits(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        post_service.create_post(db, author_id=uid, content="Hi")
+        _install(reload_seconds=0.0)
+        post_service.get_timeline(db)
+        user_service.update_profile(db, uid, display_name="Renamed")
+        assert post_service.get_timeline(db)[0]["author"]["display_name"] == "Renamed"
+
+    def test_profile_edit_patches_buffered_posts(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        other = _create_user(db, "rogue")
+        post_service.create_post(db, author_id=uid, content="Hi")
+        post_service.create_post(db, author_id=other, content="Yo")
+        _install(refresh_seconds=3600)
+        before = post_service.get_timeline(db)
+        user_service.update_profile(db, uid, display_name="Renamed", avatar="new.png")
+        # verify=True: the patched answer must match SQL
+        after = post_service.get_timeline(db)
+        assert after[1]["author"] == {"username": "bard", "display_name": "Renamed", "avatar": "new.png"}
+        assert after[0] is before[0]
+        assert before[1]["author"]["display_name"] == "Bard"
+
+    def test_verify_reports_drift(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        buffer = _install(refresh_seconds=3600)
+        post_service.get_timeline(db)
+        buffer.add({"id": 999, "created_at": "2999-01-01", "author_id": uid})
+        with pytest.raises(AssertionError, match="out of sync"):
+            post_service.get_timeline(db)
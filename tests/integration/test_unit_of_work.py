@@ -0,0 +1,135 @@
+"""Integration tests for unit-of-work transactions — one commit per service operation."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from goh.db.transaction import transaction
+from goh.jobs.durable import configure_jobs
+from goh.repositories import audit_repo, post_repo, user_repo
+from goh.services import (
+    auth_service,
+    campaign_service,
+    event_service,
+    follow_service,
+    notification_service,
+    post_service,
+)
+
+
+def _create_user(db: sqlite3.Connection, username: str = "testuser") -> int:
+    user = user_repo.create(
+        db, username=username, email=f"{username}@test.com",
+        password_hash="fakehash", display_name=username.title(),
+    )
+    db.commit()
+    return user.id
+
+
+@contextmanager
+def _count_commits(db: sqlite3.Connection) -> Iterator[list[str]]:
+    commits: list[str] = []
+    db.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == "COMMIT" else None)
+    try:
+        yield commits
+    finally:
+        db.set_trace_callback(None)
+
+
+class TestSingleCommit:
+    def test_create_post(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        with _count_commits(db) as commits:
+            post_service.create_post(db, author_id=uid, content="One fsync")
+        assert len(commits) == 1
+
+    def test_follow_user(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        post_service.create_post(db, author_id=uid2, content="Backfilled")
+        configure_jobs(run_locally=False)  # the follow notification is a separate job
+        with _count_commits(db) as commits:
+            follow_service.follow_user(db, uid1, uid2)
+        assert len(commits) == 1
+
+    def test_unfollow_user(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        follow_service.follow_user(db, uid1, uid2)
+        with _count_commits(db) as commits:
+            follow_service.unfollow_user(db, uid1, uid2)
+        assert len(commits) == 1
+
+    def test_register(self, db: sqlite3.Connection) -> None:
+        with _count_commits(db) as commits:
+            auth_service.register(
+                db, username="newbie", email="newbie@test.com", password="password123",
+            )
+        assert len(commits) == 1
+
+    def test_create_campaign(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        with _count_commits(db) as commits:
+            campaign_service.create_campaign(db, dm_id=uid, name="Curse of Strahd")
+        assert len(commits) == 1
+
+    def test_rsvp_event(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        event = event_service.create_event(
+            db, organizer_id=uid, title="One-shot", start_time="2030-01-01T18:00:00",
+        )
+        with _count_commits(db) as commits:
+            event_service.rsvp_event(db, event["id"], uid)
+        assert len(commits) == 1
+
+    def test_mark_all_read(self, db: sqlite3.Connection) -> None:
+        uid1 = _create_user(db, "alice")
+        uid2 = _create_user(db, "bob")
+        follow_service.follow_user(db, uid1, uid2)
+        with _count_commits(db) as commits:
+            notification_service.mark_all_read(db, uid2)
+        assert len(commits) == 1
+
+    def test_reads_do_not_commit(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        post_service.create_post(db, author_id=uid, content="Hello")
+        with _count_commits(db) as commits:
+            post_service.get_timeline(db)
+            post_service.get_feed(db, uid)
+        assert commits == []
+
+
+class TestRollback:
+    def test_failure_rolls_back_whole_operation(
+        self, db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        uid = _create_user(db)
+
+        def boom(*args: object, **kwargs: object) -> None:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(audit_repo, "log_action", boom)
+        with pytest.raises(sqlite3.OperationalError):
+            post_service.create_post(db, author_id=uid, content="Never lands")
+        assert post_repo.timeline(db) == []
+        row = db.execute("SELECT COUNT(*) as cnt FROM feed_items").fetchone()
+        assert row["cnt"] == 0
+
+    def test_nested_joins_outer(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        with _count_commits(db) as commits, transaction(db):
+            post_service.create_post(db, author_id=uid, content="First")
+            post_service.create_post(db, author_id=uid, content="Second")
+        assert len(commits) == 1
+        assert len(post_repo.timeline(db)) == 2
+
+    def test_nested_failure_rolls_back_outer(self, db: sqlite3.Connection) -> None:
+        uid = _create_user(db)
+        with pytest.raises(RuntimeError), transaction(db):
+            post_service.create_post(db, author_id=uid, content="Lost")
+            raise RuntimeError("abort")
+        assert post_repo.timeline(db) == []
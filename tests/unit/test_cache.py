@@ -0,0 +1,73 @@
+"""Tests for the cache backends."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from goh.cache.backends import MemoryCache, NullCache, SqliteCache, create_cache
+
+
+class TestMemoryCache:
+    def test_get_set_delete(self) -> None:
+        cache = MemoryCache()
+        cache.set("post:1", '{"id": 1}', ttl=60)
+        assert cache.get("post:1") == '{"id": 1}'
+        cache.delete("post:1")
+        assert cache.get("post:1") is None
+
+    def test_expiry(self) -> None:
+        cache = MemoryCache()
+        cache.set("post:1", "x", ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("post:1") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", "1", ttl=60)
+        cache.set("b", "2", ttl=60)
+        cache.get("a")
+        cache.set("c", "3", ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+
+class TestSqliteCache:
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        worker_a = SqliteCache(tmp_path / "cache.db")
+        worker_b = SqliteCache(tmp_path / "cache.db")
+        worker_a.set("event:1", "x", ttl=60)
+        assert worker_b.get("event:1") == "x"
+        worker_b.delete("event:1")
+        assert worker_a.get("event:1") is None
+        worker_a.close()
+        worker_b.close()
+
+    def test_expiry_and_purge(self, tmp_path: Path) -> None:
+        cache = SqliteCache(tmp_path / "cache.db", max_entries=2, purge_every=4)
+        cache.set("old", "x", ttl=-1)
+        assert cache.get("old") is None
+        cache.set("a", "1", ttl=60)
+        cache.set("b", "2", ttl=120)
+        cache.set("c", "3", ttl=180)
+        (count,) = cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        assert count == 2
+        assert cache.get("a") is None
+        cache.close()
+
+
+class TestCreateCache:
+    def test_backends(self, tmp_path: Path) -> None:
+        assert isinstance(create_cache("none"), NullCache)
+        assert isinstance(create_cache("memory"), MemoryCache)
+        sqlite_cache = create_cache("sqlite", path=tmp_path / "c.db")
+        assert isinstance(sqlite_cache, SqliteCache)
+        sqlite_cache.close()
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="redis"):
+            create_cache("redis")
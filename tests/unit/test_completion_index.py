@@ -0,0 +1,71 @@
+"""Tests for the in-memory @-mention completion index."""
+
+from __future__ import annotations
+
+from goh.cache.completion import CompletionIndex, completion_keys
+
+
+def _index(*rows: tuple, scan_limit: int = 256) -> CompletionIndex:
+    index = CompletionIndex(scan_limit=scan_limit)
+    index.load(rows)
+    return index
+
+
+def _usernames(results: list[dict]) -> list[str]:
+    return [r["username"] for r in results]
+
+
+class TestCompletionKeys:
+    def test_username_display_name_and_later_words(self) -> None:
+        assert completion_keys("gandalf", "Gandalf the Grey") == [
+            "gandalf", "gandalf the grey", "grey", "the",
+        ]
+
+
+class TestCompletionIndex:
+    def test_prefix_match_ranked_by_followers(self) -> None:
+        index = _index(
+            (1, "gandalf", "Gandalf", None, 5),
+            (2, "galadriel", "Galadriel", None, 50),
+            (3, "gimli", "Gimli", None, 500),
+            (4, "aragorn", "Aragorn", None, 1000),
+        )
+        assert _usernames(index.complete("ga")) == ["galadriel", "gandalf"]
+        assert _usernames(index.complete("G")) == ["gimli", "galadriel", "gandalf"]
+        assert index.complete("x") == []
+        assert index.complete("  ") == []
+
+    def test_matches_display_name_words(self) -> None:
+        index = _index((1, "strider", "Aragorn Elessar", "/a.png", 3))
+        assert index.complete("eless") == [{
+            "id": 1, "username": "strider", "display_name": "Aragorn Elessar",
+            "avatar": "/a.png", "followers_count": 3,
+        }]
+
+    def test_each_user_once(self) -> None:
+        index = _index((1, "gandalf", "Gandalf", None, 0))
+        assert len(index.complete("gan")) == 1
+
+    def test_limit(self) -> None:
+        index = _index(*((i, f"user{i}", f"User {i}", None, i) for i in range(30)))
+        assert _usernames(index.complete("user", limit=3)) == ["user29", "user28", "user27"]
+        assert len(index.complete("user", limit=100)) == 20
+
+    def test_upsert_replaces_keys(self) -> None:
+        index = _index((1, "strider", "Strider", None, 0))
+        index.update(1, display_name="Elessar")
+        assert _usernames(index.complete("eless")) == ["strider"]
+        assert index.complete("strider")[0]["display_name"] == "Elessar"
+        # Only the username key still starts with "str"
+        assert len(index.complete("str")) == 1
+
+    def test_update_unknown_user_is_ignored(self) -> None:
+        index = _index()
+        index.update(1, display_name="Nobody")
+        assert len(index) == 0
+
+    def test_memoised_prefix_sees_new_users(self) -> None:
+        index = _index(*((i, f"user{i}", "U", None, 1) for i in range(10)), scan_limit=2)
+        assert index.complete("us", limit=1)[0]["followers_count"] == 1
+        index.upsert((99, "usurper", "Usurper", None, 100))
+        assert _usernames(index.complete("us", limit=1)) == ["usurper"]
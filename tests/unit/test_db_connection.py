@@ -0,0 +1,90 @@
+"""Tests for connection PRAGMA profiles and PRAGMA optimize."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from goh.db import connection
+from goh.db.connection import (
+    PROFILES,
+    configure_profile,
+    get_connection,
+    get_readonly_connection,
+    maybe_optimize,
+)
+from goh.db.writer import Writer
+
+
+@pytest.fixture(autouse=True)
+def _restore_profile() -> Iterator[None]:
+    previous = connection.get_profile()
+    yield
+    configure_profile(previous)
+
+
+def _pragma(conn, name: str):  # type: ignore[no-untyped-def]
+    return next(iter(conn.execute(f"PRAGMA {name}").fetchone().values()))
+
+
+class TestProfiles:
+    def test_balanced_profile_applies_to_writers_and_readers(self, tmp_path: Path) -> None:
+        configure_profile(PROFILES["balanced"])
+        writer = get_connection(tmp_path / "p.db")
+        reader = get_readonly_connection(tmp_path / "p.db")
+        for conn in (writer, reader):
+            assert _pragma(conn, "synchronous") == 1
+            assert _pragma(conn, "cache_size") == -16_384
+            assert _pragma(conn, "temp_store") == 2
+        assert _pragma(writer, "mmap_size") == 128 * 1024 * 1024
+        writer.close()
+        reader.close()
+
+    def test_default_profile_keeps_sqlite_defaults(self, tmp_path: Path) -> None:
+        configure_profile(PROFILES["default"])
+        conn = get_connection(tmp_path / "d.db")
+        assert _pragma(conn, "synchronous") == 2
+        assert _pragma(conn, "mmap_size") == 0
+        assert conn.optimize_on_close is False
+        conn.close()
+
+
+class TestOptimize:
+    def _trace(self, conn) -> list[str]:  # type: ignore[no-untyped-def]
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        return statements
+
+    def test_runs_on_close(self, tmp_path: Path) -> None:
+        configure_profile(PROFILES["balanced"])
+        conn = get_connection(tmp_path / "o.db")
+        statements = self._trace(conn)
+        conn.close()
+        assert statements == ["PRAGMA optimize"]
+
+    def test_long_lived_writer_optimizes_once_per_interval(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        configure_profile(PROFILES["balanced"])
+        writer = Writer(tmp_path / "w.db")
+        with writer.connection() as conn:
+            statements = self._trace(conn)
+        assert "PRAGMA optimize" not in statements
+
+        monkeypatch.setattr(connection, "OPTIMIZE_INTERVAL_SECONDS", 0.0)
+        with writer.connection():
+            pass
+        assert statements.count("PRAGMA optimize") == 1
+        conn.set_trace_callback(None)
+        writer.close()
+
+    def test_readers_never_optimize(self, tmp_path: Path) -> None:
+        configure_profile(PROFILES["balanced"])
+        get_connection(tmp_path / "r.db").close()
+        reader = get_readonly_connection(tmp_path / "r.db")
+        statements = self._trace(reader)
+        maybe_optimize(reader)
+        reader.close()
+        assert statements == []
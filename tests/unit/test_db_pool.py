@@ -0,0 +1,98 @@
+"""Tests for the SQLite connection pool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from goh.db.pool import ConnectionPool
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+
+@pytest.fixture()
+def pool(tmp_path: Path) -> ConnectionPool:
+    p = ConnectionPool(tmp_path / "pool.db", size=2, timeout=0.05)
+    yield p
+    p.close()
+
+
+class TestConnectionPool:
+    def test_reuses_connections(self, pool: ConnectionPool) -> None:
+        conn = pool.acquire()
+        pool.release(conn)
+        assert pool.acquire() is conn
+        assert pool.created == 1
+
+    def test_pragmas_applied_once(self, pool: ConnectionPool) -> None:
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()["journal_mode"] == "wal"
+            assert conn.execute("PRAGMA foreign_keys").fetchone()["foreign_keys"] == 1
+
+    def test_exhausted_pool_raises(self, pool: ConnectionPool) -> None:
+        first, second = pool.acquire(), pool.acquire()
+        with pytest.raises(ServiceUnavailableError):
+            pool.acquire()
+        assert metrics.get("db.pool.timeout") == 1
+        pool.release(first)
+        pool.release(second)
+
+    def test_waiter_gets_released_connection(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "pool.db", size=1, timeout=2.0)
+        conn = pool.acquire()
+        got: list = []
+        waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+        waiter.start()
+        pool.release(conn)
+        waiter.join(timeout=2.0)
+        assert got == [conn]
+        pool.close()
+
+    def test_replaces_broken_connection(self, pool: ConnectionPool) -> None:
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close()
+        fresh = pool.acquire()
+        assert fresh is not conn
+        assert metrics.get("db.pool.replaced") == 1
+        assert pool.created == 1
+        pool.release(fresh)
+
+    def test_waiter_gets_replacement_for_discarded_connection(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "pool.db", size=1, timeout=2.0)
+        conn = pool.acquire()
+        got: list = []
+        waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+        waiter.start()
+        time.sleep(0.05)  # let the waiter block on the idle queue
+        conn.close()  # fails the rollback on release, so it is discarded
+        start = time.monotonic()
+        pool.release(conn)
+        waiter.join(timeout=2.0)
+        assert time.monotonic() - start < 1.0
+        assert len(got) == 1 and got[0] is not conn
+        assert pool.created == 1
+        assert metrics.get("db.pool.timeout") == 0
+        pool.release(got[0])
+        pool.close()
+
+    def test_release_rolls_back(self, pool: ConnectionPool) -> None:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+            conn.execute("INSERT INTO t VALUES (1)")
+            assert conn.in_transaction
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 0
+
+    def test_utilisation_metrics(self, pool: ConnectionPool) -> None:
+        conn = pool.acquire()
+        snap = metrics.snapshot()
+        assert snap["db.pool.in_use"] == 1
+        assert snap["db.pool.utilisation"] == 0.5
+        assert snap["db.pool.wait.count"] == 1
+        pool.release(conn)
+        assert metrics.get_gauge("db.pool.in_use") == 0
@@ -0,0 +1,140 @@
+"""Tests for the serialized writer and read-only connections."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from goh.db.connection import get_connection, get_readonly_connection
+from goh.db.transaction import transaction
+from goh.db.writer import Writer
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "rw.db"
+    conn = get_connection(path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestReadonlyConnection:
+    def test_reads(self, db_path: Path) -> None:
+        conn = get_readonly_connection(db_path)
+        assert conn.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 0
+
+    def test_rejects_writes(self, db_path: Path) -> None:
+        conn = get_readonly_connection(db_path)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO t VALUES (1)")
+
+
+class TestWriter:
+    def test_single_connection(self, db_path: Path) -> None:
+        writer = Writer(db_path)
+        with writer.connection() as first:
+            first.execute("INSERT INTO t VALUES (1)")
+            first.commit()
+        with writer.connection() as second:
+            assert second is first
+        writer.close()
+
+    def test_serializes_writers(self, db_path: Path) -> None:
+        writer = Writer(db_path)
+        conn = writer.acquire()
+        acquired = threading.Event()
+
+        def contender() -> None:
+            with writer.connection():
+                acquired.set()
+
+        thread = threading.Thread(target=contender)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        writer.release(conn)
+        thread.join(timeout=2.0)
+        assert acquired.is_set()
+        assert metrics.snapshot()["db.writer.lock_wait.max_ms"] >= 40
+        writer.close()
+
+    def test_timeout(self, db_path: Path) -> None:
+        writer = Writer(db_path, timeout=0.01)
+        conn = writer.acquire()
+        errors: list[Exception] = []
+
+        def contender() -> None:
+            try:
+                writer.acquire()
+            except ServiceUnavailableError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=contender)
+        thread.start()
+        thread.join(timeout=2.0)
+        assert len(errors) == 1
+        assert metrics.get("db.writer.timeout") == 1
+        writer.release(conn)
+        writer.close()
+
+    def test_release_rolls_back(self, db_path: Path) -> None:
+        writer = Writer(db_path)
+        with writer.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+        with writer.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 0
+        writer.close()
+
+    def test_checkout_locks_only_transactions(self, db_path: Path) -> None:
+        writer = Writer(db_path, timeout=0.05)
+        conn = writer.checkout()
+        assert conn.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 0
+        with writer.connection():  # not held by a checked-out connection outside a transaction
+            pass
+
+        errors: list[Exception] = []
+
+        def contender() -> None:
+            try:
+                with writer.connection():
+                    pass
+            except ServiceUnavailableError as e:
+                errors.append(e)
+
+        with transaction(conn):
+            conn.execute("INSERT INTO t VALUES (1)")
+            thread = threading.Thread(target=contender)
+            thread.start()
+            thread.join(timeout=2.0)
+        assert len(errors) == 1
+        with writer.connection() as other:
+            assert other.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 1
+        writer.checkin(conn)
+        assert writer.checkout() is conn
+        writer.close()
+
+    def test_checkin_rolls_back(self, db_path: Path) -> None:
+        writer = Writer(db_path)
+        conn = writer.checkout()
+        conn.execute("INSERT INTO t VALUES (1)")
+        writer.checkin(conn)
+        assert conn.execute("SELECT COUNT(*) as cnt FROM t").fetchone()["cnt"] == 0
+        writer.close()
+
+    def test_idle_connections_are_capped(self, db_path: Path) -> None:
+        writer = Writer(db_path, max_idle=1)
+        burst = [writer.checkout() for _ in range(3)]
+        for conn in burst:
+            writer.checkin(conn)
+        assert writer.checkout() is burst[0]
+        with pytest.raises(sqlite3.ProgrammingError):
+            burst[1].execute("SELECT 1")
+        writer.close()
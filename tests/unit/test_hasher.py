@@ -0,0 +1,57 @@
+"""Tests for the pooled, adaptive password hasher."""
+
+from __future__ import annotations
+
+import pytest
+
+from goh.auth.hasher import PasswordHasher, calibrate_rounds, hash_rounds
+from goh.domain.exceptions import ServiceUnavailableError
+from goh.observability.metrics import metrics
+
+
+class TestInline:
+    def test_hash_and_verify(self) -> None:
+        hasher = PasswordHasher(rounds=4)
+        hashed = hasher.hash("hunter22")
+        assert hash_rounds(hashed) == 4
+        assert hasher.verify("hunter22", hashed)
+        assert not hasher.verify("hunter23", hashed)
+        assert metrics.snapshot()["auth.hasher.verify.count"] == 2
+
+    def test_needs_rehash_on_cost_change(self) -> None:
+        hashed = PasswordHasher(rounds=4).hash("hunter22")
+        assert not PasswordHasher(rounds=4).needs_rehash(hashed)
+        assert PasswordHasher(rounds=5).needs_rehash(hashed)
+
+    def test_never_downgrades(self) -> None:
+        cheap, costly = PasswordHasher(rounds=4), PasswordHasher(rounds=5)
+        upgraded = costly.hash("hunter22")
+        assert not cheap.needs_rehash(upgraded)
+        assert not costly.needs_rehash(upgraded)
+        assert costly.needs_rehash(cheap.hash("hunter22"))
+
+    def test_hash_rounds_of_non_bcrypt(self) -> None:
+        assert hash_rounds("plaintext") is None
+
+    def test_calibrate_never_goes_below_minimum(self) -> None:
+        assert calibrate_rounds(0, minimum=4) == 4
+        assert calibrate_rounds(10_000, minimum=4) > 4
+
+
+class TestPool:
+    def test_hashes_in_worker_process(self) -> None:
+        hasher = PasswordHasher(rounds=4, workers=1)
+        try:
+            hashed = hasher.hash("hunter22")
+            assert hasher.verify("hunter22", hashed)
+            assert hasher.pending == 0
+            assert metrics.get_gauge("auth.hasher.pending") == 0
+        finally:
+            hasher.close()
+
+    def test_sheds_when_queue_is_full(self) -> None:
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=0)
+        with pytest.raises(ServiceUnavailableError):
+            hasher.hash("hunter22")
+        assert metrics.get("auth.hasher.shed") == 1
+        hasher.close()
@@ -0,0 +1,50 @@
+"""Tests for the precompiled entity serializers."""
+
+from __future__ import annotations
+
+import pytest
+
+from goh.domain.entities.character import Character
+from goh.domain.entities.post import Post
+from goh.domain.entities.user import User
+from goh.domain.serializers import compile_serializer
+
+
+class TestCompileSerializer:
+    def test_flat_and_nested(self) -> None:
+        serializer = compile_serializer("Point", {"x": "real", "nested": {"y": "imag"}})
+        assert serializer.one(3 + 4j) == {"x": 3.0, "nested": {"y": 4.0}}
+        assert serializer.many([1j, 2]) == [
+            {"x": 0.0, "nested": {"y": 1.0}},
+            {"x": 2, "nested": {"y": 0}},
+        ]
+
+    def test_from_tuple_follows_shape_order(self) -> None:
+        serializer = compile_serializer("Pair", {"b": "second", "nested": {"a": "first"}, "c": "second"})
+        assert serializer.from_tuple((2, 1)) == {"b": 2, "nested": {"a": 1}, "c": 2}
+
+    def test_rejects_non_attribute(self) -> None:
+        with pytest.raises(ValueError):
+            compile_serializer("Bad", {"x": "a; import os"})
+
+
+class TestEntityShapes:
+    def test_post_matches_tuple_path(self) -> None:
+        values = (1, 2, "Hello", "text", None, "t0", "t1", "alice", "Alice", None)
+        post = Post(*values)
+        assert post.to_dict() == Post.json_from_tuple(values)
+        assert Post.to_dicts([post]) == [post.to_dict()]
+
+    def test_user_private_extends_public(self) -> None:
+        user = User(1, "alice", "alice@test.com", "Alice", email_verified=True)
+        public = user.to_public_dict()
+        assert "email" not in public
+        assert user.to_private_dict() == {
+            **public, "email": "alice@test.com", "email_verified": True, "updated_at": "",
+        }
+
+    def test_character_renames_and_nests(self) -> None:
+        data = Character(1, 2, "Thorin", char_class="Fighter", strength=16).to_dict()
+        assert data["class"] == "Fighter"
+        assert data["ability_scores"]["strength"] == 16
+        assert "char_class" not in data and "strength" not in data
@@ -0,0 +1,87 @@
+"""Tests for the cached settings provider and performance tuning."""
+
+from __future__ import annotations
+
+import os
+import signal
+from collections.abc import Iterator
+from pathlib import Path
+
+import pydantic
+import pytest
+
+from config import settings as settings_module
+from config.settings import Settings, get_settings, install_reload_handler, reload_settings
+from config.tuning import apply_tuning
+from goh.db.connection import get_connection
+from goh.repositories import feed_repo
+
+
+@pytest.fixture(autouse=True)
+def _restore() -> Iterator[None]:
+    handler = signal.getsignal(signal.SIGHUP)
+    yield
+    signal.signal(signal.SIGHUP, handler)
+    settings_module._settings = None
+    apply_tuning(Settings())
+
+
+class TestSettingsProvider:
+    def test_cached(self) -> None:
+        assert get_settings() is get_settings()
+
+    def test_reload_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        first = get_settings()
+        monkeypatch.setenv("GOH_DB_POOL_SIZE", "9")
+        assert get_settings() is first
+        assert reload_settings().db_pool_size == 9
+        assert get_settings().db_pool_size == 9
+
+    def test_invalid_knob_is_rejected(self) -> None:
+        with pytest.raises(pydantic.ValidationError):
+            Settings(GOH_DB_POOL_SIZE=0)
+        with pytest.raises(pydantic.ValidationError):
+            Settings(GOH_SQLITE_SYNCHRONOUS="SOMETIMES")
+
+    @pytest.mark.parametrize("name", [
+        "GOH_AUDIT_FLUSH_INTERVAL_SECONDS",
+        "GOH_NOTIFICATION_STREAM_MAX_SECONDS",
+        "GOH_NOTIFICATION_STREAM_HEARTBEAT_SECONDS",
+        "GOH_NOTIFICATION_RELAY_POLL_SECONDS",
+    ])
+    def test_loop_intervals_must_be_positive(self, name: str) -> None:
+        for value in (0, -1):
+            with pytest.raises(pydantic.ValidationError):
+                Settings(**{name: value})
+
+    def test_sighup_reloads_and_reapplies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        applied: list[Settings] = []
+        get_settings()
+        install_reload_handler(applied.append)
+        monkeypatch.setenv("GOH_FEED_FANOUT_THRESHOLD", "42")
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert get_settings().feed_fanout_threshold == 42
+        assert applied == [get_settings()]
+
+    def test_failed_reload_keeps_previous(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = get_settings()
+        install_reload_handler()
+        monkeypatch.setenv("GOH_DB_POOL_SIZE", "-1")
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert get_settings() is before
+
+
+class TestTuning:
+    def test_applies_connection_pragmas_and_feed_limits(self, tmp_path: Path) -> None:
+        apply_tuning(
+            Settings(
+                GOH_SQLITE_SYNCHRONOUS="NORMAL",
+                GOH_SQLITE_CACHE_SIZE_KIB=8192,
+                GOH_FEED_FANOUT_THRESHOLD=10,
+            )
+        )
+        conn = get_connection(tmp_path / "tuned.db")
+        assert conn.execute("PRAGMA synchronous").fetchone()["synchronous"] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()["cache_size"] == -8192
+        conn.close()
+        assert feed_repo.FANOUT_FOLLOWER_THRESHOLD == 10
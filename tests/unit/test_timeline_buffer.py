@@ -0,0 +1,74 @@
+"""Tests for the public-timeline ring buffer."""
+
+from __future__ import annotations
+
+from goh.cache.timeline import TimelineBuffer
+
+
+def _post(post_id: int, created_at: str = "") -> dict:
+    return {"id": post_id, "created_at": created_at or f"2026-01-01 00:00:{post_id:02d}"}
+
+
+def _ids(posts: list[dict] | None) -> list[int] | None:
+    return None if posts is None else [p["id"] for p in posts]
+
+
+def _buffer(capacity: int, *ids: int) -> TimelineBuffer:
+    buffer = TimelineBuffer(capacity)
+    buffer.load([_post(i) for i in sorted(ids, reverse=True)])
+    return buffer
+
+
+class TestTimelineBuffer:
+    def test_window_newest_first(self) -> None:
+        buffer = _buffer(3, 1, 2, 3)
+        assert _ids(buffer.window(2)) == [3, 2]
+        assert _ids(buffer.window(1, offset=2)) == [1]
+
+    def test_window_past_the_buffer_is_not_served(self) -> None:
+        buffer = _buffer(3, 1, 2, 3)
+        assert not buffer.complete
+        assert buffer.window(2, offset=2) is None
+
+    def test_complete_buffer_serves_everything(self) -> None:
+        buffer = _buffer(10, 1, 2)
+        assert buffer.complete
+        assert _ids(buffer.window(50)) == [2, 1]
+        assert buffer.window(50, offset=5) == []
+
+    def test_merge_evicts_oldest(self) -> None:
+        buffer = _buffer(10, 1, 2)
+        buffer.merge([_post(3), _post(4)])
+        assert _ids(buffer.window(10)) == [4, 3, 2, 1]
+        buffer = _buffer(3, 1, 2, 3)
+        buffer.add(_post(4))
+        assert len(buffer) == 3
+        assert _ids(buffer.window(3)) == [4, 3, 2]
+
+    def test_merge_is_idempotent(self) -> None:
+        buffer = _buffer(10, 1, 2)
+        buffer.merge([_post(2), _post(3), _post(3)])
+        assert _ids(buffer.window(10)) == [3, 2, 1]
+
+    def test_merge_skips_posts_older_than_a_full_buffer(self) -> None:
+        buffer = _buffer(2, 5, 6)
+        buffer.add(_post(1))
+        assert _ids(buffer.window(2)) == [6, 5]
+
+    def test_remove(self) -> None:
+        buffer = _buffer(10, 1, 2, 3)
+        buffer.remove(2)
+        buffer.remove(99)
+        assert _ids(buffer.window(10)) == [3, 1]
+
+    def test_after_cursor(self) -> None:
+        buffer = _buffer(5, 1, 2, 3, 4, 5)
+        assert _ids(buffer.after(None, 2)) == [5, 4]
+        cursor = ("2026-01-01 00:00:04", 4)
+        assert _ids(buffer.after(cursor, 2)) == [3, 2]
+        assert buffer.after(cursor, 4) is None
+
+    def test_same_second_orders_by_id(self) -> None:
+        buffer = TimelineBuffer(10)
+        buffer.merge([_post(1, "2026-01-01"), _post(3, "2026-01-01"), _post(2, "2026-01-01")])
+        assert _ids(buffer.window(3)) == [3, 2, 1]
@@ -0,0 +1,69 @@
+"""Tests for the verified access-token cache."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from goh.auth.tokens import TokenVerifier
+from goh.domain.exceptions import InvalidTokenError, TokenExpiredError
+from goh.observability.metrics import metrics
+
+SECRET = "test-jwt-secret-minimum-32-chars!"
+
+
+def _token(sub: int = 1, *, expires_in: float = 600) -> str:
+    now = datetime.now(timezone.utc)
+    payload = {
+        "sub": str(sub),
+        "username": f"user{sub}",
+        "role": "player",
+        "iat": now,
+        "exp": now + timedelta(seconds=expires_in),
+        "type": "access",
+    }
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+class TestTokenVerifier:
+    def test_caches_verified_payload(self) -> None:
+        verifier = TokenVerifier(SECRET)
+        token = _token()
+        first = verifier.verify(token)
+        assert verifier.verify(token) is first
+        assert first["sub"] == 1
+        assert metrics.get("auth.token_cache.miss") == 1
+        assert metrics.get("auth.token_cache.hit") == 1
+
+    def test_cached_token_still_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        verifier = TokenVerifier(SECRET)
+        token = _token(expires_in=60)
+        verifier.verify(token)
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        with pytest.raises(TokenExpiredError):
+            verifier.verify(token)
+        assert len(verifier) == 0
+
+    def test_invalid_tokens_are_not_cached(self) -> None:
+        verifier = TokenVerifier(SECRET)
+        with pytest.raises(InvalidTokenError):
+            verifier.verify(_token()[:-2] + "xx")
+        with pytest.raises(InvalidTokenError):
+            TokenVerifier("another-secret-of-at-least-32-chars").verify(_token())
+        assert len(verifier) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        verifier = TokenVerifier(SECRET, max_entries=2)
+        a, b, c = _token(1), _token(2), _token(3)
+        verifier.verify(a)
+        verifier.verify(b)
+        verifier.verify(a)
+        verifier.verify(c)
+        assert len(verifier) == 2
+        verifier.verify(a)
+        verifier.verify(b)
+        assert metrics.get("auth.token_cache.miss") == 4